@@ -2,7 +2,6 @@
 from fastapi import APIRouter
 from datetime import datetime
 from sqlalchemy import text
-import httpx
 import structlog
 
 logger = structlog.get_logger()
@@ -39,6 +38,7 @@ async def health_status():
 async def test_ollama():
     """Test Ollama connectivity and model response."""
     from ...core.config import get_settings
+    from ...core.http_clients import OLLAMA, get_http_clients
     
     settings = get_settings()
     ollama_url = f"{settings.ollama_host}/api/generate"
@@ -50,28 +50,28 @@ async def test_ollama():
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(ollama_url, json=test_prompt)
+        client = get_http_clients().get_async_client(OLLAMA)
+        response = await client.post(ollama_url, json=test_prompt, timeout=30.0)
+        
+        if response.status_code == 200:
+            result = response.json()
+            return {
+                "status": "success",
+                "ollama_url": ollama_url,
+                "model": settings.ollama_model,
+                "response": result.get("response", ""),
+                "response_time": result.get("total_duration", 0),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        else:
+            return {
+                "status": "error",
+                "ollama_url": ollama_url,
+                "model": settings.ollama_model,
+                "error": f"HTTP {response.status_code}: {response.text}",
+                "timestamp": datetime.utcnow().isoformat()
+            }
             
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "ollama_url": ollama_url,
-                    "model": settings.ollama_model,
-                    "response": result.get("response", ""),
-                    "response_time": result.get("total_duration", 0),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "status": "error",
-                    "ollama_url": ollama_url,
-                    "model": settings.ollama_model,
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
     except Exception as e:
         logger.error(f"Ollama test failed: {e}")
         return {
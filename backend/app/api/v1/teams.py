@@ -14,7 +14,9 @@ from pydantic import BaseModel, Field, field_serializer, field_validator
 from ...core.database import get_db_dependency
 from ...core.auth import get_current_user
 from ...services import TeamService
-from ...models import ExpertiseLevel
+from ...services.crew_blueprints import get_blueprint_cache
+from ...services.execution_estimator import estimate_execution
+from ...models import ExpertiseLevel, TeamStatus
 from ...models.role import Role
 import structlog
 
@@ -42,7 +44,7 @@ class RoleCreate(BaseModel):
     expertise: ExpertiseLevel
     llm_model: str = Field(default="gpt-3.5-turbo", max_length=50)
     llm_config: Optional[Dict[str, Any]] = None
-    agent_config: Optional[Dict[str, Any]] = None
+    agent_config: Optional[Dict[str, Any]] = None  # Also "depends_on": [role ids/titles] or "independent": true
     is_active: bool = True
     
     @field_validator('title')
@@ -258,6 +260,12 @@ class ExecutionResponse(BaseModel):
     team_execution_id: Optional[int]
 
 
+class ExecutionQueuedResponse(BaseModel):
+    team_execution_id: int
+    status: str
+    status_url: str
+
+
 # API endpoints
 @router.post("/", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
 def create_team(
@@ -449,15 +457,18 @@ def delete_team(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.post("/{team_id}/execute", response_model=ExecutionResponse)
+@router.post("/{team_id}/execute", response_model=ExecutionQueuedResponse, status_code=status.HTTP_202_ACCEPTED)
 def execute_team(
     team_id: int,
     execution_data: Optional[TeamExecute] = None,
     db: Session = Depends(get_db_dependency),
     current_user = Depends(get_current_user)
-) -> ExecutionResponse:
+) -> ExecutionQueuedResponse:
     """
-    Execute team workflow.
+    Queue a team workflow execution.
+    
+    The crew runs on a background worker; poll the returned status URL
+    for progress and the result.
     
     Args:
         team_id: Team ID
@@ -466,23 +477,25 @@ def execute_team(
         current_user: Authenticated user
         
     Returns:
-        Execution result
+        Queued execution ID and status URL
     """
     try:
         # Get team and check ownership
-        team = TeamService.get_team_by_id(team_id, db)
+        team = TeamService.get_team_with_roles(team_id, db)
         if not team:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
         
         if team.auth_owner_id != current_user:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
         
-        # Execute team workflow
+        # Queue team workflow
         inputs = execution_data.inputs if execution_data else {}
         
-        result = TeamService.execute_team(team_id, inputs, db)
+        execution = TeamService.enqueue_execution(team_id, inputs, db)
+        if not execution:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
         
-        return ExecutionResponse.model_validate(result)
+        return _queued_response(team_id, execution)
         
     except HTTPException:
         raise
@@ -491,6 +504,107 @@ def execute_team(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
+@router.post("/{team_id}/execute/estimate")
+def estimate_team_execution(
+    team_id: int,
+    execution_data: Optional[TeamExecute] = None,
+    db: Session = Depends(get_db_dependency),
+    current_user = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Estimate the cost and latency of a team execution without running it.
+    
+    Routes every task as an execution would, without calling any LLM
+    provider, and projects the provider mix, token counts, cost range and
+    latency range against the team's remaining monthly budget.
+    
+    Args:
+        team_id: Team ID
+        execution_data: Optional execution parameters
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Per-task and total estimates
+    """
+    try:
+        # Get team and check ownership
+        team = TeamService.get_team_with_roles(team_id, db)
+        if not team:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+        
+        if team.auth_owner_id != current_user:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+        
+        inputs = execution_data.inputs if execution_data else {}
+        
+        return estimate_execution(team, db, inputs)
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # No active roles or invalid task dependencies
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to estimate team execution", team_id=team_id, error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.post("/{team_id}/executions/{execution_id}/resume", response_model=ExecutionQueuedResponse, status_code=status.HTTP_202_ACCEPTED)
+def resume_execution(
+    team_id: int,
+    execution_id: int,
+    db: Session = Depends(get_db_dependency),
+    current_user = Depends(get_current_user)
+) -> ExecutionQueuedResponse:
+    """
+    Resume a failed execution from its last checkpoint.
+    
+    Tasks that completed in the earlier run are not executed (or paid for)
+    again; the crew continues from the first incomplete task on a
+    background worker.
+    
+    Args:
+        team_id: Team ID
+        execution_id: Failed team execution ID
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Queued execution ID and status URL
+    """
+    try:
+        # Get team and check ownership
+        team = TeamService.get_team_with_roles(team_id, db)
+        if not team:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+        
+        if team.auth_owner_id != current_user:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+        
+        execution = TeamService.resume_execution(team_id, execution_id, db)
+        if execution is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Execution not found")
+        
+        return _queued_response(team_id, execution)
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to resume execution", team_id=team_id, execution_id=execution_id, error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+def _queued_response(team_id: int, execution) -> ExecutionQueuedResponse:
+    return ExecutionQueuedResponse(
+        team_execution_id=execution.id,
+        status=execution.status,
+        status_url=f"/api/v1/teams/{team_id}/execute/{execution.id}/status"
+    )
+
+
 @router.get("/{team_id}/execute/{execution_id}/status")
 def get_execution_status(
     team_id: int,
@@ -501,10 +615,13 @@ def get_execution_status(
     """Get real-time status of a team execution for progress updates."""
     try:
         # Verify team ownership
-        team = TeamService.get_team_by_id(db, team_id, current_user)
+        team = TeamService.get_team(team_id, db)
         if not team:
             raise HTTPException(status_code=404, detail="Team not found")
         
+        if team.auth_owner_id != current_user:
+            raise HTTPException(status_code=403, detail="Access denied")
+        
         # Find the execution
         from ...models.execution import TeamExecution
         execution = db.query(TeamExecution).filter(
@@ -515,21 +632,24 @@ def get_execution_status(
         if not execution:
             raise HTTPException(status_code=404, detail="Execution not found")
         
-        # Calculate progress based on task executions
-        total_tasks = len(execution.task_executions) if execution.task_executions else 1
-        completed_tasks = len([t for t in execution.task_executions if t.status == "SUCCESS"]) if execution.task_executions else 0
-        progress_percentage = (completed_tasks / total_tasks) * 100 if total_tasks > 0 else 0
+        # Latest row per task (a resumed execution has one row per attempt)
+        task_executions = sorted(execution.task_executions or [], key=lambda t: t.id)
+        latest_tasks = list({task.task_name: task for task in task_executions}.values())
+        
+        # Calculate progress against the team's tasks (one per active role)
+        total_tasks = max(len([role for role in team.roles if role.is_active]), len(latest_tasks), 1)
+        completed_tasks = len([t for t in latest_tasks if t.status == TeamStatus.COMPLETED.value])
+        progress_percentage = (completed_tasks / total_tasks) * 100
         
         # Get current step/task
         current_task = None
-        if execution.task_executions:
-            running_tasks = [t for t in execution.task_executions if t.status == "RUNNING"]
-            if running_tasks:
-                current_task = {
-                    "id": running_tasks[0].id,
-                    "agent_name": running_tasks[0].role.title if running_tasks[0].role else "Unknown",
-                    "description": running_tasks[0].result[:100] + "..." if running_tasks[0].result and len(running_tasks[0].result) > 100 else running_tasks[0].result
-                }
+        running_tasks = [t for t in latest_tasks if t.status == TeamStatus.RUNNING.value]
+        if running_tasks:
+            current_task = {
+                "id": running_tasks[0].id,
+                "agent_name": running_tasks[0].role.title if running_tasks[0].role else "Unknown",
+                "description": _truncate(running_tasks[0].task_description, 100)
+            }
         
         return {
             "execution_id": execution.id,
@@ -540,15 +660,19 @@ def get_execution_status(
             "completed_tasks": completed_tasks,
             "current_task": current_task,
             "started_at": execution.created_at.isoformat(),
+            "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
             "cost_so_far": float(execution.cost) if execution.cost else 0.0,
+            "result": execution.result,
+            "error": execution.error_message,
             "estimated_completion": None,  # Could add time estimation logic
             "logs": [
                 {
                     "timestamp": task.created_at.isoformat(),
                     "agent": task.role.title if task.role else "System",
-                    "message": task.result[:200] + "..." if task.result and len(task.result) > 200 else task.result or "Task started"
+                    "status": task.status,
+                    "message": _truncate(_task_output(task), 200) or "Task started"
                 }
-                for task in (execution.task_executions[-5:] if execution.task_executions else [])
+                for task in task_executions[-5:]
             ]
         }
         
@@ -559,6 +683,15 @@ def get_execution_status(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _task_output(task) -> Optional[str]:
+    """A task's result from its output data, or its error"""
+    return (task.output_data or {}).get("result") or task.error_message
+
+
+def _truncate(text: Optional[str], limit: int) -> Optional[str]:
+    return text[:limit] + "..." if text and len(text) > limit else text
+
+
 @router.get("/{team_id}/status")
 def get_team_status(
     team_id: int,
@@ -753,6 +886,7 @@ def add_team_role(
         db.add(new_role)
         db.commit()
         db.refresh(new_role)
+        get_blueprint_cache().invalidate(team_id)
         
         return {
             "id": new_role.id,
@@ -807,6 +941,7 @@ def update_team_role(
         role.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(role)
+        get_blueprint_cache().invalidate(team_id)
         
         return {
             "id": role.id,
@@ -867,6 +1002,7 @@ def delete_team_role(
         
         db.delete(role)
         db.commit()
+        get_blueprint_cache().invalidate(team_id)
         
         return {"message": "Role deleted successfully"}
         
@@ -0,0 +1,184 @@
+"""
+🚪 Admission Queue - Bounded concurrency in front of a single backend
+
+A local Ollama host only runs a few generations at once; everything beyond
+that just queues inside Ollama until the client times out. The admission
+queue caps in-flight requests at the host's capacity, keeps queue depth and
+wait-time metrics, and estimates how long a new request would wait so the
+router can spill over to another provider instead.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionTimeoutError(TimeoutError):
+    """No slot became free within the queue timeout"""
+
+
+class AdmissionQueue:
+    """Semaphore-backed admission control usable from threads and asyncio"""
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        timeout_seconds: Optional[float] = None,
+        ewma_alpha: float = 0.2
+    ):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.ewma_alpha = ewma_alpha
+        self._semaphore = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        # Event-loop waiters, woken on release (threads block on the semaphore)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.total_admitted = 0
+        self.total_rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.ewma_service_seconds: Optional[float] = None
+
+    def estimated_wait(self) -> float:
+        """Seconds a request arriving now is expected to wait for a slot"""
+        with self._lock:
+            if self.in_flight < self.concurrency:
+                return 0.0
+            service_seconds = self.ewma_service_seconds or 0.0
+            return (self.waiting + 1) / self.concurrency * service_seconds
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            self.waiting += 1
+        start = time.monotonic()
+        try:
+            acquired = self._semaphore.acquire(timeout=self.timeout_seconds)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+        self._record_admission(acquired, time.monotonic() - start)
+        return acquired
+
+    async def _aacquire(self) -> bool:
+        """Wait for a slot on the event loop itself, without an executor thread"""
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout_seconds is None else loop.time() + self.timeout_seconds
+        with self._lock:
+            self.waiting += 1
+        start = time.monotonic()
+        acquired = False
+        try:
+            while True:
+                woken = loop.create_future()
+                waiter = (loop, woken)
+                # Register before trying, so a release in between still wakes us
+                with self._lock:
+                    self._async_waiters.append(waiter)
+                try:
+                    if self._semaphore.acquire(blocking=False):
+                        acquired = True
+                        break
+                    remaining = None if deadline is None else deadline - loop.time()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(asyncio.shield(woken), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    except asyncio.CancelledError:
+                        if woken.done():
+                            # Pass the wake-up on instead of swallowing it
+                            self._wake_async_waiter()
+                        raise
+                finally:
+                    with self._lock:
+                        if waiter in self._async_waiters:
+                            self._async_waiters.remove(waiter)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+        self._record_admission(acquired, time.monotonic() - start)
+        return acquired
+
+    def _wake_async_waiter(self):
+        with self._lock:
+            if not self._async_waiters:
+                return
+            loop, woken = self._async_waiters.pop(0)
+        loop.call_soon_threadsafe(lambda: woken.done() or woken.set_result(None))
+
+    def _record_admission(self, acquired: bool, waited: float):
+        with self._lock:
+            if acquired:
+                self.in_flight += 1
+                self.total_admitted += 1
+                self.total_wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            else:
+                self.total_rejected += 1
+
+    def _release(self, service_seconds: Optional[float] = None):
+        with self._lock:
+            self.in_flight -= 1
+            if service_seconds is not None:
+                if self.ewma_service_seconds is None:
+                    self.ewma_service_seconds = service_seconds
+                else:
+                    self.ewma_service_seconds += self.ewma_alpha * (service_seconds - self.ewma_service_seconds)
+        self._semaphore.release()
+        self._wake_async_waiter()
+
+    def _timeout_error(self) -> AdmissionTimeoutError:
+        logger.warning(f"🚪 {self.name} queue full, no slot within {self.timeout_seconds}s")
+        return AdmissionTimeoutError(f"{self.name} busy: no slot within {self.timeout_seconds}s")
+
+    @contextmanager
+    def slot(self):
+        """Hold one slot for the duration of the block"""
+        if not self._acquire():
+            raise self._timeout_error()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - start)
+
+    @asynccontextmanager
+    async def aslot(self):
+        """Async variant of slot(); waiters are futures on the event loop, not threads"""
+        if not await self._aacquire():
+            raise self._timeout_error()
+
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - start)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth and wait-time metrics"""
+        estimated_wait = self.estimated_wait()
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "queue_depth": self.waiting,
+                "total_admitted": self.total_admitted,
+                "total_rejected": self.total_rejected,
+                "avg_wait_seconds": round(self.total_wait_seconds / self.total_admitted, 3) if self.total_admitted else 0.0,
+                "max_wait_seconds": round(self.max_wait_seconds, 3),
+                "avg_service_seconds": round(self.ewma_service_seconds, 3) if self.ewma_service_seconds is not None else None,
+                "estimated_wait_seconds": round(estimated_wait, 3)
+            }
@@ -1,7 +1,7 @@
 """Application configuration (Supabase).
 """
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
 from urllib.parse import quote_plus
 
@@ -38,11 +38,86 @@ class Settings(BaseSettings):
     # Ollama Configuration (local)
     ollama_host: str = Field(default="http://localhost:11434", env="OLLAMA_HOST")
     ollama_model: str = Field(default="mistral:7b-instruct", env="OLLAMA_MODEL")
+    ollama_probe_interval_seconds: float = Field(default=30.0, env="OLLAMA_PROBE_INTERVAL_SECONDS")
+    ollama_probe_timeout_seconds: float = Field(default=2.0, env="OLLAMA_PROBE_TIMEOUT_SECONDS")
+    ollama_max_concurrency: int = Field(default=2, env="OLLAMA_MAX_CONCURRENCY")  # Parallel generations the host can run
+    ollama_queue_timeout_seconds: float = Field(default=60.0, env="OLLAMA_QUEUE_TIMEOUT_SECONDS")  # Max wait for a free slot
+    ollama_queue_latency_target_seconds: float = Field(default=10.0, env="OLLAMA_QUEUE_LATENCY_TARGET_SECONDS")  # Spill over above this wait
     
     # Hybrid LLM Settings
     default_quality_preference: str = Field(default="balanced", env="DEFAULT_QUALITY_PREFERENCE")  # fast, balanced, premium
     max_budget_per_task: float = Field(default=1.0, env="MAX_BUDGET_PER_TASK")  # Default $1 per task
-    
+    token_counter_backend: str = Field(default="auto", env="TOKEN_COUNTER_BACKEND")  # auto, tiktoken, heuristic
+    expected_output_tokens: int = Field(default=500, env="EXPECTED_OUTPUT_TOKENS")  # Output estimate used for routing budgets
+    llm_stream_idle_timeout_seconds: float = Field(default=30.0, env="LLM_STREAM_IDLE_TIMEOUT_SECONDS")  # Max gap between streamed chunks
+    crew_max_concurrency: int = Field(default=4, env="CREW_MAX_CONCURRENCY")  # Independent crew tasks run at once (1 = sequential)
+    execution_recorder_batch_size: int = Field(default=20, env="EXECUTION_RECORDER_BATCH_SIZE")  # Buffered task rows/updates per flush
+    execution_recorder_flush_interval_seconds: float = Field(default=2.0, env="EXECUTION_RECORDER_FLUSH_INTERVAL_SECONDS")  # Max time rows stay buffered
+    crew_blueprint_cache_max_entries: int = Field(default=256, env="CREW_BLUEPRINT_CACHE_MAX_ENTRIES")  # Prebuilt crews kept per team/params
+    estimate_history_days: int = Field(default=30, env="ESTIMATE_HISTORY_DAYS")  # Task history window used by execution estimates
+    estimate_min_history_samples: int = Field(default=3, env="ESTIMATE_MIN_HISTORY_SAMPLES")  # Below this, estimate from routing only
+    context_token_budget: int = Field(default=1500, env="CONTEXT_TOKEN_BUDGET")  # Upstream task context per prompt, summarized above this
+    context_inputs_token_budget: int = Field(default=500, env="CONTEXT_INPUTS_TOKEN_BUDGET")  # Execution inputs per prompt, clipped above this
+
+    # LLM Response Cache
+    llm_cache_backend: str = Field(default="memory", env="LLM_CACHE_BACKEND")  # memory, sqlite, none
+    llm_cache_max_entries: int = Field(default=1024, env="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl_seconds: float = Field(default=3600.0, env="LLM_CACHE_TTL_SECONDS")
+    llm_cache_sqlite_path: str = Field(default="llm_cache.sqlite3", env="LLM_CACHE_SQLITE_PATH")
+
+    # HTTP Connection Pools (shared per provider)
+    http_max_connections: int = Field(default=100, env="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=20, env="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry_seconds: float = Field(default=30.0, env="HTTP_KEEPALIVE_EXPIRY_SECONDS")
+    http_connect_timeout_seconds: float = Field(default=5.0, env="HTTP_CONNECT_TIMEOUT_SECONDS")
+    http_read_timeout_seconds: float = Field(default=120.0, env="HTTP_READ_TIMEOUT_SECONDS")
+    http2_enabled: bool = Field(default=True, env="HTTP2_ENABLED")  # Needs httpx[http2]
+
+    # Complexity Analysis
+    complexity_analysis_deadline_seconds: float = Field(default=1.5, env="COMPLEXITY_ANALYSIS_DEADLINE_SECONDS")
+    complexity_analysis_max_pending: int = Field(default=8, env="COMPLEXITY_ANALYSIS_MAX_PENDING")  # Queued + running analyses, beyond this routing uses the heuristic
+    complexity_cache_max_entries: int = Field(default=2048, env="COMPLEXITY_CACHE_MAX_ENTRIES")
+    complexity_cache_ttl_seconds: float = Field(default=86400.0, env="COMPLEXITY_CACHE_TTL_SECONDS")
+
+    # Provider Health / Circuit Breaker
+    provider_health_ewma_alpha: float = Field(default=0.2, env="PROVIDER_HEALTH_EWMA_ALPHA")
+    provider_slow_latency_seconds: float = Field(default=20.0, env="PROVIDER_SLOW_LATENCY_SECONDS")  # Demote above this EWMA latency
+    circuit_failure_threshold: int = Field(default=5, env="CIRCUIT_FAILURE_THRESHOLD")  # Consecutive failures before opening
+    circuit_error_rate_threshold: float = Field(default=0.5, env="CIRCUIT_ERROR_RATE_THRESHOLD")
+    circuit_reset_seconds: float = Field(default=30.0, env="CIRCUIT_RESET_SECONDS")  # Open -> half-open cool down
+
+    # Retries / Hedging
+    llm_retry_max_attempts: int = Field(default=3, env="LLM_RETRY_MAX_ATTEMPTS")  # Per provider, including the first call
+    llm_retry_base_delay_seconds: float = Field(default=0.5, env="LLM_RETRY_BASE_DELAY_SECONDS")
+    llm_retry_max_delay_seconds: float = Field(default=8.0, env="LLM_RETRY_MAX_DELAY_SECONDS")  # Longer Retry-After fails over instead
+    llm_hedging_enabled: bool = Field(default=False, env="LLM_HEDGING_ENABLED")
+    llm_hedge_percentile: float = Field(default=0.95, env="LLM_HEDGE_PERCENTILE")  # Hedge once a call is slower than this
+    llm_hedge_min_samples: int = Field(default=20, env="LLM_HEDGE_MIN_SAMPLES")
+    llm_hedge_min_delay_seconds: float = Field(default=1.0, env="LLM_HEDGE_MIN_DELAY_SECONDS")
+    llm_hedge_max_workers: int = Field(default=32, env="LLM_HEDGE_MAX_WORKERS")  # Threads racing hedged sync requests
+
+    # Fake LLM Provider (offline load / benchmark runs, replaces real providers)
+    fake_llm_enabled: bool = Field(default=False, env="FAKE_LLM_ENABLED")
+    fake_llm_latency_seconds: float = Field(default=0.2, env="FAKE_LLM_LATENCY_SECONDS")  # Median latency
+    fake_llm_latency_sigma: float = Field(default=0.5, env="FAKE_LLM_LATENCY_SIGMA")  # Log-normal spread (tail heaviness)
+    fake_llm_error_rate: float = Field(default=0.0, env="FAKE_LLM_ERROR_RATE")
+    fake_llm_output_tokens: int = Field(default=200, env="FAKE_LLM_OUTPUT_TOKENS")
+    fake_llm_stream_chunk_tokens: int = Field(default=8, env="FAKE_LLM_STREAM_CHUNK_TOKENS")
+    fake_llm_cost_per_1k_tokens: float = Field(default=0.0, env="FAKE_LLM_COST_PER_1K_TOKENS")
+    fake_llm_seed: Optional[int] = Field(default=None, env="FAKE_LLM_SEED")
+
+    # Provider Rate Limits, keyed by provider value or model name, e.g.
+    # {"openai_gpt_4": {"rpm": 500, "tpm": 30000}, "gpt-3.5-turbo": {"tpm": 200000}}
+    provider_rate_limits: Dict[str, Dict[str, int]] = Field(default={}, env="PROVIDER_RATE_LIMITS")
+
+    # Background Execution Jobs (drained by app.worker)
+    job_worker_concurrency: int = Field(default=2, env="JOB_WORKER_CONCURRENCY")  # Jobs run at once per worker process
+    job_poll_interval_seconds: float = Field(default=2.0, env="JOB_POLL_INTERVAL_SECONDS")  # Idle wait between queue polls
+    job_heartbeat_interval_seconds: float = Field(default=15.0, env="JOB_HEARTBEAT_INTERVAL_SECONDS")
+    job_visibility_timeout_seconds: float = Field(default=120.0, env="JOB_VISIBILITY_TIMEOUT_SECONDS")  # Stale heartbeat = dead worker
+    job_max_attempts: int = Field(default=3, env="JOB_MAX_ATTEMPTS")
+    job_retry_delay_seconds: float = Field(default=30.0, env="JOB_RETRY_DELAY_SECONDS")  # Base backoff, doubles per attempt
+
     # App Configuration
     debug: bool = Field(False, env="DEBUG")
     cors_origins: List[str] = Field(
@@ -0,0 +1,114 @@
+"""
+🧪 Fake LLM Provider - Deterministic offline stand-in for load and benchmarks
+
+Lets the router and the hybrid crew run end to end without API keys or an
+Ollama host. Latency is drawn from a log-normal distribution around a
+configured median, errors are injected at a configured rate (as retryable
+503s), and output size and streaming chunking are configurable.
+
+With a seed, the sequence of latencies and failures is reproducible for a
+given call order, and the content of each response depends only on the
+prompt.
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class FakeLLMError(Exception):
+    """Injected provider failure (looks like a 503 to the retry policy)"""
+
+    status_code = 503
+
+
+class FakeLLM:
+    """Simulated completion backend with tunable latency, errors and streaming"""
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.2,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        output_tokens: int = 200,
+        stream_chunk_tokens: int = 8,
+        seed: Optional[int] = None
+    ):
+        self.latency_seconds = latency_seconds
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.output_tokens = output_tokens
+        self.stream_chunk_tokens = max(1, stream_chunk_tokens)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self) -> Tuple[float, bool]:
+        """Next (latency, fails) pair from the seeded generator"""
+        with self._lock:
+            latency = self.latency_seconds * math.exp(self._random.gauss(0.0, self.latency_sigma))
+            fails = self._random.random() < self.error_rate
+        return latency, fails
+
+    def _words(self, prompt: str, count: int) -> List[str]:
+        """Prompt-derived filler words (one word ~ one token)"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return [f"w{digest[i % 60:i % 60 + 4]}" for i in range(count)]
+
+    def _prompt_tokens(self, prompt: str) -> int:
+        return len(prompt.split())
+
+    def complete(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Blocking completion in the router's raw result format"""
+        latency, fails = self._draw()
+        time.sleep(latency)
+        return self._result(prompt, fails, **kwargs)
+
+    async def acomplete(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Async variant of complete()"""
+        latency, fails = self._draw()
+        await asyncio.sleep(latency)
+        return self._result(prompt, fails, **kwargs)
+
+    def _result(self, prompt: str, fails: bool, **kwargs) -> Dict[str, Any]:
+        if fails:
+            raise FakeLLMError("Injected fake LLM failure")
+
+        output_tokens = self._output_tokens(kwargs)
+        return {
+            "content": " ".join(self._words(prompt, output_tokens)),
+            "tokens": self._prompt_tokens(prompt) + output_tokens,
+            "model": "fake-llm"
+        }
+
+    def _output_tokens(self, kwargs: Dict[str, Any]) -> int:
+        """Configured output length, capped by the caller's max_tokens"""
+        max_tokens = kwargs.get("max_tokens")
+        return min(max_tokens, self.output_tokens) if max_tokens else self.output_tokens
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[Tuple[str, Optional[int]]]:
+        """
+        Stream (piece, usage_tokens) pairs like the real provider streams
+
+        The drawn latency is spread evenly over the chunks; an injected
+        failure happens after the first chunk, mid-stream.
+        """
+        latency, fails = self._draw()
+        output_tokens = self._output_tokens(kwargs)
+        words = self._words(prompt, output_tokens)
+        chunks = [
+            words[i:i + self.stream_chunk_tokens]
+            for i in range(0, len(words), self.stream_chunk_tokens)
+        ]
+        delay = latency / max(1, len(chunks))
+
+        for index, chunk in enumerate(chunks):
+            time.sleep(delay)
+            if fails and index == 1:
+                raise FakeLLMError("Injected fake LLM failure mid-stream")
+            yield " ".join(chunk) + " ", None
+
+        yield "", self._prompt_tokens(prompt) + output_tokens
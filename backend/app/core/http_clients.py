@@ -0,0 +1,106 @@
+"""
+🔌 Shared HTTP Clients - Keep-alive connection pools per LLM provider
+
+One sync and one async httpx client per provider, created lazily and
+reused by the router, the complexity analyzer, the Ollama probe and the
+health endpoints, so connection setup (TCP + TLS) is paid once per pool
+instead of once per call.
+
+HTTP/2 is enabled for the hosted providers when the optional ``h2``
+package is installed (``httpx[http2]``); Ollama speaks plain HTTP/1.1.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+import httpx
+
+from .config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+
+OLLAMA = "ollama"
+OPENAI = "openai"
+ANTHROPIC = "anthropic"
+
+# Providers reachable over TLS that negotiate HTTP/2
+_HTTP2_PROVIDERS = (OPENAI, ANTHROPIC)
+
+
+class HTTPClientRegistry:
+    """Lazily built, shared httpx clients keyed by provider"""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._clients: Dict[str, httpx.Client] = {}
+        self._async_clients: Dict[str, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def _client_options(self, provider: str) -> Dict:
+        settings = self.settings
+        options = {
+            "limits": httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds
+            ),
+            "timeout": httpx.Timeout(
+                settings.http_read_timeout_seconds,
+                connect=settings.http_connect_timeout_seconds
+            ),
+            "http2": settings.http2_enabled and HTTP2_AVAILABLE and provider in _HTTP2_PROVIDERS
+        }
+        if provider == OLLAMA:
+            options["base_url"] = settings.ollama_host
+        return options
+
+    def get_client(self, provider: str) -> httpx.Client:
+        """Shared sync client for a provider"""
+        with self._lock:
+            client = self._clients.get(provider)
+            if client is None or client.is_closed:
+                client = self._clients[provider] = httpx.Client(**self._client_options(provider))
+            return client
+
+    def get_async_client(self, provider: str) -> httpx.AsyncClient:
+        """Shared async client for a provider"""
+        with self._lock:
+            client = self._async_clients.get(provider)
+            if client is None or client.is_closed:
+                client = self._async_clients[provider] = httpx.AsyncClient(**self._client_options(provider))
+            return client
+
+    async def aclose(self):
+        """Close every pooled connection (call on application shutdown)"""
+        with self._lock:
+            clients = list(self._clients.values())
+            async_clients = list(self._async_clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+
+        for client in clients:
+            client.close()
+        for async_client in async_clients:
+            await async_client.aclose()
+
+        logger.info("🔌 HTTP client pools closed")
+
+
+_registry: Optional[HTTPClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_http_clients() -> HTTPClientRegistry:
+    """Get the process-wide HTTP client registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HTTPClientRegistry(get_settings())
+        return _registry
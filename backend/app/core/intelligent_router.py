@@ -12,21 +12,38 @@ Key Features:
 - Performance tracking
 """
 
+import asyncio
+import hashlib
+import itertools
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from enum import Enum
 from decimal import Decimal
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 import re
 import json
 
 # import ollama  # Temporarily disabled due to dependency conflicts
-from openai import OpenAI
+import openai
+from openai import OpenAI, AsyncOpenAI
 import anthropic
 import httpx
 
+from .admission_queue import AdmissionQueue
 from .config import get_settings
+from .fake_llm import FakeLLM
+from .http_clients import ANTHROPIC, OLLAMA, OPENAI, get_http_clients
+from .ollama_probe import OllamaAvailabilityProbe
+from .llm_cache import InMemoryLRUCache, create_response_cache, make_cache_key
+from .pricing import token_cost
+from .provider_health import ProviderHealthTracker
+from .rate_limiter import ProviderRateLimiter, RateLimitExceeded
+from .retry_policy import RetryPolicy
+from .single_flight import AsyncSingleFlight, SingleFlight
+from .token_counter import create_token_counter
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -46,6 +63,7 @@ class LLMProvider(Enum):
     OPENAI_GPT_35 = "openai_gpt_3.5_turbo"  
     OPENAI_GPT_4 = "openai_gpt_4"
     ANTHROPIC_CLAUDE = "anthropic_claude_3_haiku"
+    FAKE = "fake"  # Offline stand-in for load / benchmark runs (FAKE_LLM_ENABLED)
 
 
 @dataclass
@@ -57,6 +75,7 @@ class RoutingDecision:
     reasoning: str
     complexity: ComplexityLevel
     confidence: float
+    fallbacks: List["RoutingDecision"] = field(default_factory=list)  # Next-ranked options, in order
 
 
 @dataclass 
@@ -69,28 +88,102 @@ class ExecutionResult:
     duration_seconds: float
     success: bool
     error: Optional[str] = None
+    cached: bool = False  # Served from the response cache (no provider call)
+    attempts: List[Dict[str, Any]] = field(default_factory=list)  # Every provider tried, in order
+    coalesced: bool = False  # Shared another caller's in-flight provider call (cost attributed there)
+    truncated: bool = False  # Generation stopped early at the cost limit (content is partial)
+
+
+@dataclass
+class StreamChunk:
+    """Incremental piece of a streamed LLM response with running accounting"""
+    content: str
+    provider: LLMProvider
+    tokens: int  # Running prompt + output token count
+    cost: Decimal  # Running cost for the tokens so far
+    done: bool = False
+    error: Optional[str] = None
+    truncated: bool = False  # Stream stopped at max_cost (set on the final chunk)
+
+
+# Keyword tables for heuristic complexity scoring, built once per process
+_COMPLEX_KEYWORDS = (
+    'analyze', 'design', 'architect', 'optimize', 'algorithm',
+    'machine learning', 'deep learning', 'neural network',
+    'research', 'scientific', 'mathematical', 'statistical',
+    'reasoning', 'logic', 'proof', 'theorem', 'philosophy'
+)
+
+_SIMPLE_KEYWORDS = (
+    'list', 'summarize', 'translate', 'format', 'convert',
+    'extract', 'find', 'search', 'basic', 'simple'
+)
+
+_CODE_KEYWORDS = ('python', 'javascript', 'sql', 'code', 'programming')
+
+_CREATIVE_KEYWORDS = ('write', 'create', 'generate', 'story')
+
+
+def _heuristic_score(prompt: str) -> float:
+    """Score a prompt against the module-level keyword tables"""
+    score = 0.0
+    prompt_lower = prompt.lower()
+    
+    # Length factor
+    if len(prompt) > 1000:
+        score += 0.2
+    elif len(prompt) > 500:
+        score += 0.1
+    
+    # Score based on keyword presence
+    for keyword in _COMPLEX_KEYWORDS:
+        if keyword in prompt_lower:
+            score += 0.15
+    
+    for keyword in _SIMPLE_KEYWORDS:
+        if keyword in prompt_lower:
+            score -= 0.1
+    
+    # Code-related tasks (medium complexity)
+    if any(keyword in prompt_lower for keyword in _CODE_KEYWORDS):
+        score += 0.2
+    
+    # Creative tasks (can be simple or complex)
+    if any(keyword in prompt_lower for keyword in _CREATIVE_KEYWORDS):
+        score += 0.1
+    
+    return max(0.0, min(1.0, score))
 
 
 class ComplexityAnalyzer:
     """Analyzes task complexity to determine optimal LLM routing"""
     
     def __init__(self):
-        self.ollama_available = False
-        self._initialize_ollama()
+        # Memoized LLM scores - the same task prompts recur constantly
+        self._score_cache = InMemoryLRUCache(
+            max_entries=settings.complexity_cache_max_entries,
+            ttl_seconds=settings.complexity_cache_ttl_seconds
+        )
+        # Runs LLM analysis off the caller's thread so it can be time-boxed
+        self._analysis_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="complexity")
+        # Analyses outlive their deadline; bound the backlog and score each prompt once
+        self._analysis_lock = threading.Lock()
+        self._analyses_in_flight: set = set()
+        self._analyses_pending = 0
+        
+        # Availability is polled in the background so construction never blocks
+        self.ollama_probe = OllamaAvailabilityProbe(
+            settings.ollama_host,
+            interval_seconds=settings.ollama_probe_interval_seconds,
+            timeout_seconds=settings.ollama_probe_timeout_seconds,
+            client=get_http_clients().get_client(OLLAMA)
+        )
+        self.ollama_probe.start()
     
-    def _initialize_ollama(self):
-        """Initialize connection to local Ollama via HTTP API"""
-        try:
-            # Check if Ollama is available via HTTP
-            response = httpx.get('http://localhost:11434/api/version', timeout=5.0)
-            if response.status_code == 200:
-                self.ollama_available = True
-                logger.info("🧠 Ollama HTTP API connection established")
-            else:
-                logger.warning("⚠️ Ollama HTTP API not responding")
-        except Exception as e:
-            logger.warning(f"⚠️ Ollama not available: {e}")
-            self.ollama_available = False
+    @property
+    def ollama_available(self) -> bool:
+        """Latest result of the background Ollama probe"""
+        return self.ollama_probe.available
     
     def analyze_complexity(self, prompt: str, context: Optional[str] = None) -> ComplexityLevel:
         """
@@ -107,72 +200,349 @@ class ComplexityAnalyzer:
         heuristic_score = self._heuristic_complexity_score(prompt)
         
         # If Ollama is available, use it for deeper analysis
+        llm_score = None
         if self.ollama_available and heuristic_score > 0.3:
-            try:
-                llm_score = self._llm_complexity_analysis(prompt, context)
-                # Combine scores (weighted average)
-                final_score = (heuristic_score * 0.4) + (llm_score * 0.6)
-            except Exception as e:
-                logger.warning(f"LLM analysis failed, using heuristic: {e}")
-                final_score = heuristic_score
+            llm_score = self._get_llm_score(prompt, context)
+        
+        if llm_score is not None:
+            # Combine scores (weighted average)
+            final_score = (heuristic_score * 0.4) + (llm_score * 0.6)
         else:
             final_score = heuristic_score
         
-        # Map score to complexity level
-        if final_score < 0.2:
+        return self._score_to_complexity(final_score)
+    
+    async def aanalyze_complexity(self, prompt: str, context: Optional[str] = None) -> ComplexityLevel:
+        """Async variant of analyze_complexity() that never blocks the event loop"""
+        heuristic_score = self._heuristic_complexity_score(prompt)
+        
+        llm_score = None
+        if self.ollama_available and heuristic_score > 0.3:
+            llm_score = await self._aget_llm_score(prompt, context)
+        
+        if llm_score is not None:
+            final_score = (heuristic_score * 0.4) + (llm_score * 0.6)
+        else:
+            final_score = heuristic_score
+        
+        return self._score_to_complexity(final_score)
+    
+    def analyze_many(
+        self,
+        prompts: List[str],
+        contexts: Optional[List[Optional[str]]] = None,
+        use_llm: bool = True
+    ) -> List[ComplexityLevel]:
+        """
+        Analyze a batch of prompts in one pass
+        
+        All prompts are scored heuristically up front; the ambiguous ones
+        (the prompts analyze_complexity() would send to Ollama) share a single
+        batched classification call instead of one round trip each.
+        
+        Args:
+            prompts: Task prompts to analyze
+            contexts: Optional context per prompt
+            use_llm: False to skip Ollama (heuristic and cached scores only)
+            
+        Returns:
+            List[ComplexityLevel]: One complexity level per prompt, in order
+        """
+        contexts = contexts or [None] * len(prompts)
+        heuristic_scores = self.score_many(prompts)
+        
+        llm_scores: Dict[str, float] = {}
+        if self.ollama_available or not use_llm:
+            pending: Dict[str, Tuple[str, Optional[str]]] = {}
+            for prompt, context, heuristic_score in zip(prompts, contexts, heuristic_scores):
+                if heuristic_score <= 0.3:
+                    continue
+                cache_key = self._analysis_cache_key(prompt, context)
+                cached_score = self._score_cache.get(cache_key)
+                if cached_score is not None:
+                    llm_scores[cache_key] = cached_score
+                else:
+                    pending[cache_key] = (prompt, context)
+            
+            if pending and use_llm:
+                llm_scores.update(self._get_llm_scores(pending))
+        
+        complexities = []
+        for prompt, context, heuristic_score in zip(prompts, contexts, heuristic_scores):
+            llm_score = llm_scores.get(self._analysis_cache_key(prompt, context))
+            if llm_score is not None:
+                final_score = (heuristic_score * 0.4) + (llm_score * 0.6)
+            else:
+                final_score = heuristic_score
+            complexities.append(self._score_to_complexity(final_score))
+        
+        return complexities
+    
+    def _get_llm_scores(self, pending: Dict[str, Tuple[str, Optional[str]]]) -> Dict[str, float]:
+        """
+        Deadline-bounded batched LLM scores keyed by analysis cache key
+        
+        Returns an empty dict when the batch fails or misses the deadline.
+        """
+        if len(pending) == 1:
+            (cache_key, (prompt, context)), = pending.items()
+            score = self._get_llm_score(prompt, context)
+            return {cache_key: score} if score is not None else {}
+        
+        claimed = self._claim_analysis(list(pending))
+        if not claimed:
+            return {}
+        
+        items = [(key, pending[key]) for key in claimed]
+        future = self._analysis_executor.submit(
+            self._llm_batch_complexity_analysis,
+            [item for _, item in items]
+        )
+        future.add_done_callback(lambda f: self._remember_scores(claimed, f))
+        
+        try:
+            scores = future.result(timeout=settings.complexity_analysis_deadline_seconds)
+            return {key: score for (key, _), score in zip(items, scores)}
+        except FuturesTimeoutError:
+            logger.warning(
+                f"Batched LLM analysis exceeded {settings.complexity_analysis_deadline_seconds}s deadline, using heuristic"
+            )
+        except Exception as e:
+            logger.warning(f"Batched LLM analysis failed, using heuristic: {e}")
+        return {}
+    
+    def _claim_analysis(self, cache_keys: List[str]) -> List[str]:
+        """
+        Claim the keys not already being scored for one background analysis
+        
+        Returns the claimed keys, or [] when all of them are in flight or the
+        pending-analysis cap is reached; the caller then uses the heuristic.
+        """
+        with self._analysis_lock:
+            claimed = [key for key in cache_keys if key not in self._analyses_in_flight]
+            if not claimed:
+                return []
+            if self._analyses_pending >= settings.complexity_analysis_max_pending:
+                logger.warning(f"{self._analyses_pending} LLM analyses pending, using heuristic")
+                return []
+            self._analyses_pending += 1
+            self._analyses_in_flight.update(claimed)
+        return claimed
+    
+    def _release_analysis(self, cache_keys: List[str]) -> None:
+        with self._analysis_lock:
+            self._analyses_pending -= 1
+            self._analyses_in_flight.difference_update(cache_keys)
+    
+    def _remember_scores(self, cache_keys: List[str], future) -> None:
+        """Done-callback releasing a batch analysis and storing its LLM scores in the memo cache"""
+        self._release_analysis(cache_keys)
+        if future.cancelled() or future.exception() is not None:
+            return
+        for cache_key, score in zip(cache_keys, future.result()):
+            self._score_cache.set(cache_key, score)
+    
+    def _get_llm_score(self, prompt: str, context: Optional[str] = None) -> Optional[float]:
+        """
+        Memoized, deadline-bounded LLM complexity score
+        
+        Returns None when the analysis fails or misses the per-decision
+        deadline; the caller then falls back to the heuristic score. A late
+        answer still lands in the memo cache for the next identical prompt.
+        No call is made while the same prompt is already being scored or the
+        analysis backlog is full.
+        """
+        cache_key = self._analysis_cache_key(prompt, context)
+        cached_score = self._score_cache.get(cache_key)
+        if cached_score is not None:
+            return cached_score
+        if not self._claim_analysis([cache_key]):
+            return None
+        
+        future = self._analysis_executor.submit(self._llm_complexity_analysis, prompt, context)
+        future.add_done_callback(lambda f: self._remember_score(cache_key, f))
+        
+        try:
+            return future.result(timeout=settings.complexity_analysis_deadline_seconds)
+        except FuturesTimeoutError:
+            logger.warning(
+                f"LLM analysis exceeded {settings.complexity_analysis_deadline_seconds}s deadline, using heuristic"
+            )
+        except Exception as e:
+            logger.warning(f"LLM analysis failed, using heuristic: {e}")
+        return None
+    
+    async def _aget_llm_score(self, prompt: str, context: Optional[str] = None) -> Optional[float]:
+        """Async variant of _get_llm_score()"""
+        cache_key = self._analysis_cache_key(prompt, context)
+        cached_score = self._score_cache.get(cache_key)
+        if cached_score is not None:
+            return cached_score
+        if not self._claim_analysis([cache_key]):
+            return None
+        
+        task = asyncio.ensure_future(self._allm_complexity_analysis(prompt, context))
+        task.add_done_callback(lambda t: self._remember_score(cache_key, t))
+        
+        try:
+            # shield() keeps the analysis running past the deadline so it can fill the cache
+            return await asyncio.wait_for(
+                asyncio.shield(task),
+                timeout=settings.complexity_analysis_deadline_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"LLM analysis exceeded {settings.complexity_analysis_deadline_seconds}s deadline, using heuristic"
+            )
+        except Exception as e:
+            logger.warning(f"LLM analysis failed, using heuristic: {e}")
+        return None
+    
+    def _remember_score(self, cache_key: str, future) -> None:
+        """Done-callback releasing an analysis and storing its LLM score in the memo cache"""
+        self._release_analysis([cache_key])
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._score_cache.set(cache_key, future.result())
+    
+    @staticmethod
+    def _analysis_cache_key(prompt: str, context: Optional[str] = None) -> str:
+        """Hash of the prompt/context pair used as memo key"""
+        return hashlib.sha256(f"{prompt}\x00{context or ''}".encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _score_to_complexity(score: float) -> ComplexityLevel:
+        """Map a 0-1 complexity score to a complexity level"""
+        if score < 0.2:
             return ComplexityLevel.SIMPLE
-        elif final_score < 0.5:
+        elif score < 0.5:
             return ComplexityLevel.MEDIUM
-        elif final_score < 0.8:
+        elif score < 0.8:
             return ComplexityLevel.COMPLEX
         else:
             return ComplexityLevel.SPECIALIZED
     
     def _heuristic_complexity_score(self, prompt: str) -> float:
         """Fast heuristic-based complexity scoring"""
-        score = 0.0
-        prompt_lower = prompt.lower()
-        
-        # Length factor
-        if len(prompt) > 1000:
-            score += 0.2
-        elif len(prompt) > 500:
-            score += 0.1
-        
-        # Complexity keywords
-        complex_keywords = [
-            'analyze', 'design', 'architect', 'optimize', 'algorithm',
-            'machine learning', 'deep learning', 'neural network',
-            'research', 'scientific', 'mathematical', 'statistical',
-            'reasoning', 'logic', 'proof', 'theorem', 'philosophy'
-        ]
+        return _heuristic_score(prompt)
+    
+    def score_many(self, prompts: List[str]) -> List[float]:
+        """
+        Heuristic complexity scores for a batch of prompts
         
-        simple_keywords = [
-            'list', 'summarize', 'translate', 'format', 'convert',
-            'extract', 'find', 'search', 'basic', 'simple'
-        ]
+        Uses the same prebuilt keyword tables as single-prompt scoring, so
+        every task of a crew can be scored up front in one call.
+        """
+        scores: Dict[str, float] = {}
+        for prompt in prompts:
+            # Crews often repeat the same prompt; score each distinct one once
+            if prompt not in scores:
+                scores[prompt] = _heuristic_score(prompt)
+        return [scores[prompt] for prompt in prompts]
+    
+    def _llm_complexity_analysis(self, prompt: str, context: Optional[str] = None) -> float:
+        """Use Ollama/Mistral to analyze complexity (free analysis!)"""
+        try:
+            response = get_http_clients().get_client(OLLAMA).post(
+                '/api/generate',
+                json=self._build_analysis_payload(prompt, context),
+                timeout=10.0
+            )
+            
+            response.raise_for_status() # Raise an exception for HTTP errors
+            
+            return self._parse_complexity_score(response.json()['response'])
+                
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ollama HTTP API complexity analysis failed with status {e.response.status_code}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Ollama HTTP API complexity analysis failed: {e}")
+            raise
+    
+    async def _allm_complexity_analysis(self, prompt: str, context: Optional[str] = None) -> float:
+        """Async variant of _llm_complexity_analysis()"""
+        try:
+            response = await get_http_clients().get_async_client(OLLAMA).post(
+                '/api/generate',
+                json=self._build_analysis_payload(prompt, context),
+                timeout=10.0
+            )
+            
+            response.raise_for_status()
+            
+            return self._parse_complexity_score(response.json()['response'])
+                
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ollama HTTP API complexity analysis failed with status {e.response.status_code}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Ollama HTTP API complexity analysis failed: {e}")
+            raise
+    
+    def _llm_batch_complexity_analysis(self, items: List[Tuple[str, Optional[str]]]) -> List[float]:
+        """Score several tasks with a single Ollama/Mistral call"""
+        try:
+            response = get_http_clients().get_client(OLLAMA).post(
+                '/api/generate',
+                json=self._build_batch_analysis_payload(items),
+                timeout=10.0 + 2.0 * len(items)
+            )
+            
+            response.raise_for_status()
+            
+            return self._parse_batch_complexity_scores(response.json()['response'], len(items))
+                
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ollama HTTP API batched complexity analysis failed with status {e.response.status_code}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Ollama HTTP API batched complexity analysis failed: {e}")
+            raise
+    
+    @staticmethod
+    def _build_batch_analysis_payload(items: List[Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+        """Build the Ollama request body for a batched complexity analysis"""
+        tasks = "\n\n".join(
+            f"Task {index}: {prompt}\nContext {index}: {context or 'None'}"
+            for index, (prompt, context) in enumerate(items, start=1)
+        )
+        analysis_prompt = f"""
+        Analyze the complexity of each task below on a scale of 0-1:
+        
+        0.0-0.2: Simple (basic formatting, simple questions, extraction)
+        0.2-0.5: Medium (analysis, coding, research with clear scope)  
+        0.5-0.8: Complex (deep reasoning, multi-step problems, design)
+        0.8-1.0: Specialized (expert domain knowledge, advanced math/science)
         
-        # Score based on keyword presence
-        for keyword in complex_keywords:
-            if keyword in prompt_lower:
-                score += 0.15
+        {tasks}
         
-        for keyword in simple_keywords:
-            if keyword in prompt_lower:
-                score -= 0.1
+        Respond with JSON only, in the form {{"scores": [<one number per task, in order>]}}.
+        There are {len(items)} tasks.
+        """
         
-        # Code-related tasks (medium complexity)
-        if any(lang in prompt_lower for lang in ['python', 'javascript', 'sql', 'code', 'programming']):
-            score += 0.2
+        return {
+            'model': 'mistral:7b-instruct',
+            'prompt': analysis_prompt,
+            'format': 'json',
+            'stream': False,
+            'options': {'temperature': 0.1, 'num_predict': 20 + 8 * len(items)}
+        }
+    
+    @staticmethod
+    def _parse_batch_complexity_scores(text: str, expected: int) -> List[float]:
+        """Extract the per-task scores from a batched Ollama analysis response"""
+        data = json.loads(text)
+        scores = data.get('scores') if isinstance(data, dict) else data
         
-        # Creative tasks (can be simple or complex)
-        if any(word in prompt_lower for word in ['write', 'create', 'generate', 'story']):
-            score += 0.1
+        if not isinstance(scores, list) or len(scores) != expected:
+            raise ValueError(f"Expected {expected} complexity scores, got: {text}")
         
-        return max(0.0, min(1.0, score))
+        return [max(0.0, min(1.0, float(score))) for score in scores]
     
-    def _llm_complexity_analysis(self, prompt: str, context: Optional[str] = None) -> float:
-        """Use Ollama/Mistral to analyze complexity (free analysis!)"""
+    @staticmethod
+    def _build_analysis_payload(prompt: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Ollama request body for complexity analysis"""
         analysis_prompt = f"""
         Analyze the complexity of this task on a scale of 0-1:
         
@@ -187,36 +557,25 @@ class ComplexityAnalyzer:
         Respond with just a number between 0 and 1:
         """
         
-        try:
-            response = httpx.post(
-                'http://localhost:11434/api/generate',
-                json={
-                    'model': 'mistral:7b-instruct',
-                    'prompt': analysis_prompt,
-                    'options': {'temperature': 0.1, 'num_predict': 10}
-                },
-                timeout=10.0
-            )
-            
-            response.raise_for_status() # Raise an exception for HTTP errors
-            
-            # Extract numeric score from response
-            text = response.json()['response'].strip()
-            score_match = re.search(r'([0-1]?\.?\d+)', text)
-            
-            if score_match:
-                score = float(score_match.group(1))
-                return max(0.0, min(1.0, score))
-            else:
-                logger.warning(f"Could not parse complexity score: {text}")
-                return 0.5  # Default to medium
-                
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Ollama HTTP API complexity analysis failed with status {e.response.status_code}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Ollama HTTP API complexity analysis failed: {e}")
-            raise
+        return {
+            'model': 'mistral:7b-instruct',
+            'prompt': analysis_prompt,
+            'stream': False,
+            'options': {'temperature': 0.1, 'num_predict': 10}
+        }
+    
+    @staticmethod
+    def _parse_complexity_score(text: str) -> float:
+        """Extract numeric score from an Ollama analysis response"""
+        text = text.strip()
+        score_match = re.search(r'([0-1]?\.?\d+)', text)
+        
+        if score_match:
+            score = float(score_match.group(1))
+            return max(0.0, min(1.0, score))
+        else:
+            logger.warning(f"Could not parse complexity score: {text}")
+            return 0.5  # Default to medium
 
 
 class IntelligentLLMRouter:
@@ -232,10 +591,17 @@ class IntelligentLLMRouter:
     
     def __init__(self):
         self.complexity_analyzer = ComplexityAnalyzer()
+        self.token_counter = create_token_counter(settings.token_counter_backend)
         self.ollama_client = None
         self.openai_client = None
         self.anthropic_client = None
         
+        # Async clients let one worker keep many provider calls in flight
+        self.async_ollama_client = None
+        self.async_openai_client = None
+        self.async_anthropic_client = None
+        self.fake_llm = None
+        
         self._initialize_clients()
         
         # Pricing per 1K tokens (approximate)
@@ -244,13 +610,80 @@ class IntelligentLLMRouter:
             LLMProvider.OPENAI_GPT_35: Decimal("0.0015"),      # $0.0015/1K
             LLMProvider.OPENAI_GPT_4: Decimal("0.03"),         # $0.03/1K  
             LLMProvider.ANTHROPIC_CLAUDE: Decimal("0.0008"),   # $0.0008/1K
+            LLMProvider.FAKE: Decimal(str(settings.fake_llm_cost_per_1k_tokens)),
         }
+        
+        # Response cache in front of execute_request (None when disabled)
+        self.response_cache = create_response_cache(
+            settings.llm_cache_backend,
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            path=settings.llm_cache_sqlite_path
+        )
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._cache_stats_lock = threading.Lock()
+        
+        # Live provider health (EWMA latency, error rate, circuit state)
+        self.health_tracker = ProviderHealthTracker(
+            ewma_alpha=settings.provider_health_ewma_alpha,
+            failure_threshold=settings.circuit_failure_threshold,
+            error_rate_threshold=settings.circuit_error_rate_threshold,
+            reset_timeout_seconds=settings.circuit_reset_seconds,
+            slow_latency_seconds=settings.provider_slow_latency_seconds
+        )
+        
+        # Caps concurrent generations on the local Ollama host
+        self.ollama_queue = AdmissionQueue(
+            "ollama",
+            concurrency=settings.ollama_max_concurrency,
+            timeout_seconds=settings.ollama_queue_timeout_seconds
+        )
+        
+        # RPM / TPM pacing against provider quotas
+        self.rate_limiter = ProviderRateLimiter(settings.provider_rate_limits)
+        
+        # Transient provider errors are retried before failing over
+        self.retry_policy = RetryPolicy(
+            max_attempts=settings.llm_retry_max_attempts,
+            base_delay_seconds=settings.llm_retry_base_delay_seconds,
+            max_delay_seconds=settings.llm_retry_max_delay_seconds,
+            retryable_exceptions=(
+                httpx.TransportError,
+                openai.APIConnectionError,
+                anthropic.APIConnectionError
+            )
+        )
+        # Runs hedged sync requests so the primary and backup can race
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=settings.llm_hedge_max_workers,
+            thread_name_prefix="llm-hedge"
+        )
+        
+        # Identical concurrent requests share one upstream call
+        self._inflight = SingleFlight()
+        self._ainflight = AsyncSingleFlight()
     
     def _initialize_clients(self):
-        """Initialize all LLM clients"""
+        """Initialize all LLM clients on the shared connection pools (SDK retries off, see retry_policy)"""
+        http_clients = get_http_clients()
+        
+        # Fake provider takes over all routing, no real clients needed
+        if settings.fake_llm_enabled:
+            self.fake_llm = FakeLLM(
+                latency_seconds=settings.fake_llm_latency_seconds,
+                latency_sigma=settings.fake_llm_latency_sigma,
+                error_rate=settings.fake_llm_error_rate,
+                output_tokens=settings.fake_llm_output_tokens,
+                stream_chunk_tokens=settings.fake_llm_stream_chunk_tokens,
+                seed=settings.fake_llm_seed
+            )
+            logger.info("🧪 Fake LLM provider enabled, real providers disabled")
+            return
+        
         # Ollama (local)
         try:
-            self.ollama_client = httpx.Client(base_url='http://localhost:11434')
+            self.ollama_client = http_clients.get_client(OLLAMA)
+            self.async_ollama_client = http_clients.get_async_client(OLLAMA)
             logger.info("🧠 Ollama client initialized")
         except Exception as e:
             logger.warning(f"Ollama initialization failed: {e}")
@@ -258,7 +691,16 @@ class IntelligentLLMRouter:
         # OpenAI  
         if hasattr(settings, 'openai_api_key') and settings.openai_api_key:
             try:
-                self.openai_client = OpenAI(api_key=settings.openai_api_key)
+                self.openai_client = OpenAI(
+                    api_key=settings.openai_api_key,
+                    http_client=http_clients.get_client(OPENAI),
+                    max_retries=0
+                )
+                self.async_openai_client = AsyncOpenAI(
+                    api_key=settings.openai_api_key,
+                    http_client=http_clients.get_async_client(OPENAI),
+                    max_retries=0
+                )
                 logger.info("🤖 OpenAI client initialized")
             except Exception as e:
                 logger.warning(f"OpenAI initialization failed: {e}")
@@ -266,7 +708,16 @@ class IntelligentLLMRouter:
         # Anthropic
         if hasattr(settings, 'anthropic_api_key') and settings.anthropic_api_key:
             try:
-                self.anthropic_client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+                self.anthropic_client = anthropic.Anthropic(
+                    api_key=settings.anthropic_api_key,
+                    http_client=http_clients.get_client(ANTHROPIC),
+                    max_retries=0
+                )
+                self.async_anthropic_client = anthropic.AsyncAnthropic(
+                    api_key=settings.anthropic_api_key,
+                    http_client=http_clients.get_async_client(ANTHROPIC),
+                    max_retries=0
+                )
                 logger.info("🧠 Anthropic client initialized") 
             except Exception as e:
                 logger.warning(f"Anthropic initialization failed: {e}")
@@ -276,7 +727,8 @@ class IntelligentLLMRouter:
         prompt: str, 
         context: Optional[str] = None,
         max_budget: Optional[Decimal] = None,
-        preferred_quality: str = "balanced"  # "fast", "balanced", "premium"
+        preferred_quality: str = "balanced",  # "fast", "balanced", "premium"
+        complexity: Optional[ComplexityLevel] = None
     ) -> RoutingDecision:
         """
         🎯 Make intelligent routing decision
@@ -286,18 +738,75 @@ class IntelligentLLMRouter:
             context: Optional context
             max_budget: Maximum cost user wants to spend
             preferred_quality: User's quality preference
+            complexity: Already known complexity (e.g. from route_many), skips analysis
             
         Returns:
             RoutingDecision: Where to route the request
         """
         # Analyze complexity
-        complexity = self.complexity_analyzer.analyze_complexity(prompt, context)
+        if complexity is None:
+            complexity = self.complexity_analyzer.analyze_complexity(prompt, context)
+        
+        return self._select_route(complexity, prompt, max_budget, preferred_quality)
+    
+    def route_many(
+        self,
+        prompts: List[str],
+        max_budget: Optional[Decimal] = None,
+        preferred_quality: str = "balanced",
+        contexts: Optional[List[Optional[str]]] = None,
+        use_llm: bool = True
+    ) -> List[RoutingDecision]:
+        """
+        🗺️ Route a whole crew's tasks in one pass
         
-        # Estimate token usage (rough approximation)
-        estimated_tokens = len(prompt.split()) * 1.3  # Words to tokens ratio
+        Complexity analysis is batched (one Ollama classification call for
+        all ambiguous prompts) instead of one round trip per task.
+        
+        Args:
+            prompts: Task prompts, in execution order
+            max_budget: Maximum cost per task
+            preferred_quality: User's quality preference
+            contexts: Optional context per prompt
+            use_llm: False to route without any provider call (dry runs)
+            
+        Returns:
+            List[RoutingDecision]: One routing decision per prompt, in order
+        """
+        complexities = self.complexity_analyzer.analyze_many(prompts, contexts, use_llm=use_llm)
+        
+        return [
+            self._select_route(complexity, prompt, max_budget, preferred_quality)
+            for prompt, complexity in zip(prompts, complexities)
+        ]
+    
+    async def aroute_request(
+        self, 
+        prompt: str, 
+        context: Optional[str] = None,
+        max_budget: Optional[Decimal] = None,
+        preferred_quality: str = "balanced"
+    ) -> RoutingDecision:
+        """Async variant of route_request()"""
+        complexity = await self.complexity_analyzer.aanalyze_complexity(prompt, context)
+        
+        return self._select_route(complexity, prompt, max_budget, preferred_quality)
+    
+    def _select_route(
+        self,
+        complexity: ComplexityLevel,
+        prompt: str,
+        max_budget: Optional[Decimal],
+        preferred_quality: str
+    ) -> RoutingDecision:
+        """Pick the best routing option for an already analyzed prompt"""
+        # Estimate token usage: real prompt tokens plus the expected completion
+        estimated_tokens = self.count_tokens(prompt) + settings.expected_output_tokens
         
         # Generate routing options
         options = self._generate_routing_options(complexity, estimated_tokens, preferred_quality)
+        options = self._rank_by_provider_health(options)
+        options = self._rank_by_rate_limits(options, estimated_tokens)
         
         # Filter by budget if specified
         if max_budget:
@@ -307,8 +816,9 @@ class IntelligentLLMRouter:
             # Fallback to cheapest option
             options = [self._create_fallback_option(complexity, estimated_tokens)]
         
-        # Select best option (first is highest priority)
+        # Select best option (first is highest priority), keep the rest for failover
         selected = options[0]
+        selected.fallbacks = options[1:]
         
         logger.info(f"🎯 Routing decision: {selected.provider.value} for {complexity.value} task")
         
@@ -321,6 +831,9 @@ class IntelligentLLMRouter:
         preferred_quality: str
     ) -> List[RoutingDecision]:
         """Generate prioritized routing options"""
+        if self.fake_llm:
+            return [self._create_fake_option(complexity, estimated_tokens)]
+        
         options = []
         
         if complexity == ComplexityLevel.SIMPLE:
@@ -337,7 +850,7 @@ class IntelligentLLMRouter:
             
             # Backup: GPT-3.5
             if self.openai_client:
-                cost = (estimated_tokens / 1000) * self.pricing[LLMProvider.OPENAI_GPT_35]
+                cost = token_cost(estimated_tokens, self.pricing[LLMProvider.OPENAI_GPT_35])
                 options.append(RoutingDecision(
                     provider=LLMProvider.OPENAI_GPT_35,
                     model="gpt-3.5-turbo",
@@ -361,7 +874,7 @@ class IntelligentLLMRouter:
             
             # GPT-3.5 is sweet spot for medium tasks
             if self.openai_client:
-                cost = (estimated_tokens / 1000) * self.pricing[LLMProvider.OPENAI_GPT_35]
+                cost = token_cost(estimated_tokens, self.pricing[LLMProvider.OPENAI_GPT_35])
                 options.append(RoutingDecision(
                     provider=LLMProvider.OPENAI_GPT_35,
                     model="gpt-3.5-turbo",
@@ -374,7 +887,7 @@ class IntelligentLLMRouter:
         elif complexity == ComplexityLevel.COMPLEX:
             # GPT-4 for complex reasoning
             if self.openai_client:
-                cost = (estimated_tokens / 1000) * self.pricing[LLMProvider.OPENAI_GPT_4]
+                cost = token_cost(estimated_tokens, self.pricing[LLMProvider.OPENAI_GPT_4])
                 options.append(RoutingDecision(
                     provider=LLMProvider.OPENAI_GPT_4,
                     model="gpt-4",
@@ -386,7 +899,7 @@ class IntelligentLLMRouter:
             
             # Claude as alternative
             if self.anthropic_client:
-                cost = (estimated_tokens / 1000) * self.pricing[LLMProvider.ANTHROPIC_CLAUDE]
+                cost = token_cost(estimated_tokens, self.pricing[LLMProvider.ANTHROPIC_CLAUDE])
                 options.append(RoutingDecision(
                     provider=LLMProvider.ANTHROPIC_CLAUDE,
                     model="claude-3-haiku-20240307",
@@ -396,11 +909,92 @@ class IntelligentLLMRouter:
                     confidence=0.9
                 ))
         
-        return options
+        return self._apply_ollama_spillover(options)
+    
+    def _apply_ollama_spillover(self, options: List[RoutingDecision]) -> List[RoutingDecision]:
+        """
+        Move Ollama behind the paid options while its queue is backed up
+        
+        Ollama stays in the list as the last fallback, so when the budget
+        filter removes the paid options the request still goes local.
+        """
+        if len(options) < 2 or options[0].provider != LLMProvider.OLLAMA_MISTRAL:
+            return options
+        
+        estimated_wait = self.ollama_queue.estimated_wait()
+        if estimated_wait <= settings.ollama_queue_latency_target_seconds:
+            return options
+        
+        logger.info(
+            f"🚪 Ollama queue wait ~{estimated_wait:.1f}s exceeds "
+            f"{settings.ollama_queue_latency_target_seconds}s target, spilling over"
+        )
+        return options[1:] + options[:1]
+    
+    def _rank_by_provider_health(self, options: List[RoutingDecision]) -> List[RoutingDecision]:
+        """Skip providers with an open circuit and demote degraded ones"""
+        available = [
+            opt for opt in options
+            if self.health_tracker.is_available(opt.provider.value)
+        ]
+        
+        skipped = len(options) - len(available)
+        if skipped:
+            logger.warning(f"⚡ Skipping {skipped} routing option(s) with open circuit")
+        
+        # Stable sort keeps the static priority among equally healthy options
+        return sorted(available, key=lambda opt: self.health_tracker.is_degraded(opt.provider.value))
+    
+    def _rank_by_rate_limits(self, options: List[RoutingDecision], estimated_tokens: int) -> List[RoutingDecision]:
+        """Demote options whose RPM / TPM buckets are currently exhausted"""
+        return sorted(
+            options,
+            key=lambda opt: self.rate_limiter.is_saturated(opt.provider.value, opt.model, estimated_tokens)
+        )
+    
+    def get_rate_limits(self) -> Dict[str, Dict[str, float]]:
+        """Remaining rate limit capacity per configured provider / model"""
+        return self.rate_limiter.snapshot()
+    
+    def get_ollama_queue_stats(self) -> Dict[str, Any]:
+        """Ollama admission queue depth and wait-time metrics"""
+        return self.ollama_queue.snapshot()
+    
+    def get_provider_health(self) -> Dict[str, Dict[str, Any]]:
+        """Current health snapshot for every provider seen so far"""
+        return self.health_tracker.snapshot()
+    
+    def _create_fake_option(self, complexity: ComplexityLevel, estimated_tokens: float) -> RoutingDecision:
+        """Routing option for the offline fake provider"""
+        return RoutingDecision(
+            provider=LLMProvider.FAKE,
+            model="fake-llm",
+            estimated_cost=token_cost(estimated_tokens, self.pricing[LLMProvider.FAKE]),
+            reasoning="Fake LLM provider enabled",
+            complexity=complexity,
+            confidence=1.0
+        )
+    
+    def local_option(self, complexity: ComplexityLevel = ComplexityLevel.SIMPLE) -> Optional[RoutingDecision]:
+        """Free local option (fake provider or a reachable Ollama) for background work, None without one"""
+        if self.fake_llm:
+            return self._create_fake_option(complexity, 0)
+        if self.ollama_client and self.complexity_analyzer.ollama_available:
+            return RoutingDecision(
+                provider=LLMProvider.OLLAMA_MISTRAL,
+                model="mistral:7b-instruct",
+                estimated_cost=Decimal("0.0000"),
+                reasoning="Background work on the free local model",
+                complexity=complexity,
+                confidence=0.9
+            )
+        return None
     
     def _create_fallback_option(self, complexity: ComplexityLevel, estimated_tokens: float) -> RoutingDecision:
         """Create fallback option when no suitable routes found"""
-        if self.ollama_client:
+        if self.fake_llm:
+            return self._create_fake_option(complexity, estimated_tokens)
+        elif self.ollama_client:
             return RoutingDecision(
                 provider=LLMProvider.OLLAMA_MISTRAL,
                 model="mistral:7b-instruct",
@@ -416,6 +1010,10 @@ class IntelligentLLMRouter:
         """
         🚀 Execute the LLM request using the routed provider
         
+        On error or timeout the request transparently fails over to the next
+        ranked option in decision.fallbacks. Every provider tried is recorded
+        in ExecutionResult.attempts.
+        
         Args:
             decision: Routing decision from route_request()
             prompt: The actual prompt to execute
@@ -424,47 +1022,796 @@ class IntelligentLLMRouter:
         Returns:
             ExecutionResult: Result with tracking data
         """
+        options = [decision] + decision.fallbacks
+        attempts = []
+        index = 0
+        
+        while index < len(options):
+            option = options[index]
+            backup = options[index + 1] if index + 1 < len(options) else None
+            hedge_delay = self._hedge_delay(option, backup)
+            
+            if hedge_delay is None:
+                ran = [(option, self._execute_option(option, prompt, **kwargs))]
+            else:
+                ran = self._execute_hedged(option, backup, hedge_delay, prompt, **kwargs)
+            
+            index += len(ran)
+            result = self._record_attempts(ran, attempts)
+            if result.success:
+                break
+            logger.warning(f"↪️ {option.provider.value} failed, trying next option")
+        
+        result.attempts = attempts
+        return result
+    
+    def _hedge_delay(self, option: RoutingDecision, backup: Optional[RoutingDecision]) -> Optional[float]:
+        """Seconds to wait on option before hedging to backup, None when not hedging"""
+        if not settings.llm_hedging_enabled or backup is None:
+            return None
+        
+        threshold = self.health_tracker.latency_percentile(
+            option.provider.value,
+            settings.llm_hedge_percentile,
+            min_samples=settings.llm_hedge_min_samples
+        )
+        if threshold is None:
+            return None
+        return max(threshold, settings.llm_hedge_min_delay_seconds)
+    
+    def _execute_hedged(
+        self,
+        option: RoutingDecision,
+        backup: RoutingDecision,
+        hedge_delay: float,
+        prompt: str,
+        **kwargs
+    ) -> List[Tuple[RoutingDecision, ExecutionResult]]:
+        """
+        Run option, racing it against backup once it is slower than hedge_delay
+        
+        Threads can't be cancelled, so a losing sync call runs to completion in
+        the background and its answer is discarded (it still fills the cache).
+        
+        Returns:
+            The options that finished, in completion order
+        """
+        started = threading.Event()
+        
+        def run_primary() -> ExecutionResult:
+            started.set()
+            return self._execute_option(option, prompt, **kwargs)
+        
+        primary = self._hedge_executor.submit(run_primary)
+        # Time spent queued for a pool thread doesn't count toward the hedge delay
+        started.wait()
+        try:
+            return [(option, primary.result(timeout=hedge_delay))]
+        except FuturesTimeoutError:
+            pass
+        
+        logger.info(f"🏁 {option.provider.value} slower than {hedge_delay:.1f}s, hedging to {backup.provider.value}")
+        hedge = self._hedge_executor.submit(self._execute_option, backup, prompt, **kwargs)
+        racing = {primary: option, hedge: backup}
+        
+        ran = []
+        for future in as_completed(racing):
+            ran.append((racing[future], future.result()))
+            if ran[-1][1].success:
+                break
+        return ran
+    
+    def _record_attempts(
+        self,
+        ran: List[Tuple[RoutingDecision, ExecutionResult]],
+        attempts: List[Dict[str, Any]]
+    ) -> ExecutionResult:
+        """Append finished options to attempts and return the winning (or last) result"""
+        for option, result in ran:
+            attempts.append(self._describe_attempt(option, result))
+        
+        return next((result for _, result in ran if result.success), ran[-1][1])
+    
+    def _execute_option(self, decision: RoutingDecision, prompt: str, **kwargs) -> ExecutionResult:
+        """Execute a single routing option (cache, circuit breaker, provider call)"""
+        cache_key = make_cache_key(decision.provider.value, decision.model, prompt, kwargs)
+        cached_result = self._get_cached_result(decision, cache_key)
+        if cached_result:
+            return cached_result
+        
+        # Reserve quota first; a saturated provider fails over to the next option
+        reserved_tokens = self.count_tokens(prompt, decision.model) + settings.expected_output_tokens
+        if not self.rate_limiter.try_acquire(decision.provider.value, decision.model, reserved_tokens):
+            return self._build_rate_limited_result(decision)
+        
+        if not self.health_tracker.allow_request(decision.provider.value):
+            self.rate_limiter.release(decision.provider.value, decision.model, reserved_tokens)
+            return self._build_circuit_open_result(decision)
+        
         start_time = time.time()
+        led = []
+        
+        def call_provider() -> Dict[str, Any]:
+            led.append(True)
+            result = self.retry_policy.call(self._reserve_per_attempt(
+                decision, reserved_tokens, lambda: self._call_provider(decision, prompt, **kwargs)
+            ))
+            self._store_cached_result(cache_key, result)
+            return result
         
         try:
-            if decision.provider == LLMProvider.OLLAMA_MISTRAL:
-                result = self._execute_ollama(decision.model, prompt, **kwargs)
-            elif decision.provider == LLMProvider.OPENAI_GPT_35:
-                result = self._execute_openai(decision.model, prompt, **kwargs)
-            elif decision.provider == LLMProvider.OPENAI_GPT_4:
-                result = self._execute_openai(decision.model, prompt, **kwargs)
-            elif decision.provider == LLMProvider.ANTHROPIC_CLAUDE:
-                result = self._execute_anthropic(decision.model, prompt, **kwargs)
+            result, shared = self._inflight.do(cache_key, call_provider)
+            if shared:
+                # Piggybacked on another caller's request, nothing was sent
+                self.rate_limiter.release(decision.provider.value, decision.model, reserved_tokens)
+            return self._build_success_result(decision, result, start_time, coalesced=shared)
+            
+        except RateLimitExceeded:
+            # Retries used up the quota; fail over without blaming the provider
+            self.health_tracker.release_probe(decision.provider.value)
+            return self._build_rate_limited_result(decision)
+        except Exception as e:
+            return self._build_failure_result(decision, e, start_time, record_health=bool(led))
+    
+    def execute_metered(
+        self,
+        decision: RoutingDecision,
+        prompt: str,
+        max_cost: Optional[Decimal],
+        **kwargs
+    ) -> ExecutionResult:
+        """
+        💸 Execute the request without spending more than max_cost
+        
+        Fails over like execute_request, but priced providers are streamed and
+        metered so a generation is cut off at the limit: the result then has
+        truncated=True, the partial content and the cost of what was
+        generated. Spend on failed attempts counts against the limit and is
+        included in actual_cost. Options get the same response cache, retries
+        and single-flight as execute_request, but no hedging: a racing
+        duplicate call would double the spend.
+        
+        Args:
+            decision: Routing decision from route_request()
+            prompt: The actual prompt to execute
+            max_cost: Spend limit for the request (None behaves like execute_request)
+            **kwargs: Additional parameters for the LLM
+            
+        Returns:
+            ExecutionResult: Result with tracking data
+        """
+        if max_cost is None:
+            return self.execute_request(decision, prompt, **kwargs)
+        
+        attempts = []
+        spent = Decimal("0.0000")
+        
+        for option in [decision] + decision.fallbacks:
+            remaining = max_cost - spent
+            if self.pricing[option.provider] > 0:
+                result = self._execute_streamed(option, prompt, remaining, **kwargs)
             else:
-                raise ValueError(f"Unknown provider: {decision.provider}")
+                result = self._execute_option(option, prompt, **kwargs)
             
-            duration = time.time() - start_time
+            attempts.append(self._describe_attempt(option, result))
+            if result.success:
+                result.actual_cost += spent
+                break
+            spent += result.actual_cost
+            logger.warning(f"↪️ {option.provider.value} failed, trying next option")
+        else:
+            result.actual_cost = spent
+        
+        result.attempts = attempts
+        return result
+    
+    def _execute_streamed(
+        self,
+        decision: RoutingDecision,
+        prompt: str,
+        max_cost: Decimal,
+        **kwargs
+    ) -> ExecutionResult:
+        """
+        Execute one option by consuming its metered stream
+        
+        Goes through the response cache like _execute_option, and identical
+        concurrent calls under the same limit share one metered stream.
+        """
+        cache_key = make_cache_key(decision.provider.value, decision.model, prompt, kwargs)
+        cached_result = self._get_cached_result(decision, cache_key)
+        if cached_result:
+            return cached_result
+        
+        start_time = time.time()
+        
+        def consume_stream() -> ExecutionResult:
+            pieces = []
+            for chunk in self.stream_request(decision, prompt, max_cost=max_cost, **kwargs):
+                if not chunk.done:
+                    pieces.append(chunk.content)
+                    continue
+                
+                content = "".join(pieces)
+                if chunk.error is None and not chunk.truncated:
+                    self._store_cached_result(cache_key, {'content': content, 'tokens': chunk.tokens})
+                
+                return ExecutionResult(
+                    content=content,
+                    provider=decision.provider,
+                    actual_tokens=chunk.tokens,
+                    actual_cost=chunk.cost,
+                    duration_seconds=time.time() - start_time,
+                    success=chunk.error is None,
+                    error=chunk.error,
+                    truncated=chunk.truncated
+                )
+        
+        # A truncated answer is only valid for the same limit, keep it in the key
+        result, shared = self._inflight.do(f"{cache_key}:max_cost={max_cost}", consume_stream)
+        if shared:
+            # The leader is billed for the call
+            return replace(
+                result,
+                actual_cost=Decimal("0.0000"),
+                duration_seconds=time.time() - start_time,
+                coalesced=True
+            )
+        return result
+    
+    def _call_provider(self, decision: RoutingDecision, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Dispatch one raw provider call"""
+        if decision.provider == LLMProvider.FAKE:
+            return self.fake_llm.complete(prompt, **kwargs)
+        elif decision.provider == LLMProvider.OLLAMA_MISTRAL:
+            with self.ollama_queue.slot():
+                return self._execute_ollama(decision.model, prompt, **kwargs)
+        elif decision.provider == LLMProvider.OPENAI_GPT_35:
+            return self._execute_openai(decision.model, prompt, **kwargs)
+        elif decision.provider == LLMProvider.OPENAI_GPT_4:
+            return self._execute_openai(decision.model, prompt, **kwargs)
+        elif decision.provider == LLMProvider.ANTHROPIC_CLAUDE:
+            return self._execute_anthropic(decision.model, prompt, **kwargs)
+        else:
+            raise ValueError(f"Unknown provider: {decision.provider}")
+    
+    async def aexecute_request(self, decision: RoutingDecision, prompt: str, **kwargs) -> ExecutionResult:
+        """
+        Async variant of execute_request()
+        
+        Uses httpx.AsyncClient / AsyncOpenAI / AsyncAnthropic so that a single
+        worker can keep many provider calls in flight without tying up threads.
+        """
+        options = [decision] + decision.fallbacks
+        attempts = []
+        index = 0
+        
+        while index < len(options):
+            option = options[index]
+            backup = options[index + 1] if index + 1 < len(options) else None
+            hedge_delay = self._hedge_delay(option, backup)
             
-            # Calculate actual cost
-            actual_cost = (result['tokens'] / 1000) * self.pricing[decision.provider]
+            if hedge_delay is None:
+                ran = [(option, await self._aexecute_option(option, prompt, **kwargs))]
+            else:
+                ran = await self._aexecute_hedged(option, backup, hedge_delay, prompt, **kwargs)
             
-            return ExecutionResult(
-                content=result['content'],
+            index += len(ran)
+            result = self._record_attempts(ran, attempts)
+            if result.success:
+                break
+            logger.warning(f"↪️ {option.provider.value} failed, trying next option")
+        
+        result.attempts = attempts
+        return result
+    
+    async def _aexecute_hedged(
+        self,
+        option: RoutingDecision,
+        backup: RoutingDecision,
+        hedge_delay: float,
+        prompt: str,
+        **kwargs
+    ) -> List[Tuple[RoutingDecision, ExecutionResult]]:
+        """Async variant of _execute_hedged(); the losing request is cancelled"""
+        primary = asyncio.ensure_future(self._aexecute_option(option, prompt, **kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done:
+            return [(option, primary.result())]
+        
+        logger.info(f"🏁 {option.provider.value} slower than {hedge_delay:.1f}s, hedging to {backup.provider.value}")
+        hedge = asyncio.ensure_future(self._aexecute_option(backup, prompt, **kwargs))
+        racing = {primary: option, hedge: backup}
+        
+        ran = []
+        try:
+            while racing:
+                done, _ = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    ran.append((racing.pop(task), task.result()))
+                if any(result.success for _, result in ran):
+                    break
+        finally:
+            for task in racing:
+                task.cancel()
+        return ran
+    
+    async def _aexecute_option(self, decision: RoutingDecision, prompt: str, **kwargs) -> ExecutionResult:
+        """Async variant of _execute_option()"""
+        cache_key = make_cache_key(decision.provider.value, decision.model, prompt, kwargs)
+        cached_result = self._get_cached_result(decision, cache_key)
+        if cached_result:
+            return cached_result
+        
+        # Reserve quota first; a saturated provider fails over to the next option
+        reserved_tokens = self.count_tokens(prompt, decision.model) + settings.expected_output_tokens
+        if not self.rate_limiter.try_acquire(decision.provider.value, decision.model, reserved_tokens):
+            return self._build_rate_limited_result(decision)
+        
+        if not self.health_tracker.allow_request(decision.provider.value):
+            self.rate_limiter.release(decision.provider.value, decision.model, reserved_tokens)
+            return self._build_circuit_open_result(decision)
+        
+        start_time = time.time()
+        led = []
+        
+        async def call_provider() -> Dict[str, Any]:
+            led.append(True)
+            result = await self.retry_policy.acall(self._reserve_per_attempt(
+                decision, reserved_tokens, lambda: self._acall_provider(decision, prompt, **kwargs)
+            ))
+            self._store_cached_result(cache_key, result)
+            return result
+        
+        try:
+            result, shared = await self._ainflight.do(cache_key, call_provider)
+            if shared:
+                # Piggybacked on another caller's request, nothing was sent
+                self.rate_limiter.release(decision.provider.value, decision.model, reserved_tokens)
+            return self._build_success_result(decision, result, start_time, coalesced=shared)
+            
+        except asyncio.CancelledError:
+            # Lost a hedge race; don't leave a half-open circuit waiting on this probe
+            self.health_tracker.release_probe(decision.provider.value)
+            raise
+        except RateLimitExceeded:
+            self.health_tracker.release_probe(decision.provider.value)
+            return self._build_rate_limited_result(decision)
+        except Exception as e:
+            return self._build_failure_result(decision, e, start_time, record_health=bool(led))
+    
+    def _reserve_per_attempt(self, decision: RoutingDecision, reserved_tokens: int, fn):
+        """
+        Wrap a provider call for the retry policy so every retry takes its own
+        rate limit reservation (the first attempt's is taken by the caller)
+        
+        Raises:
+            RateLimitExceeded: When there is no quota left for a retry
+        """
+        attempts = itertools.count(1)
+        
+        def attempt():
+            if next(attempts) > 1 and not self.rate_limiter.try_acquire(
+                decision.provider.value, decision.model, reserved_tokens
+            ):
+                raise RateLimitExceeded(f"Rate limit reached for {decision.provider.value}")
+            return fn()
+        
+        return attempt
+    
+    async def _acall_provider(self, decision: RoutingDecision, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Async variant of _call_provider()"""
+        if decision.provider == LLMProvider.FAKE:
+            return await self.fake_llm.acomplete(prompt, **kwargs)
+        elif decision.provider == LLMProvider.OLLAMA_MISTRAL:
+            async with self.ollama_queue.aslot():
+                return await self._aexecute_ollama(decision.model, prompt, **kwargs)
+        elif decision.provider in (LLMProvider.OPENAI_GPT_35, LLMProvider.OPENAI_GPT_4):
+            return await self._aexecute_openai(decision.model, prompt, **kwargs)
+        elif decision.provider == LLMProvider.ANTHROPIC_CLAUDE:
+            return await self._aexecute_anthropic(decision.model, prompt, **kwargs)
+        else:
+            raise ValueError(f"Unknown provider: {decision.provider}")
+    
+    @staticmethod
+    def _describe_attempt(decision: RoutingDecision, result: ExecutionResult) -> Dict[str, Any]:
+        """Summary of one provider attempt for ExecutionResult.attempts"""
+        return {
+            "provider": decision.provider.value,
+            "model": decision.model,
+            "success": result.success,
+            "cached": result.cached,
+            "coalesced": result.coalesced,
+            "truncated": result.truncated,
+            "duration_seconds": result.duration_seconds,
+            "error": result.error
+        }
+    
+    def stream_request(
+        self,
+        decision: RoutingDecision,
+        prompt: str,
+        max_cost: Optional[Decimal] = None,
+        **kwargs
+    ) -> Iterator[StreamChunk]:
+        """
+        🌊 Stream the LLM response token chunks as they arrive
+        
+        Each yielded StreamChunk carries the running token count and cost, so
+        callers can meter spend while the generation is in progress. Instead
+        of a total request timeout, the stream only fails when no chunk has
+        arrived for LLM_STREAM_IDLE_TIMEOUT_SECONDS. The last chunk has
+        done=True and reconciles the totals with provider-reported usage.
+        
+        With max_cost, max_tokens is capped at what the budget affords and the
+        provider stream is closed as soon as the metered cost crosses it; the
+        final chunk then has truncated=True and the cost of the tokens
+        generated so far.
+        
+        Args:
+            decision: Routing decision from route_request()
+            prompt: The actual prompt to execute
+            max_cost: Spend limit for this call (None for no limit)
+            **kwargs: Additional parameters for the LLM
+            
+        Yields:
+            StreamChunk: Content pieces followed by a final done chunk
+        """
+        timeout = httpx.Timeout(
+            settings.llm_stream_idle_timeout_seconds,
+            connect=settings.http_connect_timeout_seconds
+        )
+        price = self.pricing[decision.provider]
+        prompt_tokens = self.count_tokens(prompt, decision.model)
+        output_tokens = 0
+        reported_tokens = None
+        pieces = None
+        start_time = time.time()
+        first_chunk_latency = None
+        truncated = False
+        outcome_recorded = False
+        
+        budget_tokens = None
+        if max_cost is not None and price > 0:
+            budget_tokens = int(max_cost / price * 1000)
+            affordable_output = budget_tokens - prompt_tokens
+            if affordable_output <= 0:
+                logger.warning(f"💸 Budget {max_cost} does not cover the prompt for {decision.provider.value}")
+                yield StreamChunk(
+                    content="",
+                    provider=decision.provider,
+                    tokens=0,
+                    cost=Decimal("0.0000"),
+                    done=True,
+                    error=f"Budget {max_cost} does not cover the prompt ({prompt_tokens} tokens)",
+                    truncated=True
+                )
+                return
+            kwargs['max_tokens'] = min(kwargs.get('max_tokens', 2000), affordable_output)
+        
+        reserved_tokens = prompt_tokens + settings.expected_output_tokens
+        if not self.rate_limiter.try_acquire(decision.provider.value, decision.model, reserved_tokens):
+            result = self._build_rate_limited_result(decision)
+        elif not self.health_tracker.allow_request(decision.provider.value):
+            self.rate_limiter.release(decision.provider.value, decision.model, reserved_tokens)
+            result = self._build_circuit_open_result(decision)
+        else:
+            result = None
+        
+        if result is not None:
+            yield StreamChunk(
+                content="",
                 provider=decision.provider,
-                actual_tokens=result['tokens'],
-                actual_cost=actual_cost,
-                duration_seconds=duration,
-                success=True
+                tokens=0,
+                cost=Decimal("0.0000"),
+                done=True,
+                error=result.error
+            )
+            return
+        
+        def open_stream() -> Tuple[Iterator[Tuple[str, Optional[int]]], Optional[Tuple[str, Optional[int]]]]:
+            # Connection errors, 429s and 5xx surface with the first item
+            stream = self._open_stream(decision, prompt, timeout, **kwargs)
+            try:
+                return stream, next(stream, None)
+            except BaseException:
+                stream.close()
+                raise
+        
+        try:
+            # Only the stream start is retried, nothing has been yielded yet
+            pieces, first = self.retry_policy.call(
+                self._reserve_per_attempt(decision, reserved_tokens, open_stream)
             )
             
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"LLM execution failed: {e}")
+            for piece, usage_tokens in itertools.chain([first] if first else [], pieces):
+                if usage_tokens is not None:
+                    reported_tokens = usage_tokens
+                if not piece:
+                    continue
+                
+                if first_chunk_latency is None:
+                    first_chunk_latency = time.time() - start_time
+                output_tokens += self.count_tokens(piece, decision.model)
+                tokens = prompt_tokens + output_tokens
+                yield StreamChunk(
+                    content=piece,
+                    provider=decision.provider,
+                    tokens=tokens,
+                    cost=token_cost(tokens, price)
+                )
+                
+                if budget_tokens is not None and tokens >= budget_tokens:
+                    # Stop paying for output; finally closes the provider stream
+                    logger.warning(f"💸 {decision.provider.value} stream stopped at budget {max_cost} "
+                                   f"after {output_tokens} output tokens")
+                    truncated = True
+                    break
             
-            return ExecutionResult(
+            # Time-to-first-token is the latency signal for streamed calls
+            self.health_tracker.record_success(
+                decision.provider.value,
+                first_chunk_latency if first_chunk_latency is not None else time.time() - start_time
+            )
+            outcome_recorded = True
+            # Usage is only reported at the end, a truncated stream is billed as metered
+            total_tokens = (not truncated and reported_tokens) or (prompt_tokens + output_tokens)
+            yield StreamChunk(
                 content="",
                 provider=decision.provider,
-                actual_tokens=0,
-                actual_cost=Decimal("0.0000"),
-                duration_seconds=duration,
-                success=False,
+                tokens=total_tokens,
+                cost=token_cost(total_tokens, price),
+                done=True,
+                truncated=truncated
+            )
+            
+        except RateLimitExceeded as e:
+            # Retries used up the quota; the probe slot is released in finally
+            yield StreamChunk(
+                content="",
+                provider=decision.provider,
+                tokens=0,
+                cost=Decimal("0.0000"),
+                done=True,
                 error=str(e)
             )
+        except Exception as e:
+            logger.error(f"LLM stream failed: {e}")
+            self.health_tracker.record_failure(decision.provider.value, time.time() - start_time)
+            outcome_recorded = True
+            tokens = prompt_tokens + output_tokens if output_tokens else 0
+            yield StreamChunk(
+                content="",
+                provider=decision.provider,
+                tokens=tokens,
+                cost=token_cost(tokens, price),
+                done=True,
+                error=str(e)
+            )
+        finally:
+            # Closing the provider generator releases the HTTP stream, also
+            # when the caller stops consuming early
+            if pieces is not None:
+                pieces.close()
+            if not outcome_recorded:
+                # Abandoned by the caller: free a claimed half-open probe slot
+                self.health_tracker.release_probe(decision.provider.value)
+    
+    def _open_stream(
+        self, decision: RoutingDecision, prompt: str, timeout: httpx.Timeout, **kwargs
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """Provider stream of (piece, usage_tokens) pairs"""
+        if decision.provider == LLMProvider.FAKE:
+            return self.fake_llm.stream(prompt, **kwargs)
+        elif decision.provider == LLMProvider.OLLAMA_MISTRAL:
+            return self._stream_ollama(decision.model, prompt, timeout, **kwargs)
+        elif decision.provider in (LLMProvider.OPENAI_GPT_35, LLMProvider.OPENAI_GPT_4):
+            return self._stream_openai(decision.model, prompt, timeout, **kwargs)
+        elif decision.provider == LLMProvider.ANTHROPIC_CLAUDE:
+            return self._stream_anthropic(decision.model, prompt, timeout, **kwargs)
+        else:
+            raise ValueError(f"Unknown provider: {decision.provider}")
+    
+    def _stream_ollama(
+        self, model: str, prompt: str, timeout: httpx.Timeout, **kwargs
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """Stream from Ollama's NDJSON /api/generate endpoint"""
+        with self.ollama_queue.slot(), self.ollama_client.stream(
+            'POST',
+            '/api/generate',
+            json={
+                'model': model,
+                'prompt': prompt,
+                'stream': True,
+                'options': kwargs.get('options', {'temperature': 0.7})
+            },
+            timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get('done'):
+                    usage = data.get('prompt_eval_count', 0) + data.get('eval_count', 0)
+                    yield data.get('response', ''), usage or None
+                    break
+                yield data.get('response', ''), None
+    
+    def _stream_openai(
+        self, model: str, prompt: str, timeout: httpx.Timeout, **kwargs
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """Stream chat completion deltas from OpenAI"""
+        stream = self.openai_client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get('temperature', 0.7),
+            max_tokens=kwargs.get('max_tokens', 2000),
+            stream=True,
+            stream_options={"include_usage": True},
+            timeout=timeout
+        )
+        
+        try:
+            for chunk in stream:
+                usage = chunk.usage.total_tokens if getattr(chunk, 'usage', None) else None
+                piece = chunk.choices[0].delta.content if chunk.choices else None
+                yield piece or "", usage
+        finally:
+            stream.close()
+    
+    def _stream_anthropic(
+        self, model: str, prompt: str, timeout: httpx.Timeout, **kwargs
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """Stream text deltas from Anthropic Claude"""
+        with self.anthropic_client.messages.stream(
+            model=model,
+            max_tokens=kwargs.get('max_tokens', 2000),
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get('temperature', 0.7),
+            timeout=timeout
+        ) as stream:
+            for text in stream.text_stream:
+                yield text, None
+            
+            usage = stream.get_final_message().usage
+            yield "", usage.input_tokens + usage.output_tokens
+    
+    def count_tokens(self, text: str, model: Optional[str] = None) -> int:
+        """Count tokens locally with the configured token counter"""
+        return self.token_counter.count(text, model)
+    
+    def _build_circuit_open_result(self, decision: RoutingDecision) -> ExecutionResult:
+        """Fail fast without calling a provider whose circuit is open"""
+        logger.warning(f"⚡ Circuit open for {decision.provider.value}, not calling provider")
+        
+        return ExecutionResult(
+            content="",
+            provider=decision.provider,
+            actual_tokens=0,
+            actual_cost=Decimal("0.0000"),
+            duration_seconds=0.0,
+            success=False,
+            error=f"Circuit open for {decision.provider.value}"
+        )
+    
+    def _build_rate_limited_result(self, decision: RoutingDecision) -> ExecutionResult:
+        """Fail fast without calling a provider whose rate limit is exhausted"""
+        logger.warning(f"🚦 Rate limit reached for {decision.provider.value} ({decision.model}), not calling provider")
+        
+        return ExecutionResult(
+            content="",
+            provider=decision.provider,
+            actual_tokens=0,
+            actual_cost=Decimal("0.0000"),
+            duration_seconds=0.0,
+            success=False,
+            error=f"Rate limit reached for {decision.provider.value}"
+        )
+    
+    def _get_cached_result(self, decision: RoutingDecision, cache_key: str) -> Optional[ExecutionResult]:
+        """Return a zero-cost, zero-latency result on a cache hit"""
+        if self.response_cache is None:
+            return None
+        
+        try:
+            cached = self.response_cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            cached = None
+        
+        with self._cache_stats_lock:
+            self.cache_stats["hits" if cached else "misses"] += 1
+        
+        if not cached:
+            return None
+        
+        logger.info(f"💾 Cache hit for {decision.provider.value}")
+        
+        return ExecutionResult(
+            content=cached['content'],
+            provider=decision.provider,
+            actual_tokens=cached['tokens'],
+            actual_cost=Decimal("0.0000"),
+            duration_seconds=0.0,
+            success=True,
+            cached=True
+        )
+    
+    def _store_cached_result(self, cache_key: str, result: Dict[str, Any]):
+        """Remember a successful provider result"""
+        if self.response_cache is None:
+            return
+        
+        try:
+            self.response_cache.set(cache_key, {'content': result['content'], 'tokens': result['tokens']})
+        except Exception as e:
+            logger.warning(f"Response cache store failed: {e}")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the response cache"""
+        with self._cache_stats_lock:
+            hits = self.cache_stats["hits"]
+            misses = self.cache_stats["misses"]
+        
+        total = hits + misses
+        return {
+            "enabled": self.response_cache is not None,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0
+        }
+    
+    def _build_success_result(
+        self,
+        decision: RoutingDecision,
+        result: Dict[str, Any],
+        start_time: float,
+        coalesced: bool = False
+    ) -> ExecutionResult:
+        """Turn a raw provider result into a tracked ExecutionResult"""
+        duration = time.time() - start_time
+        
+        if coalesced:
+            # The leader already recorded health and is billed for the call
+            actual_cost = Decimal("0.0000")
+        else:
+            self.health_tracker.record_success(decision.provider.value, duration)
+            actual_cost = token_cost(result['tokens'], self.pricing[decision.provider])
+        
+        return ExecutionResult(
+            content=result['content'],
+            provider=decision.provider,
+            actual_tokens=result['tokens'],
+            actual_cost=actual_cost,
+            duration_seconds=duration,
+            success=True,
+            coalesced=coalesced
+        )
+    
+    def _build_failure_result(
+        self,
+        decision: RoutingDecision,
+        error: Exception,
+        start_time: float,
+        record_health: bool = True
+    ) -> ExecutionResult:
+        """Build the ExecutionResult reported for a failed provider call"""
+        duration = time.time() - start_time
+        if record_health:
+            self.health_tracker.record_failure(decision.provider.value, duration)
+        logger.error(f"LLM execution failed: {error}")
+        
+        return ExecutionResult(
+            content="",
+            provider=decision.provider,
+            actual_tokens=0,
+            actual_cost=Decimal("0.0000"),
+            duration_seconds=duration,
+            success=False,
+            error=str(error)
+        )
     
     def _execute_ollama(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
         """Execute request using Ollama (FREE!)"""
@@ -473,6 +1820,7 @@ class IntelligentLLMRouter:
             json={
                 'model': model,
                 'prompt': prompt,
+                'stream': False,
                 'options': kwargs.get('options', {'temperature': 0.7})
             },
             timeout=10.0
@@ -480,13 +1828,7 @@ class IntelligentLLMRouter:
         
         response.raise_for_status() # Raise an exception for HTTP errors
         
-        # Estimate tokens (Ollama doesn't provide exact count)
-        estimated_tokens = len(response.json()['response'].split()) * 1.3
-        
-        return {
-            'content': response.json()['response'],
-            'tokens': int(estimated_tokens)
-        }
+        return self._parse_ollama_response(model, prompt, response.json())
     
     def _execute_openai(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
         """Execute request using OpenAI"""
@@ -517,6 +1859,65 @@ class IntelligentLLMRouter:
         }
 
 
+    async def _aexecute_ollama(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Execute request using Ollama without blocking the event loop"""
+        response = await self.async_ollama_client.post(
+            '/api/generate',
+            json={
+                'model': model,
+                'prompt': prompt,
+                'stream': False,
+                'options': kwargs.get('options', {'temperature': 0.7})
+            },
+            timeout=10.0
+        )
+        
+        response.raise_for_status()
+        
+        return self._parse_ollama_response(model, prompt, response.json())
+    
+    def _parse_ollama_response(self, model: str, prompt: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract content and input + output token usage from an Ollama reply"""
+        content = data['response']
+        
+        # Ollama reports eval counts; count locally when they are missing
+        prompt_tokens = data.get('prompt_eval_count') or self.count_tokens(prompt, model)
+        output_tokens = data.get('eval_count') or self.count_tokens(content, model)
+        
+        return {
+            'content': content,
+            'tokens': prompt_tokens + output_tokens
+        }
+    
+    async def _aexecute_openai(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Execute request using AsyncOpenAI"""
+        response = await self.async_openai_client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get('temperature', 0.7),
+            max_tokens=kwargs.get('max_tokens', 2000)
+        )
+        
+        return {
+            'content': response.choices[0].message.content,
+            'tokens': response.usage.total_tokens
+        }
+    
+    async def _aexecute_anthropic(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Execute request using AsyncAnthropic"""
+        response = await self.async_anthropic_client.messages.create(
+            model=model,
+            max_tokens=kwargs.get('max_tokens', 2000),
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get('temperature', 0.7)
+        )
+        
+        return {
+            'content': response.content[0].text,
+            'tokens': response.usage.input_tokens + response.usage.output_tokens
+        }
+
+
 # Global router instance
 _router_instance = None
 
@@ -0,0 +1,198 @@
+"""
+💾 LLM Response Cache - Skip provider calls for repeated prompts
+
+Team templates produce many near-identical role prompts and teams are
+re-run with the same inputs, so identical routed requests are common.
+This module provides pluggable response caches that sit in front of
+IntelligentLLMRouter.execute_request():
+
+- InMemoryLRUCache: bounded LRU with TTL (default)
+- SQLiteResponseCache: optional on-disk cache shared across restarts
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def make_cache_key(provider: str, model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a stable cache key for a routed LLM call
+
+    Args:
+        provider: Provider identifier (LLMProvider value)
+        model: Model name
+        prompt: Prompt text (whitespace is normalized before hashing)
+        params: Sampling parameters (temperature, max_tokens, options...)
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    normalized_prompt = _WHITESPACE_RE.sub(" ", prompt).strip()
+    prompt_hash = hashlib.sha256(normalized_prompt.encode("utf-8")).hexdigest()
+    params_blob = json.dumps(params or {}, sort_keys=True, default=str)
+
+    key_material = f"{provider}|{model}|{prompt_hash}|{params_blob}"
+    return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Base class for response cache backends"""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for key, or None on a miss"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry under key"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        raise NotImplementedError
+
+
+class InMemoryLRUCache(ResponseCache):
+    """Thread-safe in-process LRU cache with per-entry TTL"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk cache backed by SQLite, survives process restarts"""
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = 3600.0, max_entries: int = 100_000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, value, expires_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now)
+            )
+            # Keep the table bounded: evict the oldest rows past the limit
+            self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE key IN ("
+                " SELECT key FROM llm_response_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._conn.commit()
+
+
+def create_response_cache(backend: str, **options) -> Optional[ResponseCache]:
+    """
+    Build a response cache for the configured backend
+
+    Args:
+        backend: "memory", "sqlite" or "none"
+        **options: max_entries, ttl_seconds and (for sqlite) path
+
+    Returns:
+        ResponseCache or None when caching is disabled
+    """
+    backend = (backend or "none").lower()
+
+    if backend == "memory":
+        return InMemoryLRUCache(
+            max_entries=options.get("max_entries", 1024),
+            ttl_seconds=options.get("ttl_seconds", 3600.0)
+        )
+    if backend == "sqlite":
+        try:
+            return SQLiteResponseCache(
+                path=options.get("path", "llm_cache.sqlite3"),
+                ttl_seconds=options.get("ttl_seconds", 3600.0),
+                max_entries=options.get("max_entries", 100_000)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ SQLite response cache unavailable, falling back to memory: {e}")
+            return InMemoryLRUCache(
+                max_entries=options.get("max_entries", 1024),
+                ttl_seconds=options.get("ttl_seconds", 3600.0)
+            )
+    if backend != "none":
+        logger.warning(f"⚠️ Unknown LLM cache backend '{backend}', caching disabled")
+    return None
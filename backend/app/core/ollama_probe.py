@@ -0,0 +1,74 @@
+"""
+📡 Ollama Availability Probe - Background, non-blocking health polling
+
+Polls the configured Ollama host on a daemon thread so that no request
+ever waits on an availability check, and an Ollama instance that comes
+up after boot is picked up without restarting the API.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaAvailabilityProbe:
+    """Periodically checks GET {host}/api/version in the background"""
+
+    def __init__(
+        self,
+        host: str,
+        interval_seconds: float = 30.0,
+        timeout_seconds: float = 2.0,
+        client: Optional[httpx.Client] = None
+    ):
+        self.host = host.rstrip('/')
+        self.client = client
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.available = False
+        self.last_checked_at: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start polling on a daemon thread (returns immediately)"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ollama-probe", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stop_event.set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.check()
+            self._stop_event.wait(self.interval_seconds)
+
+    def check(self) -> bool:
+        """Probe Ollama once and update the availability flag"""
+        try:
+            get = self.client.get if self.client is not None else httpx.get
+            response = get(f"{self.host}/api/version", timeout=self.timeout_seconds)
+            available = response.status_code == 200
+        except Exception as e:
+            logger.debug(f"Ollama probe failed: {e}")
+            available = False
+
+        # Only log transitions to keep the logs quiet
+        if available and not self.available:
+            logger.info(f"🧠 Ollama HTTP API available at {self.host}")
+        elif not available and (self.available or self.last_checked_at is None):
+            logger.warning(f"⚠️ Ollama not available at {self.host}")
+
+        self.available = available
+        self.last_checked_at = time.time()
+        return available
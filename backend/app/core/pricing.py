@@ -0,0 +1,13 @@
+"""
+💲 Token Pricing - Cost of token counts at per-1K-token prices
+
+Shared by the router's live metering and the execution estimator, so
+estimates and real charges use the same arithmetic.
+"""
+
+from decimal import Decimal
+
+
+def token_cost(tokens: float, price_per_1k: Decimal) -> Decimal:
+    """Cost of a token count at a per-1K-token price, in exact Decimal arithmetic"""
+    return (Decimal(str(tokens)) / 1000) * price_per_1k
@@ -0,0 +1,196 @@
+"""
+🩺 Provider Health Tracking - Latency-aware circuit breaking for LLM providers
+
+Keeps per-provider EWMA latency and error rate plus a classic
+closed / open / half-open circuit breaker, so the router can skip
+providers that are failing and demote the ones that are slow.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values, percentile: float) -> float:
+    """Nearest-rank percentile (0-1) of a non-empty collection"""
+    samples = sorted(values)
+    return samples[min(len(samples) - 1, int(percentile * len(samples)))]
+
+
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # Healthy, requests flow normally
+    OPEN = "open"            # Failing, requests are skipped
+    HALF_OPEN = "half_open"  # Cooling down, one probe request allowed
+
+
+@dataclass
+class ProviderHealth:
+    """Rolling health statistics for one provider"""
+    ewma_latency: Optional[float] = None
+    error_rate: float = 0.0  # EWMA of failures (1.0 = every call fails)
+    consecutive_failures: int = 0
+    total_requests: int = 0
+    total_failures: int = 0
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: Optional[float] = None
+    probe_in_flight: bool = False
+    latencies: deque = field(default_factory=lambda: deque(maxlen=200))  # Recent successful call latencies
+
+
+class ProviderHealthTracker:
+    """Thread-safe health tracker and circuit breaker keyed by provider"""
+
+    def __init__(
+        self,
+        ewma_alpha: float = 0.2,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        min_requests: int = 10,
+        reset_timeout_seconds: float = 30.0,
+        slow_latency_seconds: float = 20.0,
+        latency_window: int = 200
+    ):
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_requests = min_requests
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.slow_latency_seconds = slow_latency_seconds
+        self.latency_window = latency_window
+        self._health: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> ProviderHealth:
+        health = self._health.get(key)
+        if health is None:
+            health = self._health[key] = ProviderHealth(latencies=deque(maxlen=self.latency_window))
+        return health
+
+    def _update_latency(self, health: ProviderHealth, latency: float):
+        if health.ewma_latency is None:
+            health.ewma_latency = latency
+        else:
+            health.ewma_latency += self.ewma_alpha * (latency - health.ewma_latency)
+
+    def record_success(self, key: str, latency: float):
+        """Record a successful call and close the circuit if it was probing"""
+        with self._lock:
+            health = self._get(key)
+            health.total_requests += 1
+            health.consecutive_failures = 0
+            health.error_rate -= self.ewma_alpha * health.error_rate
+            self._update_latency(health, latency)
+            health.latencies.append(latency)
+
+            if health.state != CircuitState.CLOSED:
+                logger.info(f"🟢 Circuit closed for {key}")
+            health.state = CircuitState.CLOSED
+            health.opened_at = None
+            health.probe_in_flight = False
+
+    def record_failure(self, key: str, latency: float):
+        """Record a failed call and open the circuit when thresholds are crossed"""
+        with self._lock:
+            health = self._get(key)
+            health.total_requests += 1
+            health.total_failures += 1
+            health.consecutive_failures += 1
+            health.error_rate += self.ewma_alpha * (1.0 - health.error_rate)
+            self._update_latency(health, latency)
+            health.probe_in_flight = False
+
+            should_open = (
+                health.state == CircuitState.HALF_OPEN
+                or health.consecutive_failures >= self.failure_threshold
+                or (
+                    health.total_requests >= self.min_requests
+                    and health.error_rate >= self.error_rate_threshold
+                )
+            )
+            if should_open:
+                if health.state != CircuitState.OPEN:
+                    logger.warning(f"🔴 Circuit opened for {key}")
+                health.state = CircuitState.OPEN
+                health.opened_at = time.monotonic()
+
+    def _cooled_down(self, health: ProviderHealth) -> bool:
+        return (
+            health.opened_at is not None
+            and time.monotonic() - health.opened_at >= self.reset_timeout_seconds
+        )
+
+    def is_available(self, key: str) -> bool:
+        """Non-mutating check used while ranking routing options"""
+        with self._lock:
+            health = self._health.get(key)
+            if health is None or health.state == CircuitState.CLOSED:
+                return True
+            if health.state == CircuitState.OPEN:
+                return self._cooled_down(health)
+            return not health.probe_in_flight
+
+    def allow_request(self, key: str) -> bool:
+        """Claim permission to call a provider (claims the probe slot when half-open)"""
+        with self._lock:
+            health = self._health.get(key)
+            if health is None or health.state == CircuitState.CLOSED:
+                return True
+
+            if health.state == CircuitState.OPEN:
+                if not self._cooled_down(health):
+                    return False
+                health.state = CircuitState.HALF_OPEN
+                logger.info(f"🟡 Circuit half-open for {key}, sending probe")
+
+            if health.probe_in_flight:
+                return False
+            health.probe_in_flight = True
+            return True
+
+    def release_probe(self, key: str):
+        """Give back a claimed half-open probe slot when the call was abandoned"""
+        with self._lock:
+            health = self._health.get(key)
+            if health is not None:
+                health.probe_in_flight = False
+    
+    def latency_percentile(self, key: str, percentile: float, min_samples: int = 20) -> Optional[float]:
+        """Observed latency percentile (0-1) over recent successes, None until enough samples"""
+        with self._lock:
+            health = self._health.get(key)
+            if health is None or len(health.latencies) < min_samples:
+                return None
+            return _percentile(health.latencies, percentile)
+    
+    def is_degraded(self, key: str) -> bool:
+        """True when a provider is slow or erroring but not yet tripped"""
+        with self._lock:
+            health = self._health.get(key)
+            if health is None:
+                return False
+            too_slow = health.ewma_latency is not None and health.ewma_latency > self.slow_latency_seconds
+            too_flaky = health.error_rate >= self.error_rate_threshold / 2
+            return too_slow or too_flaky
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current health of every tracked provider"""
+        with self._lock:
+            return {
+                key: {
+                    "state": health.state.value,
+                    "ewma_latency_seconds": round(health.ewma_latency, 3) if health.ewma_latency is not None else None,
+                    "p95_latency_seconds": round(_percentile(health.latencies, 0.95), 3) if health.latencies else None,
+                    "error_rate": round(health.error_rate, 3),
+                    "consecutive_failures": health.consecutive_failures,
+                    "total_requests": health.total_requests,
+                    "total_failures": health.total_failures
+                }
+                for key, health in self._health.items()
+            }
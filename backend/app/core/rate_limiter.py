@@ -0,0 +1,110 @@
+"""
+🚦 Provider Rate Limiting - RPM / TPM token buckets per provider and model
+
+Paces calls against provider quotas before they are dispatched, so bursty
+crew executions divert to another provider instead of collecting 429s.
+
+Limits are keyed by provider value (e.g. "openai_gpt_4") or model name
+(e.g. "gpt-4"); a call must fit every bucket that applies to it.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class RateLimitExceeded(Exception):
+    """No quota left for another attempt on a provider"""
+
+
+class TokenBucket:
+    """Continuously refilling bucket sized for one minute of capacity"""
+
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = float(capacity_per_minute)
+        self.refill_rate = self.capacity / 60.0  # units per second
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def _cost(self, amount: float) -> float:
+        # A single request larger than the bucket may still go out on a full bucket
+        return min(float(amount), self.capacity)
+
+    def has(self, amount: float) -> bool:
+        """True when amount can be taken right now (refills first)"""
+        self._refill()
+        return self.tokens >= self._cost(amount)
+
+    def take(self, amount: float):
+        self.tokens -= self._cost(amount)
+
+    def refund(self, amount: float):
+        self.tokens = min(self.capacity, self.tokens + self._cost(amount))
+
+
+class ProviderRateLimiter:
+    """Thread-safe RPM / TPM limiter across provider and model buckets"""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, int]]] = None):
+        """
+        Args:
+            limits: {"<provider value or model>": {"rpm": 500, "tpm": 200000}}
+        """
+        self._request_buckets: Dict[str, TokenBucket] = {}
+        self._token_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+        for key, limit in (limits or {}).items():
+            if limit.get("rpm"):
+                self._request_buckets[key] = TokenBucket(limit["rpm"])
+            if limit.get("tpm"):
+                self._token_buckets[key] = TokenBucket(limit["tpm"])
+
+    def _buckets_for(self, provider: str, model: str) -> List[Tuple[TokenBucket, Optional[int]]]:
+        # (bucket, fixed amount) - None means the call's token estimate
+        buckets = []
+        for key in (provider, model):
+            if key in self._request_buckets:
+                buckets.append((self._request_buckets[key], 1))
+            if key in self._token_buckets:
+                buckets.append((self._token_buckets[key], None))
+        return buckets
+
+    def is_saturated(self, provider: str, model: str, tokens: int) -> bool:
+        """Non-mutating check used while ranking routing options"""
+        with self._lock:
+            return not all(
+                bucket.has(amount or tokens)
+                for bucket, amount in self._buckets_for(provider, model)
+            )
+
+    def try_acquire(self, provider: str, model: str, tokens: int) -> bool:
+        """Take one request and the estimated tokens from every applicable bucket, or nothing"""
+        with self._lock:
+            buckets = self._buckets_for(provider, model)
+            if not all(bucket.has(amount or tokens) for bucket, amount in buckets):
+                return False
+            for bucket, amount in buckets:
+                bucket.take(amount or tokens)
+            return True
+
+    def release(self, provider: str, model: str, tokens: int):
+        """Give back a reservation that did not turn into a provider call"""
+        with self._lock:
+            for bucket, amount in self._buckets_for(provider, model):
+                bucket.refund(amount or tokens)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Remaining capacity per configured key"""
+        with self._lock:
+            snapshot: Dict[str, Dict[str, float]] = {}
+            for name, buckets in (("requests", self._request_buckets), ("tokens", self._token_buckets)):
+                for key, bucket in buckets.items():
+                    bucket._refill()
+                    snapshot.setdefault(key, {})[f"{name}_available"] = round(bucket.tokens, 1)
+            return snapshot
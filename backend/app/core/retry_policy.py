@@ -0,0 +1,124 @@
+"""
+🔁 Retry Policy - Exponential backoff with full jitter for provider calls
+
+Retries transient provider failures (timeouts, connection errors, 429 and
+5xx responses) before the router gives up on an option and fails over.
+A Retry-After header from the provider takes precedence over the computed
+backoff; when it asks for longer than max_delay the call is not retried,
+since failing over to another provider is faster than waiting.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of an httpx / OpenAI / Anthropic error, if any"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) from an error response"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Bounded retries with exponential backoff and full jitter"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay_seconds: float = 0.5,
+        max_delay_seconds: float = 8.0,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (),
+        jitter: bool = True
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.retryable_exceptions = retryable_exceptions
+        self.jitter = jitter
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Transient errors worth another attempt on the same provider"""
+        if self.retryable_exceptions and isinstance(error, self.retryable_exceptions):
+            return True
+        return _status_code(error) in RETRYABLE_STATUS_CODES
+
+    def delay_for(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Seconds to wait before retry number attempt (1-based)
+
+        Returns None when the call should not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay_seconds else None
+
+        backoff = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """Run fn, retrying transient failures"""
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                delay = self.delay_for(attempt, e)
+                if delay is None:
+                    raise
+                logger.warning(f"🔁 Retrying provider call in {delay:.2f}s (attempt {attempt + 1}): {e}")
+                time.sleep(delay)
+                attempt += 1
+
+    async def acall(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of call()"""
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self.delay_for(attempt, e)
+                if delay is None:
+                    raise
+                logger.warning(f"🔁 Retrying provider call in {delay:.2f}s (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(delay)
+                attempt += 1
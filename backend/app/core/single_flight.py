@@ -0,0 +1,98 @@
+"""
+🛫 Single-Flight - Coalesce concurrent identical calls into one
+
+When several callers ask for the same key at the same time, only the first
+(the leader) runs the call; the others wait and receive the leader's result
+or exception. Used by the router so identical concurrent LLM requests share
+one upstream provider call.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class CallCancelledError(Exception):
+    """The leader was cancelled before its call finished"""
+
+
+class _Call:
+    """In-flight call shared by a leader and its waiters"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Thread-based single-flight group"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once per key among concurrent callers
+
+        Returns:
+            Tuple of (result, shared) where shared is True for waiters that
+            received another caller's result
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """asyncio single-flight group (use from a single event loop)"""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Async variant of SingleFlight.do()"""
+        future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future), True
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved even when nobody else was waiting
+        future.add_done_callback(lambda f: f.exception())
+        self._calls[key] = future
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Waiters were not cancelled themselves, give them a plain failure
+            future.set_exception(CallCancelledError(f"In-flight call for {key} was cancelled"))
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[key]
@@ -0,0 +1,125 @@
+"""
+🔢 Local Token Counting - Offline token counts for budgeting and cost tracking
+
+Replaces the words * 1.3 approximation with real BPE token counts where a
+local vocabulary is available:
+
+- TiktokenCounter: per-model tiktoken encodings (exact for OpenAI models,
+  cl100k_base approximation for Claude / Mistral)
+- HeuristicTokenCounter: dependency-free fallback
+
+Counts are cached per prompt segment (blocks separated by blank lines), so
+the repeated role/task sections of crew prompts are only tokenized once.
+
+tiktoken loads its BPE files from TIKTOKEN_CACHE_DIR; pre-populate that
+directory (e.g. at image build time) to run fully offline.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SEPARATOR = "\n\n"
+DEFAULT_ENCODING = "cl100k_base"
+
+
+class TokenCounter:
+    """Base class for token counters"""
+
+    name = "base"
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        """Number of tokens in text for the given model"""
+        raise NotImplementedError
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Words to tokens ratio, used when no local vocabulary is available"""
+
+    name = "heuristic"
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        return int(len(text.split()) * 1.3)
+
+
+class TiktokenCounter(TokenCounter):
+    """BPE token counts from tiktoken with a per-segment cache"""
+
+    name = "tiktoken"
+
+    def __init__(self, cache_size: int = 8192):
+        if tiktoken is None:
+            raise ImportError("tiktoken is not installed")
+
+        self._encodings: Dict[str, "tiktoken.Encoding"] = {}
+        self._model_encodings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._count_segment = lru_cache(maxsize=cache_size)(self._encode_length)
+
+        # Load the default vocabulary eagerly so a missing BPE file fails here
+        separator_encoding = self._get_encoding(DEFAULT_ENCODING)
+        self._separator_tokens = len(separator_encoding.encode(SEGMENT_SEPARATOR))
+
+    def _get_encoding(self, encoding_name: str) -> "tiktoken.Encoding":
+        with self._lock:
+            encoding = self._encodings.get(encoding_name)
+            if encoding is None:
+                encoding = self._encodings[encoding_name] = tiktoken.get_encoding(encoding_name)
+            return encoding
+
+    def _encoding_name_for(self, model: Optional[str]) -> str:
+        if not model:
+            return DEFAULT_ENCODING
+
+        encoding_name = self._model_encodings.get(model)
+        if encoding_name is None:
+            try:
+                encoding_name = tiktoken.encoding_name_for_model(model)
+            except KeyError:
+                # No local vocabulary for Claude / Mistral, cl100k is a close proxy
+                encoding_name = DEFAULT_ENCODING
+            self._model_encodings[model] = encoding_name
+        return encoding_name
+
+    def _encode_length(self, encoding_name: str, segment: str) -> int:
+        return len(self._get_encoding(encoding_name).encode(segment, disallowed_special=()))
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        if not text:
+            return 0
+
+        encoding_name = self._encoding_name_for(model)
+        segments = text.split(SEGMENT_SEPARATOR)
+        tokens = sum(self._count_segment(encoding_name, segment) for segment in segments if segment)
+        return tokens + self._separator_tokens * (len(segments) - 1)
+
+
+def create_token_counter(backend: str = "auto") -> TokenCounter:
+    """
+    Build the configured token counter
+
+    Args:
+        backend: "auto" (tiktoken when usable), "tiktoken" or "heuristic"
+
+    Returns:
+        TokenCounter: Ready to use counter
+    """
+    backend = (backend or "auto").lower()
+
+    if backend in ("auto", "tiktoken"):
+        try:
+            counter = TiktokenCounter()
+            logger.info("🔢 Using tiktoken for local token counting")
+            return counter
+        except Exception as e:
+            logger.warning(f"⚠️ tiktoken unavailable, using heuristic token counts: {e}")
+
+    return HeuristicTokenCounter()
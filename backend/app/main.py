@@ -9,6 +9,7 @@ from typing import Dict, Deque
 
 from .core.config import get_settings
 from .core.database import init_database
+from .core.http_clients import get_http_clients
 from .api.v1 import health_router, teams_router, spaces_router
 
 # Configure logging
@@ -157,6 +158,12 @@ async def startup_event():
     else:
         logger.warning("⚠️  Started with limited functionality (database unavailable)")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown."""
+    # Close pooled provider connections
+    await get_http_clients().aclose()
+
 # Include routers
 app.include_router(health_router, prefix="/health", tags=["health"])
 app.include_router(teams_router, prefix="/api/v1/teams", tags=["teams"])
@@ -10,5 +10,6 @@ from .team import Team, TeamStatus
 from .role import Role, ExpertiseLevel
 from .execution import TeamExecution, TaskExecution
 from .space import TeamSpace
+from .job import ExecutionJob, JobStatus
 
-__all__ = ["Base", "User", "Team", "TeamStatus", "Role", "ExpertiseLevel", "TeamExecution", "TaskExecution", "TeamSpace"] 
\ No newline at end of file
+__all__ = ["Base", "User", "Team", "TeamStatus", "Role", "ExpertiseLevel", "TeamExecution", "TaskExecution", "TeamSpace", "ExecutionJob", "JobStatus"] 
\ No newline at end of file
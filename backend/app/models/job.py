@@ -0,0 +1,44 @@
+"""Background execution job queue model."""
+
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.orm import relationship
+
+from . import Base
+
+
+class JobStatus(Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class ExecutionJob(Base):
+    """Durable work item that runs one TeamExecution on a worker"""
+    __tablename__ = "execution_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    team_execution_id = Column(Integer, ForeignKey("team_executions.id"), nullable=False)
+    status = Column(String, nullable=False, default=JobStatus.QUEUED.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    last_error = Column(Text)
+
+    # Lease: a RUNNING job whose heartbeat is older than the visibility
+    # timeout belongs to a dead worker and can be claimed again
+    locked_by = Column(String(100))
+    locked_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    team_execution = relationship("TeamExecution")
+
+    __table_args__ = (
+        Index("ix_execution_jobs_status_run_after", "status", "run_after"),
+    )
@@ -10,6 +10,7 @@ from . import Base
 
 class TeamStatus(Enum):
     IDLE = "IDLE"
+    QUEUED = "QUEUED"  # Execution waiting for a worker
     RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
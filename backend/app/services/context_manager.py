@@ -0,0 +1,151 @@
+"""Token-bounded task context for crew prompts."""
+
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import get_settings
+import structlog
+
+logger = structlog.get_logger()
+
+SUMMARY_PROMPT = (
+    "Condense the results below for a teammate who builds on them. Keep facts, "
+    "figures, names, decisions and open questions; drop repetition and filler. "
+    "Answer with the condensed results only, in at most {words} words.\n\n{text}"
+)
+
+
+class TaskContextManager:
+    """
+    Rolling, token-bounded context of one crew execution.
+
+    Every finished task gets a digest: its output, prefixed with the digests
+    of its upstream tasks. A digest over the context token budget is
+    summarized by the free local model (or clipped when there is none), so
+    a task's digest carries its whole upstream lineage in bounded size and
+    downstream prompts stay small however long the crew is. Digests and
+    summaries are cached for the execution; the router's response cache
+    also serves summaries of identical text across executions.
+    """
+
+    def __init__(
+        self,
+        router,
+        context_token_budget: Optional[int] = None,
+        inputs_token_budget: Optional[int] = None
+    ):
+        settings = get_settings()
+        self.router = router
+        self.context_token_budget = context_token_budget or settings.context_token_budget
+        self.inputs_token_budget = inputs_token_budget or settings.context_inputs_token_budget
+        self._digests: Dict[str, str] = {}
+        self._summaries: Dict[Tuple[str, ...], str] = {}
+        self._lock = threading.Lock()
+        self.stats = {"summarized": 0, "clipped": 0, "cache_hits": 0}
+
+    def render_inputs(self, inputs: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Execution inputs as 'key: value' lines, clipped to the inputs budget"""
+        if not inputs:
+            return None
+        lines = [
+            f"{key}: {value if isinstance(value, str) else json.dumps(value, default=str)}"
+            for key, value in inputs.items()
+        ]
+        return self._clip("\n".join(lines), self.inputs_token_budget)
+
+    def context_for(self, upstream: List[str]) -> Optional[str]:
+        """Bounded context for a task from the digests of its upstream tasks"""
+        with self._lock:
+            parts = [(name, self._digests[name]) for name in upstream if name in self._digests]
+        if not parts:
+            return None
+        return self._fit(("context",) + tuple(name for name, _ in parts), self._join(parts))
+
+    def add_result(self, task_name: str, upstream: List[str], output: str) -> str:
+        """
+        Record a finished task and return its digest.
+
+        Args:
+            task_name: The finished task
+            upstream: Names of the tasks whose results it was given
+            output: The task's output
+        """
+        with self._lock:
+            parts = [(name, self._digests[name]) for name in upstream if name in self._digests]
+        parts.append((task_name, output))
+
+        digest = self._fit(("digest", task_name), self._join(parts))
+        self.restore(task_name, digest)
+        return digest
+
+    def restore(self, task_name: str, digest: str):
+        """Reuse the digest of a task finished in an earlier run (checkpoint)"""
+        with self._lock:
+            self._digests[task_name] = digest
+
+    def _fit(self, key: Tuple[str, ...], text: str) -> str:
+        """Text within the context budget: as is, summarized, or clipped"""
+        tokens = self.router.count_tokens(text)
+        if tokens <= self.context_token_budget:
+            return text
+
+        with self._lock:
+            cached = self._summaries.get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return cached
+
+        summary = self._summarize(text)
+        outcome = "clipped" if summary is None else "summarized"
+        condensed = self._clip(summary or text, self.context_token_budget)
+
+        logger.info("Task context condensed", key=list(key), tokens=tokens,
+                    budget=self.context_token_budget, outcome=outcome)
+        with self._lock:
+            self._summaries[key] = condensed
+            self.stats[outcome] += 1
+        return condensed
+
+    def _summarize(self, text: str) -> Optional[str]:
+        """Summary from the free local model, None when it is unavailable or fails"""
+        decision = self.router.local_option()
+        if decision is None:
+            return None
+
+        prompt = SUMMARY_PROMPT.format(words=int(self.context_token_budget * 0.75), text=text)
+        result = self.router.execute_request(
+            decision,
+            prompt,
+            max_tokens=self.context_token_budget,
+            options={'temperature': 0.2, 'num_predict': self.context_token_budget}
+        )
+        if not result.success or not result.content.strip():
+            logger.warning("Context summary failed, clipping instead", error=result.error)
+            return None
+        return result.content.strip()
+
+    def _clip(self, text: str, max_tokens: int) -> str:
+        """Leading part of text within max_tokens, cut at a line or word break"""
+        if max_tokens <= 0:
+            return ""
+        tokens = self.router.count_tokens(text)
+        while tokens > max_tokens:
+            cut = int(len(text) * max_tokens / tokens * 0.95)
+            boundary = max(text.rfind("\n", 0, cut), text.rfind(" ", 0, cut))
+            clipped = text[:boundary if boundary > cut // 2 else cut].rstrip()
+            if len(clipped) + len(" …") >= len(text):
+                # The budget can't fit the marker: hard cut without it
+                while text and tokens > max_tokens:
+                    text = text[:int(len(text) * max_tokens / tokens * 0.95)]
+                    tokens = self.router.count_tokens(text)
+                return text.rstrip()
+            text = clipped + " …"
+            tokens = self.router.count_tokens(text)
+        return text
+
+    @staticmethod
+    def _join(parts: List[Tuple[str, str]]) -> str:
+        if len(parts) == 1:
+            return parts[0][1]
+        return "\n\n".join(f"[{name}]\n{text}" for name, text in parts)
@@ -0,0 +1,161 @@
+"""Reusable crew blueprints keyed on team configuration."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..core.config import get_settings
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class RoleSpec:
+    """
+    Detached snapshot of a Role, safe to keep across sessions.
+
+    Exposes the same attributes the crew factories and agents read from a
+    Role model, so it can stand in for one.
+    """
+    id: int
+    team_id: int
+    title: str
+    description: Optional[str]
+    expertise: Any
+    llm_model: str
+    llm_config: Optional[Dict[str, Any]]
+    agent_config: Optional[Dict[str, Any]]
+    is_active: bool
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_role(cls, role) -> "RoleSpec":
+        return cls(
+            id=role.id,
+            team_id=role.team_id,
+            title=role.title,
+            description=role.description,
+            expertise=role.expertise,
+            llm_model=role.llm_model,
+            llm_config=dict(role.llm_config) if role.llm_config else role.llm_config,
+            agent_config=dict(role.agent_config) if role.agent_config else role.agent_config,
+            is_active=role.is_active,
+            updated_at=role.updated_at
+        )
+
+
+def team_version(team_model) -> Tuple:
+    """Version of a team's crew configuration: team and role update times."""
+    return (
+        team_model.updated_at,
+        tuple(sorted((role.id, role.updated_at, role.is_active) for role in team_model.roles))
+    )
+
+
+@dataclass
+class CrewBlueprint:
+    """Agents and tasks validated once, cloned for every execution."""
+    team_id: int
+    version: Tuple
+    agents: List[Any]
+    tasks: List[Any]
+    uses: int = field(default=0)
+
+    def instantiate(self) -> Tuple[List[Any], List[Any]]:
+        """Fresh per-run agents and tasks (shallow copies with reset run state)."""
+        agents = [agent.clone_for_run() for agent in self.agents]
+        agent_clones = {id(template): clone for template, clone in zip(self.agents, agents)}
+        tasks = [task.clone_for_run(agent_clones[id(task.agent)]) for task in self.tasks]
+        self.uses += 1
+        return agents, tasks
+
+
+class CrewBlueprintCache:
+    """
+    LRU cache of crew blueprints per team and factory parameters.
+
+    Entries are checked against the team's current version on every lookup,
+    so a team or role change made by another process is picked up on the
+    next execution; invalidate() drops entries right away in this process.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or get_settings().crew_blueprint_cache_max_entries
+        self._entries: "OrderedDict[Tuple, CrewBlueprint]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self,
+        kind: str,
+        team_model,
+        build: Callable[[List[RoleSpec]], Tuple[List[Any], List[Any]]],
+        params: Tuple[Hashable, ...] = ()
+    ) -> CrewBlueprint:
+        """
+        Cached blueprint for the team, built from its active roles on a miss.
+
+        Args:
+            kind: Crew flavour ("hybrid", "standard"), part of the key
+            team_model: Team with roles loaded
+            build: Creates template agents and tasks from role snapshots
+            params: Factory parameters that change the built crew
+        """
+        key = (kind, team_model.id, params)
+        version = team_version(team_model)
+
+        with self._lock:
+            blueprint = self._entries.get(key)
+            if blueprint is not None and blueprint.version == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return blueprint
+            self.misses += 1
+
+        # Build outside the lock; a concurrent miss just builds twice
+        roles = [RoleSpec.from_role(role) for role in team_model.roles if role.is_active]
+        agents, tasks = build(roles)
+        blueprint = CrewBlueprint(team_id=team_model.id, version=version, agents=agents, tasks=tasks)
+
+        with self._lock:
+            self._entries[key] = blueprint
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        logger.info("Crew blueprint built", kind=kind, team_id=team_model.id, agents=len(agents))
+        return blueprint
+
+    def invalidate(self, team_id: int):
+        """Drop every blueprint of a team (after team or role updates)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == team_id]:
+                del self._entries[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cache size and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+
+# Global blueprint cache instance
+_blueprint_cache: Optional[CrewBlueprintCache] = None
+
+
+def get_blueprint_cache() -> CrewBlueprintCache:
+    """Get global crew blueprint cache instance."""
+    global _blueprint_cache
+    if _blueprint_cache is None:
+        _blueprint_cache = CrewBlueprintCache()
+    return _blueprint_cache
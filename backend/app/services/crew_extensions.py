@@ -2,14 +2,17 @@
 
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from decimal import Decimal
 
 from crewai import Agent, Task, Crew, Process
-from sqlalchemy.orm import Session
-
-from ..models import Role, TeamExecution, TaskExecution, TeamStatus
-from ..core.database import SessionLocal, get_db
+from pydantic import Field
+from ..models import Role, Team, TeamExecution, TeamStatus
+from ..core.config import get_settings
+from ..core.database import get_db
+from .crew_blueprints import RoleSpec, get_blueprint_cache
+from .execution_recorder import TaskExecutionRecorder, TaskRecord
+from .task_scheduler import normalize_dependencies, resolve_role_dependencies, run_dag
 import structlog
 
 logger = structlog.get_logger()
@@ -23,6 +26,11 @@ class NuiFloAgent(Agent):
     for cost monitoring and audit trails.
     """
     
+    # CrewAI models reject undeclared attributes, so tracking state is declared
+    role_model: Any = Field(default=None, exclude=True)
+    team_execution_id: Optional[int] = None
+    execution_metrics: Dict[str, Any] = Field(default_factory=dict)
+    
     def __init__(
         self,
         role_model: Role,
@@ -64,13 +72,24 @@ class NuiFloAgent(Agent):
         # Store NuiFlo-specific data
         self.role_model = role_model
         self.team_execution_id = team_execution_id
-        self.execution_metrics = {
+        self.execution_metrics = self._new_execution_metrics()
+    
+    @staticmethod
+    def _new_execution_metrics() -> Dict[str, Any]:
+        return {
             "tokens_used": 0,
             "cost": Decimal("0.00"),
             "start_time": None,
             "end_time": None,
         }
     
+    def clone_for_run(self) -> "NuiFloAgent":
+        """Cheap copy of a blueprint agent with fresh per-run state."""
+        clone = self.model_copy()
+        clone.team_execution_id = None
+        clone.execution_metrics = self._new_execution_metrics()
+        return clone
+    
     def track_execution_start(self):
         """Start tracking execution metrics."""
         self.execution_metrics["start_time"] = datetime.utcnow()
@@ -102,6 +121,12 @@ class NuiFloTask(Task):
     This task tracks execution details and stores results in the database.
     """
     
+    task_name: Optional[str] = None
+    task_description: Optional[str] = None
+    depends_on: Optional[List[int]] = None
+    nuiflo_agent: Any = Field(default=None, exclude=True)
+    execution_record: Optional[Any] = Field(default=None, exclude=True)
+    
     def __init__(
         self,
         description: str,
@@ -109,6 +134,7 @@ class NuiFloTask(Task):
         agent: NuiFloAgent,
         task_name: str,
         task_description: Optional[str] = None,
+        depends_on: Optional[List[int]] = None,
         **kwargs
     ):
         """
@@ -120,6 +146,7 @@ class NuiFloTask(Task):
             agent: NuiFloAgent to execute this task
             task_name: Name for database tracking
             task_description: Optional detailed description
+            depends_on: Upstream task indexes (None = previous task)
             **kwargs: Additional CrewAI Task parameters
         """
         super().__init__(
@@ -131,12 +158,25 @@ class NuiFloTask(Task):
         
         self.task_name = task_name
         self.task_description = task_description
+        self.depends_on = depends_on
         self.nuiflo_agent = agent
-        self.execution_id: Optional[int] = None
+        self.execution_record: Optional[TaskRecord] = None
+    
+    def clone_for_run(self, agent: NuiFloAgent) -> "NuiFloTask":
+        """Cheap copy of a blueprint task bound to a per-run agent."""
+        clone = self.model_copy(update={"agent": agent})
+        clone.nuiflo_agent = agent
+        clone.execution_record = None
+        return clone
+    
+    @property
+    def execution_id(self) -> Optional[int]:
+        """Database id of this task's execution row, once it has been written."""
+        return self.execution_record.id if self.execution_record else None
     
     def save_to_database(
         self,
-        session: Session,
+        recorder: TaskExecutionRecorder,
         team_execution_id: int,
         status: str,
         input_data: Optional[Dict[str, Any]] = None,
@@ -146,29 +186,36 @@ class NuiFloTask(Task):
         cost: Decimal = Decimal("0.00"),
         duration_seconds: Optional[float] = None
     ):
-        """Save task execution to database."""
-        task_execution = TaskExecution(
-            team_execution_id=team_execution_id,
-            role_id=self.nuiflo_agent.role_model.id,
-            task_name=self.task_name,
-            task_description=self.task_description,
-            status=status,
-            input_data=input_data,
-            output_data=output_data,
-            error_message=error_message,
-            tokens_used=tokens_used,
-            cost=cost,
-            duration_seconds=duration_seconds,
-            started_at=self.nuiflo_agent.execution_metrics.get("start_time"),
-            completed_at=self.nuiflo_agent.execution_metrics.get("end_time")
-        )
+        """
+        Record or update this task's execution row.
         
-        session.add(task_execution)
-        session.flush()
-        self.execution_id = task_execution.id
+        Writes go through the recorder's buffer; the first call inserts the
+        row and later calls update it.
+        """
+        values = {
+            "status": status,
+            "output_data": output_data,
+            "error_message": error_message,
+            "tokens_used": tokens_used,
+            "cost": cost,
+            "duration_seconds": duration_seconds,
+            "started_at": self.nuiflo_agent.execution_metrics.get("start_time"),
+            "completed_at": self.nuiflo_agent.execution_metrics.get("end_time")
+        }
+        
+        if self.execution_record is None:
+            self.execution_record = recorder.record(
+                team_execution_id=team_execution_id,
+                role_id=self.nuiflo_agent.role_model.id,
+                task_name=self.task_name,
+                task_description=self.task_description,
+                input_data=input_data,
+                **values
+            )
+        else:
+            recorder.update(self.execution_record, **values)
         
-        logger.info("Task execution saved to database",
-                   task_id=task_execution.id,
+        logger.info("Task execution recorded",
                    task_name=self.task_name,
                    status=status)
 
@@ -180,12 +227,18 @@ class NuiFloCrew(Crew):
     This crew manages team execution, tracks costs, and stores results.
     """
     
+    team_model: Any = Field(default=None, exclude=True)
+    team_execution_id: Optional[int] = None
+    max_concurrency: int = 1
+    execution_metrics: Dict[str, Any] = Field(default_factory=dict)
+    
     def __init__(
         self,
         team_model,  # Team model
         agents: List[NuiFloAgent],
         tasks: List[NuiFloTask],
         team_execution_id: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
         **kwargs
     ):
         """
@@ -196,6 +249,7 @@ class NuiFloCrew(Crew):
             agents: List of NuiFloAgent instances
             tasks: List of NuiFloTask instances
             team_execution_id: Optional team execution ID
+            max_concurrency: Maximum independent tasks run at once
             **kwargs: Additional CrewAI Crew parameters
         """
         super().__init__(
@@ -208,6 +262,7 @@ class NuiFloCrew(Crew):
         
         self.team_model = team_model
         self.team_execution_id = team_execution_id
+        self.max_concurrency = max_concurrency or get_settings().crew_max_concurrency
         self.execution_metrics = {
             "total_tokens": 0,
             "total_cost": Decimal("0.00"),
@@ -232,10 +287,9 @@ class NuiFloCrew(Crew):
         start_time = time.time()
         self.execution_metrics["start_time"] = datetime.utcnow()
         
-        # Create database session
-        with SessionLocal() as session:
-            try:
-                # Create team execution record
+        try:
+            # Create team execution record in its own short transaction
+            with get_db() as session:
                 team_execution = TeamExecution(
                     team_id=self.team_model.id,
                     status=TeamStatus.RUNNING.value,
@@ -243,37 +297,40 @@ class NuiFloCrew(Crew):
                     started_at=self.execution_metrics["start_time"]
                 )
                 session.add(team_execution)
-                session.flush()
+                session.commit()
                 self.team_execution_id = team_execution.id
-                
-                logger.info("Team execution started",
-                           team_id=self.team_model.id,
-                           team_execution_id=team_execution.id)
-                
-                # Execute the crew using parent class method
-                # Note: This is a simplified version - in practice you'd need to
-                # integrate more deeply with CrewAI's execution flow
-                result = self._execute_crew_with_tracking(session, inputs)
-                
-                # Calculate total metrics
-                end_time = time.time()
-                duration = end_time - start_time
-                self.execution_metrics["end_time"] = datetime.utcnow()
-                self.execution_metrics["duration_seconds"] = duration
-                
-                # Aggregate metrics from all agents
-                total_tokens = 0
-                total_cost = Decimal("0.00")
-                
-                for agent in self.agents:
-                    if hasattr(agent, 'execution_metrics'):
-                        total_tokens += agent.execution_metrics.get("tokens_used", 0)
-                        total_cost += agent.execution_metrics.get("cost", Decimal("0.00"))
-                
-                self.execution_metrics["total_tokens"] = total_tokens
-                self.execution_metrics["total_cost"] = total_cost
-                
+            
+            logger.info("Team execution started",
+                       team_id=self.team_model.id,
+                       team_execution_id=self.team_execution_id)
+            
+            # Execute the crew using parent class method
+            # Note: This is a simplified version - in practice you'd need to
+            # integrate more deeply with CrewAI's execution flow
+            with TaskExecutionRecorder() as recorder:
+                result = self._execute_crew_with_tracking(recorder, inputs)
+            
+            # Calculate total metrics
+            end_time = time.time()
+            duration = end_time - start_time
+            self.execution_metrics["end_time"] = datetime.utcnow()
+            self.execution_metrics["duration_seconds"] = duration
+            
+            # Aggregate metrics from all agents
+            total_tokens = 0
+            total_cost = Decimal("0.00")
+            
+            for agent in self.agents:
+                if hasattr(agent, 'execution_metrics'):
+                    total_tokens += agent.execution_metrics.get("tokens_used", 0)
+                    total_cost += agent.execution_metrics.get("cost", Decimal("0.00"))
+            
+            self.execution_metrics["total_tokens"] = total_tokens
+            self.execution_metrics["total_cost"] = total_cost
+            
+            with get_db() as session:
                 # Update team execution record
+                team_execution = session.get(TeamExecution, self.team_execution_id)
                 team_execution.status = TeamStatus.COMPLETED.value
                 team_execution.result = str(result)
                 team_execution.completed_at = self.execution_metrics["end_time"]
@@ -282,78 +339,111 @@ class NuiFloCrew(Crew):
                 team_execution.duration_seconds = duration
                 
                 # Update team's current spend
-                self.team_model.current_spend += total_cost
-                self.team_model.last_executed_at = self.execution_metrics["end_time"]
-                self.team_model.status = TeamStatus.COMPLETED
+                team = session.get(Team, self.team_model.id)
+                team.current_spend += total_cost
+                team.last_executed_at = self.execution_metrics["end_time"]
+                team.status = TeamStatus.COMPLETED
                 
                 session.commit()
-                
-                logger.info("Team execution completed successfully",
-                           team_execution_id=team_execution.id,
-                           total_tokens=total_tokens,
-                           total_cost=float(total_cost),
-                           duration=duration)
-                
-                return {
-                    "result": result,
-                    "metrics": {
-                        "total_tokens": total_tokens,
-                        "total_cost": float(total_cost),
-                        "duration_seconds": duration,
-                        "start_time": self.execution_metrics["start_time"].isoformat(),
-                        "end_time": self.execution_metrics["end_time"].isoformat(),
-                    },
-                    "success": True,
-                    "error": None,
-                    "team_execution_id": team_execution.id
-                }
-                
-            except Exception as e:
-                # Handle execution failure
-                end_time = time.time()
-                duration = end_time - start_time
-                self.execution_metrics["end_time"] = datetime.utcnow()
-                
-                if hasattr(self, 'team_execution_id') and self.team_execution_id:
-                    team_execution.status = TeamStatus.FAILED.value
-                    team_execution.error_message = str(e)
-                    team_execution.completed_at = self.execution_metrics["end_time"]
-                    team_execution.duration_seconds = duration
-                    
-                    self.team_model.status = TeamStatus.FAILED
-                    
-                    session.commit()
-                
-                logger.error("Team execution failed",
-                           team_execution_id=getattr(self, 'team_execution_id', None),
-                           error=str(e),
-                           duration=duration)
-                
-                return {
-                    "result": None,
-                    "metrics": {
-                        "duration_seconds": duration,
-                        "start_time": self.execution_metrics["start_time"].isoformat(),
-                        "end_time": self.execution_metrics["end_time"].isoformat(),
-                    },
-                    "success": False,
-                    "error": str(e),
-                    "team_execution_id": getattr(self, 'team_execution_id', None)
-                }
+                # Read back while the session is open, commit expired the instance
+                self._sync_team_model(team)
+            
+            logger.info("Team execution completed successfully",
+                       team_execution_id=self.team_execution_id,
+                       total_tokens=total_tokens,
+                       total_cost=float(total_cost),
+                       duration=duration)
+            
+            return {
+                "result": result,
+                "metrics": {
+                    "total_tokens": total_tokens,
+                    "total_cost": float(total_cost),
+                    "duration_seconds": duration,
+                    "start_time": self.execution_metrics["start_time"].isoformat(),
+                    "end_time": self.execution_metrics["end_time"].isoformat(),
+                },
+                "success": True,
+                "error": None,
+                "team_execution_id": self.team_execution_id
+            }
+            
+        except Exception as e:
+            # Handle execution failure
+            end_time = time.time()
+            duration = end_time - start_time
+            self.execution_metrics["end_time"] = datetime.utcnow()
+            
+            if self.team_execution_id:
+                try:
+                    with get_db() as session:
+                        team_execution = session.get(TeamExecution, self.team_execution_id)
+                        team_execution.status = TeamStatus.FAILED.value
+                        team_execution.error_message = str(e)
+                        team_execution.completed_at = self.execution_metrics["end_time"]
+                        team_execution.duration_seconds = duration
+                        
+                        team = session.get(Team, self.team_model.id)
+                        team.status = TeamStatus.FAILED
+                        
+                        session.commit()
+                        self._sync_team_model(team)
+                except Exception as db_error:
+                    logger.error("Failed to record team execution failure",
+                               team_execution_id=self.team_execution_id,
+                               error=str(db_error))
+            
+            logger.error("Team execution failed",
+                       team_execution_id=self.team_execution_id,
+                       error=str(e),
+                       duration=duration)
+            
+            return {
+                "result": None,
+                "metrics": {
+                    "duration_seconds": duration,
+                    "start_time": self.execution_metrics["start_time"].isoformat(),
+                    "end_time": self.execution_metrics["end_time"].isoformat(),
+                },
+                "success": False,
+                "error": str(e),
+                "team_execution_id": self.team_execution_id
+            }
     
-    def _execute_crew_with_tracking(self, session: Session, inputs: Optional[Dict[str, Any]] = None) -> str:
+    def _sync_team_model(self, team: Team):
+        """Mirror committed team columns onto the crew's own team model."""
+        self.team_model.current_spend = team.current_spend
+        self.team_model.last_executed_at = team.last_executed_at
+        self.team_model.status = team.status
+    
+    def _execute_crew_with_tracking(
+        self,
+        recorder: TaskExecutionRecorder,
+        inputs: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Internal method to execute crew with agent and task tracking.
         
         This is a simplified implementation. In a production system,
         you'd want to integrate more deeply with CrewAI's execution engine.
+        
+        Tasks start as soon as their upstream tasks are done, up to
+        max_concurrency at once. Task rows are written through the
+        write-behind recorder, which is safe to use from worker threads.
         """
-        results = []
+        results: Dict[int, str] = {}
         
-        for i, (agent, task) in enumerate(zip(self.agents, self.tasks)):
+        def run_task(i: int, upstream: Dict[int, str]) -> str:
+            agent, task = self.agents[i], self.tasks[i]
             try:
                 # Track agent execution
                 agent.track_execution_start()
+                task.save_to_database(
+                    recorder=recorder,
+                    team_execution_id=self.team_execution_id,
+                    status=TeamStatus.RUNNING.value,
+                    input_data=inputs
+                )
                 
                 # Simulate task execution (replace with actual CrewAI integration)
                 task_result = f"Task {task.task_name} completed by {agent.role_model.title}"
@@ -367,9 +457,8 @@ class NuiFloCrew(Crew):
                     cost=estimated_cost
                 )
                 
-                # Save task execution to database
                 task.save_to_database(
-                    session=session,
+                    recorder=recorder,
                     team_execution_id=self.team_execution_id,
                     status=TeamStatus.COMPLETED.value,
                     input_data=inputs,
@@ -381,49 +470,73 @@ class NuiFloCrew(Crew):
                         agent.execution_metrics["start_time"]
                     ).total_seconds()
                 )
-                
-                results.append(task_result)
+                results[i] = task_result
+                return task_result
                 
             except Exception as e:
                 logger.error("Task execution failed",
                            task_name=task.task_name,
                            agent_role=agent.role_model.title,
                            error=str(e))
-                
-                # Save failed task to database
                 task.save_to_database(
-                    session=session,
+                    recorder=recorder,
                     team_execution_id=self.team_execution_id,
                     status=TeamStatus.FAILED.value,
                     input_data=inputs,
                     error_message=str(e)
                 )
-                
-                raise e
+                raise
+        
+        dependencies = normalize_dependencies([task.depends_on for task in self.tasks])
+        run_dag(dependencies, run_task, max_concurrency=self.max_concurrency)
         
-        return "\n".join(results)
+        return "\n".join(results[i] for i in sorted(results))
 
 
 def create_crew_from_team(team_model) -> NuiFloCrew:
     """
     Factory function to create a NuiFloCrew from a database Team model.
     
+    Agents and tasks come from a cached blueprint of the team's
+    configuration; each call only clones their per-run state.
+    
     Args:
         team_model: Database Team model with roles loaded
         
     Returns:
         Configured NuiFloCrew instance
     """
+    blueprint = get_blueprint_cache().get_or_build(
+        "standard",
+        team_model,
+        lambda roles: _build_agents_and_tasks(team_model, roles)
+    )
+    agents, tasks = blueprint.instantiate()
+    
+    # Create and return the crew
+    crew = NuiFloCrew(
+        team_model=team_model,
+        agents=agents,
+        tasks=tasks
+    )
+    
+    return crew
+
+
+def _build_agents_and_tasks(
+    team_model,
+    roles: List[RoleSpec]
+) -> Tuple[List[NuiFloAgent], List[NuiFloTask]]:
+    """Build and validate the template agents and tasks of a team's blueprint."""
     # Create agents from team roles
-    agents = []
-    for role in team_model.roles:
-        if role.is_active:
-            agent = NuiFloAgent(role_model=role)
-            agents.append(agent)
+    agents = [NuiFloAgent(role_model=role) for role in roles]
     
     if not agents:
         raise ValueError(f"Team {team_model.name} has no active roles")
     
+    # Task ordering comes from agent_config "depends_on" / "independent"
+    dependencies = resolve_role_dependencies([agent.role_model for agent in agents])
+    
     # Create tasks for each agent
     tasks = []
     for i, agent in enumerate(agents):
@@ -438,15 +551,9 @@ def create_crew_from_team(team_model) -> NuiFloCrew:
             expected_output="Detailed analysis and recommendations from your expertise area",
             agent=agent,
             task_name=f"Task_{i+1}_{agent.role_model.title.replace(' ', '_')}",
-            task_description=task_description
+            task_description=task_description,
+            depends_on=dependencies[i]
         )
         tasks.append(task)
     
-    # Create and return the crew
-    crew = NuiFloCrew(
-        team_model=team_model,
-        agents=agents,
-        tasks=tasks
-    )
-    
-    return crew 
\ No newline at end of file
+    return agents, tasks
@@ -0,0 +1,185 @@
+"""Dry-run cost and latency estimates for team executions."""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models import TaskExecution, TeamStatus
+from ..core.config import get_settings
+from ..core.pricing import token_cost
+from .task_scheduler import normalize_dependencies, topological_order
+import structlog
+
+logger = structlog.get_logger()
+
+
+def get_role_history(session: Session, role_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Completed-task statistics per role over the estimate history window.
+
+    Returns:
+        Per role id: samples plus min / avg / max tokens and duration
+    """
+    if not role_ids:
+        return {}
+
+    since = datetime.utcnow() - timedelta(days=get_settings().estimate_history_days)
+    rows = (
+        session.query(
+            TaskExecution.role_id,
+            func.count(TaskExecution.id),
+            func.min(TaskExecution.tokens_used),
+            func.avg(TaskExecution.tokens_used),
+            func.max(TaskExecution.tokens_used),
+            func.min(TaskExecution.duration_seconds),
+            func.avg(TaskExecution.duration_seconds),
+            func.max(TaskExecution.duration_seconds)
+        )
+        .filter(
+            TaskExecution.role_id.in_(role_ids),
+            TaskExecution.status == TeamStatus.COMPLETED.value,
+            TaskExecution.created_at >= since
+        )
+        .group_by(TaskExecution.role_id)
+        .all()
+    )
+
+    return {
+        role_id: {
+            "samples": samples,
+            "tokens": (int(min_tokens or 0), int(avg_tokens or 0), int(max_tokens or 0)),
+            "duration": (
+                (float(min_duration), float(avg_duration), float(max_duration))
+                if avg_duration is not None else None
+            )
+        }
+        for role_id, samples, min_tokens, avg_tokens, max_tokens, min_duration, avg_duration, max_duration in rows
+    }
+
+
+def _critical_path(dependencies: List[List[int]], durations: List[float]) -> float:
+    """Wall-clock time of the DAG when independent tasks run in parallel"""
+    finish: Dict[int, float] = {}
+    for index in topological_order(dependencies):
+        start = max((finish[upstream] for upstream in dependencies[index]), default=0.0)
+        finish[index] = start + durations[index]
+    return max(finish.values(), default=0.0)
+
+
+def estimate_execution(
+    team_model,
+    session: Session,
+    inputs: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Project the provider mix, tokens, cost and latency of a team execution.
+
+    Every task is routed exactly as an execution would route it, but no
+    provider is called (complexity analysis uses heuristics and cached
+    scores only). Where a role has enough completed tasks in the history
+    window, its token and duration ranges come from that history;
+    otherwise from the router's token estimate and provider health.
+
+    Args:
+        team_model: Team with roles loaded
+        session: Database session for the history query
+        inputs: Execution inputs, as they would be passed to execute
+
+    Returns:
+        Per-task and total estimates plus the team's remaining budget
+    """
+    settings = get_settings()
+
+    # Imported lazily: the hybrid crew pulls in CrewAI and the LLM SDKs
+    from ..core.intelligent_router import get_intelligent_router
+    from .hybrid_crew_extensions import create_hybrid_crew_from_team
+
+    router = get_intelligent_router()
+    crew = create_hybrid_crew_from_team(team_model)
+    routes = crew.dry_run_routes(inputs)
+    dependencies = normalize_dependencies([task.depends_on for task in crew.tasks])
+    history = get_role_history(session, [agent.role_model.id for agent in crew.agents])
+    provider_health = router.get_provider_health()
+
+    tasks: List[Dict[str, Any]] = []
+    latencies: List[tuple] = []
+    for index, (agent, task, (prompt, decision)) in enumerate(zip(crew.agents, crew.tasks, routes)):
+        role_history = history.get(agent.role_model.id)
+        use_history = role_history is not None and role_history["samples"] >= settings.estimate_min_history_samples
+
+        if use_history:
+            low_tokens, expected_tokens, high_tokens = role_history["tokens"]
+        else:
+            # Upstream context is added to the prompt at run time, up to its budget
+            upstream_tokens = min(
+                settings.context_token_budget,
+                settings.expected_output_tokens * len(dependencies[index])
+            )
+            expected_tokens = router.count_tokens(prompt) + settings.expected_output_tokens + upstream_tokens
+            low_tokens = high_tokens = expected_tokens
+
+        # The high end assumes the priciest option in the failover chain
+        price = router.pricing.get(decision.provider, Decimal("0"))
+        worst_price = max(
+            [price] + [router.pricing.get(option.provider, Decimal("0")) for option in decision.fallbacks]
+        )
+
+        duration = role_history["duration"] if use_history else None
+        if duration is None:
+            health = provider_health.get(decision.provider.value, {})
+            typical = health.get("ewma_latency_seconds")
+            slow = health.get("p95_latency_seconds") or typical
+            duration = (typical, typical, slow) if typical is not None else None
+        latencies.append(duration or (0.0, 0.0, 0.0))
+
+        tasks.append({
+            "task_name": task.task_name,
+            "role": agent.role_model.title,
+            "provider": decision.provider.value,
+            "model": decision.model,
+            "complexity": decision.complexity.value,
+            "fallbacks": [option.provider.value for option in decision.fallbacks],
+            "basis": "history" if use_history else "routing",
+            "history_samples": role_history["samples"] if role_history else 0,
+            "tokens": {"low": low_tokens, "expected": expected_tokens, "high": high_tokens},
+            "cost": {
+                "low": float(token_cost(low_tokens, price)),
+                "expected": float(token_cost(expected_tokens, price)),
+                "high": float(token_cost(high_tokens, worst_price))
+            },
+            "latency_seconds": (
+                {"low": duration[0], "expected": duration[1], "high": duration[2]}
+                if duration is not None else None
+            )
+        })
+
+    def total(metric: str, bound: str) -> float:
+        return sum(task[metric][bound] for task in tasks)
+
+    cost = {bound: round(total("cost", bound), 4) for bound in ("low", "expected", "high")}
+    remaining_budget = float(team_model.monthly_budget - team_model.current_spend)
+    logger.info("Execution estimated", team_id=team_model.id, tasks=len(tasks),
+                expected_cost=cost["expected"], remaining_budget=remaining_budget)
+
+    return {
+        "team_id": team_model.id,
+        "tasks": tasks,
+        "provider_mix": dict(Counter(task["provider"] for task in tasks)),
+        "tokens": {bound: int(total("tokens", bound)) for bound in ("low", "expected", "high")},
+        "cost": cost,
+        "latency_seconds": {
+            bound: round(_critical_path(dependencies, [latency[position] for latency in latencies]), 2)
+            for position, bound in enumerate(("low", "expected", "high"))
+        },
+        "tasks_without_latency_data": sum(1 for task in tasks if task["latency_seconds"] is None),
+        "budget": {
+            "monthly_budget": float(team_model.monthly_budget),
+            "remaining": remaining_budget,
+            "within_budget": cost["high"] <= remaining_budget,
+            "expected_within_budget": cost["expected"] <= remaining_budget
+        }
+    }
@@ -0,0 +1,170 @@
+"""Write-behind persistence of task execution rows."""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from ..core.config import get_settings
+from ..core.database import get_db
+from ..models import TaskExecution
+import structlog
+
+logger = structlog.get_logger()
+
+
+class TaskRecord:
+    """Handle for a buffered TaskExecution row (id is set once it is written)."""
+
+    def __init__(self, values: Dict[str, Any]):
+        self.values = values
+        self.id: Optional[int] = None
+        self.writing = False
+        self.deferred: Dict[str, Any] = {}
+
+
+class TaskExecutionRecorder:
+    """
+    Buffers TaskExecution inserts and status updates and writes them in bulk.
+
+    Buffered work is flushed once batch_size operations are pending, every
+    flush_interval_seconds from a background thread, and on close(). Each
+    flush is one short transaction - a multi-row INSERT ... RETURNING id and
+    an executemany UPDATE keyed by primary key - so no connection or
+    transaction is held between flushes.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        session_factory: Callable = get_db
+    ):
+        settings = get_settings()
+        self.batch_size = max(1, batch_size or settings.execution_recorder_batch_size)
+        self.flush_interval_seconds = flush_interval_seconds or settings.execution_recorder_flush_interval_seconds
+        self.session_factory = session_factory
+
+        self._pending_inserts: List[TaskRecord] = []
+        self._pending_updates: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="task-recorder", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "TaskExecutionRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record(self, **values) -> TaskRecord:
+        """Buffer a new TaskExecution row."""
+        handle = TaskRecord(values)
+        with self._lock:
+            self._pending_inserts.append(handle)
+            should_flush = self._pending_count() >= self.batch_size
+        if should_flush:
+            self._flush_quietly()
+        return handle
+
+    def update(self, handle: TaskRecord, **values):
+        """Buffer changes (status, output, metrics...) to a recorded row."""
+        with self._lock:
+            if handle.writing:
+                # Insert is in flight; apply once its id is known
+                handle.deferred.update(values)
+                return
+            if handle.id is None:
+                # Not written yet, fold the change into the pending insert
+                handle.values.update(values)
+                return
+            self._pending_updates.setdefault(handle.id, {}).update(values)
+            should_flush = self._pending_count() >= self.batch_size
+        if should_flush:
+            self._flush_quietly()
+
+    def _pending_count(self) -> int:
+        return len(self._pending_inserts) + len(self._pending_updates)
+
+    def _flush_quietly(self):
+        """Threshold / timer flush: failed work stays queued for the next flush."""
+        try:
+            self.flush()
+        except Exception:
+            pass  # Already logged; close() raises if it still can't be written
+
+    def flush(self):
+        """Write everything buffered so far in one short transaction."""
+        with self._flush_lock:
+            with self._lock:
+                inserts, self._pending_inserts = self._pending_inserts, []
+                updates, self._pending_updates = self._pending_updates, {}
+                for handle in inserts:
+                    handle.writing = True
+
+            if not inserts and not updates:
+                return
+
+            try:
+                with self.session_factory() as session:
+                    ids = self._write(session, inserts, updates)
+                    session.commit()
+            except Exception as e:
+                logger.error("Task execution flush failed", error=str(e),
+                             inserts=len(inserts), updates=len(updates))
+                with self._lock:
+                    # Put the work back so the next flush retries it
+                    for handle in inserts:
+                        handle.writing = False
+                        handle.values.update(handle.deferred)
+                        handle.deferred = {}
+                    self._pending_inserts = inserts + self._pending_inserts
+                    for row_id, values in updates.items():
+                        self._pending_updates[row_id] = {**values, **self._pending_updates.get(row_id, {})}
+                raise
+
+            with self._lock:
+                for handle, row_id in zip(inserts, ids):
+                    handle.id = row_id
+                    handle.writing = False
+                    if handle.deferred:
+                        self._pending_updates.setdefault(row_id, {}).update(handle.deferred)
+                        handle.deferred = {}
+
+            logger.debug("Task executions flushed", inserts=len(inserts), updates=len(updates))
+
+    def _write(
+        self,
+        session: Session,
+        inserts: List[TaskRecord],
+        updates: Dict[int, Dict[str, Any]]
+    ) -> List[int]:
+        ids: List[int] = []
+        if inserts:
+            result = session.execute(
+                insert(TaskExecution).returning(TaskExecution.id, sort_by_parameter_order=True),
+                [handle.values for handle in inserts]
+            )
+            ids = list(result.scalars().all())
+
+        if updates:
+            session.execute(
+                update(TaskExecution),
+                [{"id": row_id, **values} for row_id, values in updates.items()]
+            )
+        return ids
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval_seconds):
+            self._flush_quietly()
+
+    def close(self):
+        """Stop the background flusher and write any remaining rows."""
+        self._stop_event.set()
+        self._thread.join()
+        self.flush()
+        # Updates deferred while the final inserts were being written
+        self.flush()
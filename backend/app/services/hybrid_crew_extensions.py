@@ -11,16 +11,19 @@ Key Features:
 - Transparent cost reporting
 """
 
+import threading
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from decimal import Decimal
 
 from crewai import Agent, Task, Crew, Process
-from sqlalchemy.orm import Session
+from pydantic import Field, PrivateAttr
 
-from ..models import Role, TeamExecution, TaskExecution, TeamStatus
-from ..core.database import SessionLocal
+from ..models import Role, Team, TeamExecution, TaskExecution, TeamStatus
+from ..core.config import get_settings
+from ..core.database import get_db
+from ..core.pricing import token_cost
 from ..core.intelligent_router import (
     get_intelligent_router, 
     ComplexityLevel,
@@ -28,11 +31,19 @@ from ..core.intelligent_router import (
     RoutingDecision,
     ExecutionResult
 )
+from .context_manager import TaskContextManager
+from .crew_blueprints import RoleSpec, get_blueprint_cache
+from .execution_recorder import TaskExecutionRecorder
+from .task_scheduler import normalize_dependencies, resolve_role_dependencies, run_dag
 import structlog
 
 logger = structlog.get_logger()
 
 
+class BudgetExhaustedError(RuntimeError):
+    """The team budget ran out before a task could start"""
+
+
 class HybridNuiFloAgent(Agent):
     """
     🧠 Hybrid AI Agent - Smart, Cost-Effective, Powerful
@@ -45,6 +56,14 @@ class HybridNuiFloAgent(Agent):
     Result: Up to 80% cost savings while maintaining quality!
     """
     
+    # CrewAI models reject undeclared attributes, so routing state is declared
+    role_model: Any = Field(default=None, exclude=True)
+    team_execution_id: Optional[int] = None
+    max_budget_per_task: Decimal = Decimal("1.00")
+    quality_preference: str = "balanced"
+    router: Any = Field(default=None, exclude=True)
+    execution_metrics: Dict[str, Any] = Field(default_factory=dict)
+    
     def __init__(
         self,
         role_model: Role,
@@ -62,24 +81,6 @@ class HybridNuiFloAgent(Agent):
             max_budget_per_task: Maximum spend per task (cost control)
             quality_preference: Speed vs quality preference
         """
-        self.role_model = role_model
-        self.team_execution_id = team_execution_id
-        self.max_budget_per_task = max_budget_per_task or Decimal("1.00")  # $1 default
-        self.quality_preference = quality_preference
-        
-        # Get intelligent router
-        self.router = get_intelligent_router()
-        
-        # Initialize execution tracking
-        self.execution_metrics = {
-            "total_tokens": 0,
-            "total_cost": Decimal("0.00"),
-            "ollama_calls": 0,
-            "commercial_calls": 0,
-            "savings": Decimal("0.00"),
-            "task_history": []
-        }
-        
         # Extract role details for CrewAI
         role = role_model.title
         goal = f"Expert {role_model.expertise.value} level {role_model.title}"
@@ -94,6 +95,12 @@ class HybridNuiFloAgent(Agent):
             goal=goal,
             backstory=backstory,
             verbose=True,
+            role_model=role_model,
+            team_execution_id=team_execution_id,
+            max_budget_per_task=max_budget_per_task or Decimal("1.00"),  # $1 default
+            quality_preference=quality_preference,
+            router=get_intelligent_router(),  # Intelligent router
+            execution_metrics=self._new_execution_metrics(),
             **kwargs
         )
         
@@ -101,42 +108,41 @@ class HybridNuiFloAgent(Agent):
                    max_budget=float(self.max_budget_per_task),
                    quality=quality_preference)
     
-    def execute_task(self, task_prompt: str, context: Optional[str] = None) -> str:
+    @staticmethod
+    def _new_execution_metrics() -> Dict[str, Any]:
+        return {
+            "total_tokens": 0,
+            "total_cost": Decimal("0.00"),
+            "ollama_calls": 0,
+            "commercial_calls": 0,
+            "cache_hits": 0,
+            "savings": Decimal("0.00"),
+            "task_history": []
+        }
+    
+    def clone_for_run(self) -> "HybridNuiFloAgent":
+        """Cheap copy of a blueprint agent with fresh per-run state"""
+        clone = self.model_copy()
+        clone.team_execution_id = None
+        clone.execution_metrics = self._new_execution_metrics()
+        return clone
+    
+    def execute_task(
+        self,
+        task_prompt: str,
+        context: Optional[str] = None,
+        complexity: Optional[ComplexityLevel] = None
+    ) -> str:
         """
         🚀 Execute task with intelligent LLM routing
         
         This is where the magic happens - smart routing for optimal cost/quality!
+        A complexity planned up front by the crew skips the per-task analysis.
         """
         start_time = time.time()
         
         try:
-            # 1. Get routing decision from our intelligent router
-            routing_decision = self.router.route_request(
-                prompt=task_prompt,
-                context=context,
-                max_budget=self.max_budget_per_task,
-                preferred_quality=self.quality_preference
-            )
-            
-            logger.info(f"🎯 Routing to {routing_decision.provider.value}",
-                       estimated_cost=float(routing_decision.estimated_cost),
-                       complexity=routing_decision.complexity.value)
-            
-            # 2. Execute using the selected provider
-            result = self.router.execute_request(routing_decision, task_prompt)
-            
-            # 3. Track execution metrics
-            self._track_execution(routing_decision, result)
-            
-            # 4. Calculate savings (vs always using GPT-4)
-            savings = self._calculate_savings(result)
-            
-            logger.info(f"✅ Task completed successfully",
-                       provider=result.provider.value,
-                       actual_cost=float(result.actual_cost),
-                       savings=float(savings),
-                       tokens=result.actual_tokens)
-            
+            _, result = self.execute_routed(task_prompt, context, complexity)
             return result.content
             
         except Exception as e:
@@ -146,6 +152,62 @@ class HybridNuiFloAgent(Agent):
             # Fallback to simple response
             return f"Task execution failed: {str(e)}"
     
+    def execute_routed(
+        self,
+        task_prompt: str,
+        context: Optional[str] = None,
+        complexity: Optional[ComplexityLevel] = None,
+        max_cost: Optional[Decimal] = None
+    ) -> Tuple[RoutingDecision, ExecutionResult]:
+        """
+        Route and execute a task, returning the decision and the result
+        
+        Unlike execute_task(), failures raise instead of becoming the output.
+        Spend is metered during the call and capped at the agent's per-task
+        budget, or max_cost when that is lower; a capped generation returns
+        its partial output with result.truncated set.
+        """
+        budget = self.max_budget_per_task if max_cost is None else min(self.max_budget_per_task, max_cost)
+        
+        # 1. Get routing decision from our intelligent router
+        routing_decision = self.router.route_request(
+            prompt=task_prompt,
+            context=context,
+            max_budget=budget,
+            preferred_quality=self.quality_preference,
+            complexity=complexity
+        )
+        
+        logger.info(f"🎯 Routing to {routing_decision.provider.value}",
+                   estimated_cost=float(routing_decision.estimated_cost),
+                   complexity=routing_decision.complexity.value)
+        
+        # 2. Execute using the selected provider, stopping at the budget
+        result = self.router.execute_metered(routing_decision, task_prompt, budget)
+        
+        # 3. Track execution metrics
+        self._track_execution(routing_decision, result)
+        
+        if not result.success:
+            # Every option in the fallback chain failed
+            raise RuntimeError(result.error or "All LLM providers failed")
+        
+        if result.truncated:
+            logger.warning(f"💸 Output truncated at the ${budget} task budget",
+                          provider=result.provider.value,
+                          tokens=result.actual_tokens)
+        
+        # 4. Calculate savings (vs always using GPT-4)
+        savings = self._calculate_savings(result)
+        
+        logger.info("✅ Task completed successfully",
+                   provider=result.provider.value,
+                   actual_cost=float(result.actual_cost),
+                   savings=float(savings),
+                   tokens=result.actual_tokens)
+        
+        return routing_decision, result
+    
     def _track_execution(self, decision: RoutingDecision, result: ExecutionResult):
         """Track execution metrics for cost analysis"""
         # Update totals
@@ -153,13 +215,15 @@ class HybridNuiFloAgent(Agent):
         self.execution_metrics["total_cost"] += result.actual_cost
         
         # Track provider usage
-        if result.provider == LLMProvider.OLLAMA_MISTRAL:
+        if result.cached:
+            self.execution_metrics["cache_hits"] += 1
+        elif result.provider == LLMProvider.OLLAMA_MISTRAL:
             self.execution_metrics["ollama_calls"] += 1
         else:
             self.execution_metrics["commercial_calls"] += 1
         
         # Calculate savings vs always using GPT-4
-        gpt4_cost = (result.actual_tokens / 1000) * Decimal("0.03")  # GPT-4 pricing
+        gpt4_cost = token_cost(result.actual_tokens, Decimal("0.03"))  # GPT-4 pricing
         savings = gpt4_cost - result.actual_cost
         self.execution_metrics["savings"] += savings
         
@@ -170,18 +234,25 @@ class HybridNuiFloAgent(Agent):
             "tokens": result.actual_tokens,
             "cost": float(result.actual_cost),
             "savings": float(savings),
+            "cached": result.cached,
+            "truncated": result.truncated,
+            "attempts": len(result.attempts),
             "duration": result.duration_seconds,
             "timestamp": datetime.utcnow().isoformat()
         })
     
     def _calculate_savings(self, result: ExecutionResult) -> Decimal:
         """Calculate savings vs always using premium models"""
-        gpt4_cost = (result.actual_tokens / 1000) * Decimal("0.03")
+        gpt4_cost = token_cost(result.actual_tokens, Decimal("0.03"))
         return gpt4_cost - result.actual_cost
     
     def get_cost_summary(self) -> Dict[str, Any]:
         """Get comprehensive cost and savings summary"""
-        total_calls = self.execution_metrics["ollama_calls"] + self.execution_metrics["commercial_calls"]
+        total_calls = (
+            self.execution_metrics["ollama_calls"]
+            + self.execution_metrics["commercial_calls"]
+            + self.execution_metrics["cache_hits"]
+        )
         
         if total_calls == 0:
             return {"message": "No tasks executed yet"}
@@ -195,6 +266,7 @@ class HybridNuiFloAgent(Agent):
             "total_calls": total_calls,
             "ollama_calls": self.execution_metrics["ollama_calls"],
             "commercial_calls": self.execution_metrics["commercial_calls"],
+            "cache_hits": self.execution_metrics["cache_hits"],
             "ollama_percentage": round(ollama_percentage, 1),
             "average_cost_per_call": float(self.execution_metrics["total_cost"] / total_calls),
             "cost_efficiency": f"{ollama_percentage:.1f}% of calls were FREE!",
@@ -209,6 +281,13 @@ class HybridNuiFloTask(Task):
     Extends CrewAI Task with smart routing and cost tracking
     """
     
+    task_name: Optional[str] = None
+    complexity_hint: Optional[ComplexityLevel] = None
+    max_budget: Optional[Decimal] = None
+    depends_on: Optional[List[int]] = None  # Upstream task indexes, None = previous task
+    execution_start: Optional[datetime] = None
+    execution_end: Optional[datetime] = None
+    
     def __init__(
         self,
         description: str,
@@ -217,6 +296,7 @@ class HybridNuiFloTask(Task):
         task_name: str,
         complexity_hint: Optional[ComplexityLevel] = None,
         max_budget: Optional[Decimal] = None,
+        depends_on: Optional[List[int]] = None,
         **kwargs
     ):
         super().__init__(
@@ -229,10 +309,18 @@ class HybridNuiFloTask(Task):
         self.task_name = task_name
         self.complexity_hint = complexity_hint
         self.max_budget = max_budget
+        self.depends_on = depends_on
         self.execution_start = None
         self.execution_end = None
         
         logger.info(f"🎯 Hybrid Task created: {task_name}")
+    
+    def clone_for_run(self, agent: HybridNuiFloAgent) -> "HybridNuiFloTask":
+        """Cheap copy of a blueprint task bound to a per-run agent"""
+        clone = self.model_copy(update={"agent": agent})
+        clone.execution_start = None
+        clone.execution_end = None
+        return clone
 
 
 class HybridNuiFloCrew(Crew):
@@ -246,6 +334,14 @@ class HybridNuiFloCrew(Crew):
     - Automatic quality scaling
     """
     
+    team_model: Any = Field(default=None, exclude=True)
+    max_team_budget: Decimal = Decimal("10.00")
+    team_execution_id: Optional[int] = None
+    max_concurrency: int = 1
+    context_manager: Any = Field(default=None, exclude=True)
+    team_metrics: Dict[str, Any] = Field(default_factory=dict)
+    _metrics_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    
     def __init__(
         self,
         team_model,
@@ -253,6 +349,7 @@ class HybridNuiFloCrew(Crew):
         tasks: List[HybridNuiFloTask],
         max_team_budget: Optional[Decimal] = None,
         team_execution_id: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
         **kwargs
     ):
         super().__init__(
@@ -264,8 +361,10 @@ class HybridNuiFloCrew(Crew):
         )
         
         self.team_model = team_model
-        self.max_team_budget = max_team_budget or Decimal("10.00")  # $10 default
+        self.max_team_budget = Decimal("10.00") if max_team_budget is None else max_team_budget  # $10 default
         self.team_execution_id = team_execution_id
+        self.max_concurrency = max_concurrency or get_settings().crew_max_concurrency
+        self.context_manager = TaskContextManager(get_intelligent_router())
         
         # Team-level metrics
         self.team_metrics = {
@@ -274,47 +373,120 @@ class HybridNuiFloCrew(Crew):
             "execution_start": None,
             "execution_end": None,
             "agents_summary": {},
-            "budget_utilization": 0.0
+            "budget_utilization": 0.0,
+            "resumed_tasks": 0,  # Tasks served from an earlier run's checkpoints
+            "resumed_cost": Decimal("0.00"),
+            "resumed_tokens": 0,
+            "reserved_budget": Decimal("0.00")  # Budget granted to tasks still running
         }
         
         logger.info(f"🚀 Hybrid Crew assembled: {team_model.name}",
                    agents=len(agents),
                    tasks=len(tasks),
-                   max_budget=float(max_team_budget))
+                   max_budget=float(self.max_team_budget))
     
     def execute_with_tracking(self, inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         🎯 Execute crew with comprehensive cost tracking and optimization
         
+        Every finished task is checkpointed as a TaskExecution row. When the
+        crew is given the team_execution_id of an earlier run, tasks whose role
+        has a completed checkpoint are not executed again: their saved output feeds
+        the downstream tasks and the run continues from the first incomplete
+        task.
+        
         Returns detailed cost analysis and savings report!
         """
         self.team_metrics["execution_start"] = datetime.utcnow()
         
         try:
-            # Execute each task with our hybrid agents
-            task_results = []
+            checkpoints = self._start_execution(inputs)
             
-            for i, (agent, task) in enumerate(zip(self.agents, self.tasks)):
-                logger.info(f"▶️ Executing task {i+1}/{len(self.tasks)}: {task.task_name}")
-                
-                # Check budget before execution
-                if self.team_metrics["total_cost"] >= self.max_team_budget:
-                    logger.warning(f"⚠️ Budget limit reached, skipping remaining tasks")
-                    break
-                
-                # Build task prompt with context
-                task_prompt = self._build_task_prompt(task, inputs, task_results)
-                
-                # Execute task with hybrid routing
-                result = agent.execute_task(task_prompt)
-                task_results.append(result)
+            # Each task starts as soon as its upstream tasks are done
+            planned_routes = self._plan_routes(inputs)
+            dependencies = normalize_dependencies([task.depends_on for task in self.tasks])
+            
+            with TaskExecutionRecorder() as recorder:
+                def run_task(i: int, upstream: Dict[int, Optional[str]]) -> Optional[str]:
+                    agent, task = self.agents[i], self.tasks[i]
+                    
+                    checkpoint = checkpoints.get(agent.role_model.id)
+                    if checkpoint is not None:
+                        logger.info(f"⏭️ Reusing checkpoint for task {i+1}/{len(self.tasks)}: {task.task_name}")
+                        with self._metrics_lock:
+                            self.team_metrics["resumed_tasks"] += 1
+                            self.team_metrics["resumed_cost"] += Decimal(str(checkpoint.cost or 0))
+                            # Already spent on this execution, counts against its budget
+                            self.team_metrics["total_cost"] += Decimal(str(checkpoint.cost or 0))
+                            self.team_metrics["resumed_tokens"] += checkpoint.tokens_used or 0
+                        output_data = checkpoint.output_data or {}
+                        if output_data.get("result") is not None:
+                            self.context_manager.restore(
+                                task.task_name,
+                                output_data.get("context") or output_data["result"]
+                            )
+                        return output_data.get("result")
+                    
+                    logger.info(f"▶️ Executing task {i+1}/{len(self.tasks)}: {task.task_name}")
+                    
+                    # Reserve this task's share of the remaining team budget, so
+                    # tasks running in parallel can't overspend it together
+                    with self._metrics_lock:
+                        grant = min(
+                            agent.max_budget_per_task,
+                            self.max_team_budget - self.team_metrics["total_cost"] - self.team_metrics["reserved_budget"]
+                        )
+                        if grant > 0:
+                            self.team_metrics["reserved_budget"] += grant
+                    
+                    if grant <= 0:
+                        # Fail the task so its dependents are blocked and a resume picks it up
+                        logger.warning(f"⚠️ Budget limit reached, skipping {task.task_name}")
+                        error = BudgetExhaustedError(f"Team budget of ${self.max_team_budget} exhausted before {task.task_name}")
+                        task.execution_start = task.execution_end = datetime.utcnow()
+                        self._save_checkpoint(recorder, task, TeamStatus.FAILED.value, inputs, error=str(error))
+                        raise error
+                    
+                    # Build task prompt with the bounded context of the declared upstream tasks
+                    upstream_names = [
+                        self.tasks[index].task_name
+                        for index, result in upstream.items()
+                        if result is not None
+                    ]
+                    upstream_context = self.context_manager.context_for(upstream_names)
+                    task_prompt = self._build_task_prompt(task, inputs, upstream_context)
+                    
+                    # Execute task with hybrid routing
+                    task.execution_start = datetime.utcnow()
+                    try:
+                        decision, result = agent.execute_routed(
+                            task_prompt,
+                            complexity=planned_routes[i].complexity,
+                            max_cost=grant
+                        )
+                    except Exception as e:
+                        task.execution_end = datetime.utcnow()
+                        self._save_checkpoint(recorder, task, TeamStatus.FAILED.value, inputs, error=str(e))
+                        self._update_team_metrics(agent, released_budget=grant)
+                        raise
+                    task.execution_end = datetime.utcnow()
+                    
+                    context = self.context_manager.add_result(task.task_name, upstream_names, result.content)
+                    self._save_checkpoint(recorder, task, TeamStatus.COMPLETED.value, inputs, decision, result,
+                                          context=context)
+                    
+                    # Update team metrics
+                    self._update_team_metrics(agent, released_budget=grant)
+                    return result.content
                 
-                # Update team metrics
-                self._update_team_metrics(agent)
+                results = run_dag(dependencies, run_task, max_concurrency=self.max_concurrency)
+            
+            task_results = [results[i] for i in sorted(results) if results[i] is not None]
             
             # Finalize execution
             self.team_metrics["execution_end"] = datetime.utcnow()
             final_result = "\n\n".join(task_results)
+            self._finish_execution(TeamStatus.COMPLETED, result=final_result)
             
             # Generate comprehensive report
             return self._generate_execution_report(final_result)
@@ -322,47 +494,228 @@ class HybridNuiFloCrew(Crew):
         except Exception as e:
             logger.error(f"❌ Crew execution failed: {e}")
             self.team_metrics["execution_end"] = datetime.utcnow()
+            self._finish_execution(TeamStatus.FAILED, error=str(e))
             
             return {
                 "result": f"Execution failed: {str(e)}",
                 "success": False,
                 "error": str(e),
-                "metrics": self._get_team_cost_summary()
+                "metrics": self._get_team_cost_summary(),
+                "team_execution_id": self.team_execution_id
             }
     
+    def _start_execution(self, inputs: Optional[Dict[str, Any]]) -> Dict[int, TaskExecution]:
+        """Create the execution record, or reopen it and load its checkpoints by role id"""
+        with get_db() as session:
+            if self.team_execution_id is None:
+                team_execution = TeamExecution(
+                    team_id=self.team_model.id,
+                    status=TeamStatus.RUNNING.value,
+                    execution_metadata=inputs or {},
+                    started_at=self.team_metrics["execution_start"]
+                )
+                session.add(team_execution)
+                session.commit()
+                self.team_execution_id = team_execution.id
+                self._apply_monthly_ceiling(session.get(Team, self.team_model.id))
+                return {}
+            
+            team_execution = session.get(TeamExecution, self.team_execution_id)
+            team_execution.status = TeamStatus.RUNNING.value
+            team_execution.error_message = None
+            session.commit()
+            
+            # Latest completed checkpoint per role
+            rows = (
+                session.query(TaskExecution)
+                .filter(
+                    TaskExecution.team_execution_id == self.team_execution_id,
+                    TaskExecution.status == TeamStatus.COMPLETED.value
+                )
+                .order_by(TaskExecution.id)
+                .all()
+            )
+            
+            # Keyed by role, which survives roles being added or reordered;
+            # outputs of roles that are gone or inactive are not reused
+            role_ids = {agent.role_model.id for agent in self.agents}
+            checkpoints = {row.role_id: row for row in rows if row.role_id in role_ids}
+            
+            # Checkpointed tasks were charged to current_spend when the earlier run finished
+            self._apply_monthly_ceiling(
+                session.get(Team, self.team_model.id),
+                already_charged=sum((Decimal(str(row.cost or 0)) for row in checkpoints.values()), Decimal("0.00"))
+            )
+            session.expunge_all()
+        
+        logger.info(f"🔁 Resuming execution {self.team_execution_id}",
+                   completed_tasks=len(checkpoints),
+                   total_tasks=len(self.tasks))
+        return checkpoints
+    
+    def _apply_monthly_ceiling(self, team: Team, already_charged: Decimal = Decimal("0.00")):
+        """Cap the execution budget at what is left of the team's monthly budget"""
+        remaining = team.monthly_budget - team.current_spend + already_charged
+        if remaining < self.max_team_budget:
+            logger.info("💰 Execution budget capped by remaining monthly budget",
+                       team_id=team.id,
+                       requested=float(self.max_team_budget),
+                       remaining=float(remaining))
+            self.max_team_budget = max(remaining, Decimal("0.00"))
+    
+    def _save_checkpoint(
+        self,
+        recorder: TaskExecutionRecorder,
+        task: HybridNuiFloTask,
+        status: str,
+        inputs: Optional[Dict[str, Any]],
+        decision: Optional[RoutingDecision] = None,
+        result: Optional[ExecutionResult] = None,
+        error: Optional[str] = None,
+        context: Optional[str] = None
+    ):
+        """Persist a task's outcome (output, context digest, tokens, cost, routing) as its checkpoint"""
+        output_data = None
+        if result is not None:
+            output_data = {
+                "result": result.content,
+                "context": context,
+                "routing": {
+                    "provider": result.provider.value,
+                    "model": decision.model,
+                    "complexity": decision.complexity.value,
+                    "estimated_cost": float(decision.estimated_cost),
+                    "reasoning": decision.reasoning,
+                    "cached": result.cached,
+                    "truncated": result.truncated
+                }
+            }
+        
+        recorder.record(
+            team_execution_id=self.team_execution_id,
+            role_id=task.agent.role_model.id,
+            task_name=task.task_name,
+            task_description=task.description,
+            status=status,
+            input_data=inputs,
+            output_data=output_data,
+            error_message=error,
+            tokens_used=result.actual_tokens if result else 0,
+            cost=result.actual_cost if result else Decimal("0.00"),
+            duration_seconds=result.duration_seconds if result else None,
+            started_at=task.execution_start,
+            completed_at=task.execution_end
+        )
+    
+    def _finish_execution(
+        self,
+        status: TeamStatus,
+        result: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        """Record the outcome on the execution and the team's spend"""
+        if self.team_execution_id is None:
+            return
+        
+        duration = (
+            self.team_metrics["execution_end"] - self.team_metrics["execution_start"]
+        ).total_seconds()
+        
+        try:
+            with get_db() as session:
+                team_execution = session.get(TeamExecution, self.team_execution_id)
+                team_execution.status = status.value
+                team_execution.result = result
+                team_execution.error_message = error
+                team_execution.completed_at = self.team_metrics["execution_end"]
+                # Totals cover the whole execution, including resumed checkpoints
+                team_execution.cost = self.team_metrics["total_cost"]
+                team_execution.tokens_used = sum(
+                    agent.execution_metrics["total_tokens"] for agent in self.agents
+                ) + self.team_metrics["resumed_tokens"]
+                team_execution.duration_seconds = duration
+                
+                team = session.get(Team, self.team_model.id)
+                # Resumed checkpoints were charged by the run that produced them
+                team.current_spend += self.team_metrics["total_cost"] - self.team_metrics["resumed_cost"]
+                team.last_executed_at = self.team_metrics["execution_end"]
+                team.status = status
+                
+                session.commit()
+        except Exception as e:
+            logger.error(f"❌ Failed to record execution outcome: {e}",
+                        team_execution_id=self.team_execution_id)
+    
+    def _plan_routes(self, inputs: Optional[Dict[str, Any]], use_llm: bool = True) -> List[RoutingDecision]:
+        """Analyze and route every task up front with one batched router call"""
+        planning_prompts = [self._build_task_prompt(task, inputs) for task in self.tasks]
+        quality = self.agents[0].quality_preference if self.agents else "balanced"
+        
+        return get_intelligent_router().route_many(
+            planning_prompts,
+            max_budget=self.max_team_budget,
+            preferred_quality=quality,
+            use_llm=use_llm
+        )
+    
+    def dry_run_routes(self, inputs: Optional[Dict[str, Any]] = None) -> List[Tuple[str, RoutingDecision]]:
+        """
+        🔮 Route every task the way an execution would, without calling any provider
+        
+        Returns:
+            (task prompt, routing decision) per task, in crew order
+        """
+        planned_routes = self._plan_routes(inputs, use_llm=False)
+        router = get_intelligent_router()
+        
+        routes = []
+        for agent, task, planned in zip(self.agents, self.tasks, planned_routes):
+            task_prompt = self._build_task_prompt(task, inputs)
+            decision = router.route_request(
+                prompt=task_prompt,
+                max_budget=agent.max_budget_per_task,
+                preferred_quality=agent.quality_preference,
+                complexity=planned.complexity
+            )
+            routes.append((task_prompt, decision))
+        return routes
+    
     def _build_task_prompt(
         self, 
         task: HybridNuiFloTask, 
         inputs: Optional[Dict[str, Any]], 
-        previous_results: List[str]
+        upstream_context: Optional[str] = None
     ) -> str:
-        """Build comprehensive task prompt with context"""
+        """Build task prompt with token-bounded inputs and upstream context"""
         prompt_parts = [
             f"Role: {task.agent.role}",
             f"Task: {task.description}",
             f"Expected Output: {task.expected_output}"
         ]
         
-        if inputs:
-            prompt_parts.append(f"Input Context: {inputs}")
+        rendered_inputs = self.context_manager.render_inputs(inputs)
+        if rendered_inputs:
+            prompt_parts.append(f"Input Context:\n{rendered_inputs}")
         
-        if previous_results:
-            prompt_parts.append(f"Previous Task Results: {previous_results[-1]}")  # Last result as context
+        if upstream_context:
+            prompt_parts.append(f"Previous Task Results:\n{upstream_context}")
         
         return "\n\n".join(prompt_parts)
     
-    def _update_team_metrics(self, agent: HybridNuiFloAgent):
-        """Update team-level metrics from agent execution"""
+    def _update_team_metrics(self, agent: HybridNuiFloAgent, released_budget: Decimal = Decimal("0.00")):
+        """Update team-level metrics from agent execution and release its budget reservation"""
         agent_summary = agent.get_cost_summary()
         
-        self.team_metrics["total_cost"] += agent.execution_metrics["total_cost"]
-        self.team_metrics["total_savings"] += agent.execution_metrics["savings"]
-        self.team_metrics["agents_summary"][agent.role] = agent_summary
-        
-        # Calculate budget utilization
-        self.team_metrics["budget_utilization"] = float(
-            (self.team_metrics["total_cost"] / self.max_team_budget) * 100
-        )
+        with self._metrics_lock:
+            self.team_metrics["reserved_budget"] -= released_budget
+            self.team_metrics["total_cost"] += agent.execution_metrics["total_cost"]
+            self.team_metrics["total_savings"] += agent.execution_metrics["savings"]
+            self.team_metrics["agents_summary"][agent.role] = agent_summary
+            
+            # Calculate budget utilization
+            self.team_metrics["budget_utilization"] = float(
+                (self.team_metrics["total_cost"] / self.max_team_budget) * 100
+            ) if self.max_team_budget > 0 else 100.0
     
     def _generate_execution_report(self, final_result: str) -> Dict[str, Any]:
         """Generate comprehensive execution report with cost analysis"""
@@ -397,7 +750,8 @@ class HybridNuiFloCrew(Crew):
                     "commercial_calls": total_commercial_calls,
                     "free_percentage": round(efficiency_score, 1)
                 },
-                "agents_performance": self.team_metrics["agents_summary"]
+                "agents_performance": self.team_metrics["agents_summary"],
+                "resumed_tasks": self.team_metrics["resumed_tasks"]
             },
             "team_execution_id": self.team_execution_id,
             "cost_summary": f"💰 Spent ${self.team_metrics['total_cost']:.4f}, Saved ${self.team_metrics['total_savings']:.4f} ({efficiency_score:.1f}% FREE calls!)"
@@ -413,29 +767,63 @@ class HybridNuiFloCrew(Crew):
         }
 
 
-def create_hybrid_crew_from_team(team_model, max_budget: Optional[Decimal] = None) -> HybridNuiFloCrew:
+def create_hybrid_crew_from_team(
+    team_model,
+    max_budget: Optional[Decimal] = None,
+    max_concurrency: Optional[int] = None
+) -> HybridNuiFloCrew:
     """
     🏭 Factory function to create a Hybrid Crew from database Team model
     
     This is where we transform traditional AI teams into cost-optimized powerhouses!
+    Agents and tasks come from a cached blueprint of the team's configuration;
+    only the per-run copies and the crew itself are created per execution.
     """
+    blueprint = get_blueprint_cache().get_or_build(
+        "hybrid",
+        team_model,
+        lambda roles: _build_hybrid_agents_and_tasks(team_model, roles, max_budget),
+        params=(max_budget,)
+    )
+    agents, tasks = blueprint.instantiate()
+    
+    # Create hybrid crew
+    crew = HybridNuiFloCrew(
+        team_model=team_model,
+        agents=agents,
+        tasks=tasks,
+        max_team_budget=max_budget or team_model.monthly_budget,
+        max_concurrency=max_concurrency
+    )
+    
+    return crew
+
+
+def _build_hybrid_agents_and_tasks(
+    team_model,
+    roles: List[RoleSpec],
+    max_budget: Optional[Decimal] = None
+) -> Tuple[List[HybridNuiFloAgent], List[HybridNuiFloTask]]:
+    """Build and validate the template agents and tasks of a team's blueprint"""
     # Create hybrid agents from team roles
     agents = []
-    for role in team_model.roles:
-        if role.is_active:
-            # Calculate per-agent budget (distribute team budget)
-            agent_budget = (max_budget / len(team_model.roles)) if max_budget else Decimal("2.00")
-            
-            agent = HybridNuiFloAgent(
-                role_model=role,
-                max_budget_per_task=agent_budget,
-                quality_preference="balanced"  # TODO: Make this configurable per team
-            )
-            agents.append(agent)
+    for role in roles:
+        # Calculate per-agent budget (distribute team budget)
+        agent_budget = (max_budget / len(team_model.roles)) if max_budget else Decimal("2.00")
+        
+        agent = HybridNuiFloAgent(
+            role_model=role,
+            max_budget_per_task=agent_budget,
+            quality_preference="balanced"  # TODO: Make this configurable per team
+        )
+        agents.append(agent)
     
     if not agents:
         raise ValueError(f"Team {team_model.name} has no active roles")
     
+    # Task ordering and context come from agent_config "depends_on" / "independent"
+    dependencies = resolve_role_dependencies([agent.role_model for agent in agents])
+    
     # Create hybrid tasks for each agent
     tasks = []
     for i, agent in enumerate(agents):
@@ -450,20 +838,13 @@ def create_hybrid_crew_from_team(team_model, max_budget: Optional[Decimal] = Non
             expected_output="Detailed professional analysis with specific recommendations",
             agent=agent,
             task_name=f"Task_{i+1}_{agent.role_model.title.replace(' ', '_')}",
-            max_budget=agent.max_budget_per_task
+            max_budget=agent.max_budget_per_task,
+            depends_on=dependencies[i]
         )
         tasks.append(task)
     
-    # Create hybrid crew
-    crew = HybridNuiFloCrew(
-        team_model=team_model,
-        agents=agents,
-        tasks=tasks,
-        max_team_budget=max_budget or team_model.monthly_budget
-    )
-    
     logger.info(f"🚀 Hybrid Crew factory complete: {team_model.name}",
                agents=len(agents),
                estimated_savings="Up to 80% cost reduction!")
     
-    return crew 
\ No newline at end of file
+    return agents, tasks 
\ No newline at end of file
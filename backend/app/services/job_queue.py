@@ -0,0 +1,173 @@
+"""Durable Postgres-backed queue of team execution jobs."""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from ..models import ExecutionJob, JobStatus, TeamExecution, TeamStatus
+from ..core.config import get_settings
+from ..core.database import get_db
+import structlog
+
+logger = structlog.get_logger()
+
+
+class JobQueue:
+    """
+    Execution jobs claimed with SELECT ... FOR UPDATE SKIP LOCKED.
+
+    A claimed job is leased to one worker, which keeps the lease alive with
+    heartbeats. A RUNNING job whose heartbeat is older than the visibility
+    timeout belonged to a crashed worker and is claimed again by the next
+    poll. Failures are retried with exponential backoff up to max_attempts.
+    Every operation is its own short transaction.
+    """
+
+    def __init__(
+        self,
+        visibility_timeout_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay_seconds: Optional[float] = None
+    ):
+        settings = get_settings()
+        self.visibility_timeout_seconds = visibility_timeout_seconds or settings.job_visibility_timeout_seconds
+        self.max_attempts = max_attempts or settings.job_max_attempts
+        self.retry_delay_seconds = retry_delay_seconds or settings.job_retry_delay_seconds
+
+    def enqueue(self, session: Session, team_execution_id: int) -> ExecutionJob:
+        """Add a job for an execution; committed with the caller's transaction."""
+        job = ExecutionJob(
+            team_execution_id=team_execution_id,
+            status=JobStatus.QUEUED.value,
+            max_attempts=self.max_attempts,
+            run_after=datetime.utcnow()
+        )
+        session.add(job)
+        return job
+
+    def claim(self, worker_id: str) -> Optional[ExecutionJob]:
+        """Lease the next due job, or None when the queue is empty."""
+        now = datetime.utcnow()
+        expired = now - timedelta(seconds=self.visibility_timeout_seconds)
+
+        with get_db() as session:
+            job = (
+                session.query(ExecutionJob)
+                .filter(or_(
+                    (ExecutionJob.status == JobStatus.QUEUED.value) & (ExecutionJob.run_after <= now),
+                    (ExecutionJob.status == JobStatus.RUNNING.value) & (ExecutionJob.heartbeat_at < expired)
+                ))
+                .order_by(ExecutionJob.run_after, ExecutionJob.id)
+                .with_for_update(skip_locked=True)
+                .limit(1)
+                .first()
+            )
+            if job is None:
+                return None
+
+            if job.status == JobStatus.RUNNING.value:
+                logger.warning("Reclaiming job from unresponsive worker",
+                               job_id=job.id, previous_worker=job.locked_by)
+                if job.attempts >= job.max_attempts:
+                    job.status = JobStatus.FAILED.value
+                    job.last_error = f"Worker {job.locked_by} stopped responding"
+                    job.completed_at = now
+                    self._fail_execution(session, job.team_execution_id, job.last_error)
+                    session.commit()
+                    return None
+
+            job.status = JobStatus.RUNNING.value
+            job.attempts += 1
+            job.locked_by = worker_id
+            job.locked_at = now
+            job.heartbeat_at = now
+            session.commit()
+            session.refresh(job)
+            session.expunge(job)
+
+        logger.info("Job claimed", job_id=job.id, worker=worker_id, attempt=job.attempts)
+        return job
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Extend the lease; False if the job is no longer held by this worker."""
+        return self._update_leased(job_id, worker_id, heartbeat_at=datetime.utcnow())
+
+    def complete(self, job_id: int, worker_id: str) -> bool:
+        """Mark a leased job done."""
+        return self._update_leased(
+            job_id,
+            worker_id,
+            status=JobStatus.COMPLETED.value,
+            completed_at=datetime.utcnow(),
+            locked_by=None
+        )
+
+    def fail(self, job: ExecutionJob, worker_id: str, error: str) -> bool:
+        """Schedule a retry with backoff, or fail the job after its last attempt."""
+        now = datetime.utcnow()
+        if job.attempts >= job.max_attempts:
+            logger.error("Job failed permanently", job_id=job.id, attempts=job.attempts, error=error)
+            updated = self._update_leased(
+                job.id,
+                worker_id,
+                status=JobStatus.FAILED.value,
+                last_error=error,
+                completed_at=now,
+                locked_by=None
+            )
+            if updated:
+                with get_db() as session:
+                    self._fail_execution(session, job.team_execution_id, error)
+                    session.commit()
+            return updated
+
+        delay = self.retry_delay_seconds * (2 ** (job.attempts - 1))
+        logger.warning("Job failed, retrying", job_id=job.id, attempt=job.attempts,
+                       retry_in_seconds=delay, error=error)
+        return self._update_leased(
+            job.id,
+            worker_id,
+            status=JobStatus.QUEUED.value,
+            last_error=error,
+            run_after=now + timedelta(seconds=delay),
+            locked_by=None
+        )
+
+    def _fail_execution(self, session: Session, team_execution_id: int, error: str):
+        """Record a job that will not run again on its (not yet finished) execution."""
+        session.execute(
+            update(TeamExecution)
+            .where(
+                TeamExecution.id == team_execution_id,
+                TeamExecution.status.notin_([TeamStatus.COMPLETED.value, TeamStatus.FAILED.value])
+            )
+            .values(status=TeamStatus.FAILED.value, error_message=error, completed_at=datetime.utcnow())
+        )
+
+    def _update_leased(self, job_id: int, worker_id: str, **values) -> bool:
+        with get_db() as session:
+            result = session.execute(
+                update(ExecutionJob)
+                .where(
+                    ExecutionJob.id == job_id,
+                    ExecutionJob.locked_by == worker_id,
+                    ExecutionJob.status == JobStatus.RUNNING.value
+                )
+                .values(**values)
+            )
+            session.commit()
+        return result.rowcount > 0
+
+
+# Global queue instance
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get global job queue instance."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -0,0 +1,185 @@
+"""Dependency-aware concurrent scheduling of crew tasks."""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+def resolve_role_dependencies(roles: Sequence[Any]) -> List[List[int]]:
+    """
+    Resolve each role's upstream tasks from Role.agent_config.
+
+    - {"depends_on": [...]}: explicit upstream roles, by role id or title
+    - {"independent": true}: no upstream tasks
+    - otherwise: the previous role's task (classic sequential crew)
+
+    Args:
+        roles: Active roles in crew order (one task per role)
+
+    Returns:
+        Upstream task indexes per task
+
+    Raises:
+        ValueError: On unknown dependencies or dependency cycles
+    """
+    index_by_key: Dict[Any, int] = {}
+    for index, role in enumerate(roles):
+        index_by_key[role.id] = index
+        index_by_key.setdefault(role.title, index)
+
+    dependencies: List[List[int]] = []
+    for index, role in enumerate(roles):
+        config = role.agent_config or {}
+        if "depends_on" in config:
+            declared = config["depends_on"] or []
+            if isinstance(declared, str):
+                declared = [declared]  # A single upstream role title
+            elif not isinstance(declared, (list, tuple)):
+                raise ValueError(f"Role '{role.title}' depends_on must be a role title, id or a list of them")
+            upstream = []
+            for key in declared:
+                if key not in index_by_key:
+                    raise ValueError(f"Role '{role.title}' depends on unknown or inactive role '{key}'")
+                upstream.append(index_by_key[key])
+            dependencies.append(sorted(set(upstream)))
+        elif config.get("independent", False) or index == 0:
+            dependencies.append([])
+        else:
+            dependencies.append([index - 1])
+
+    topological_order(dependencies)  # Validates there is no cycle
+    return dependencies
+
+
+def normalize_dependencies(declared: Sequence[Any]) -> List[List[int]]:
+    """
+    Fill in undeclared dependencies (None) with the previous task.
+
+    Args:
+        declared: Per task, a list of upstream task indexes or None
+
+    Returns:
+        Upstream task indexes per task
+
+    Raises:
+        ValueError: If a declaration is not a list or tuple
+    """
+    normalized = []
+    for index, upstream in enumerate(declared):
+        if upstream is None:
+            normalized.append([index - 1] if index else [])
+        elif isinstance(upstream, (list, tuple)):
+            normalized.append(list(upstream))
+        else:
+            raise ValueError(f"Task {index} depends_on must be a list of task indexes, got {upstream!r}")
+    return normalized
+
+
+def topological_order(dependencies: List[List[int]]) -> List[int]:
+    """
+    Order tasks so every task comes after its upstream tasks.
+
+    Ties keep crew order, so a purely sequential crew stays in role order.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    remaining = [set(upstream) for upstream in dependencies]
+    order: List[int] = []
+    ready = [index for index, upstream in enumerate(remaining) if not upstream]
+
+    while ready:
+        index = ready.pop(0)
+        order.append(index)
+        for downstream, upstream in enumerate(remaining):
+            if index in upstream:
+                upstream.discard(index)
+                if not upstream:
+                    ready.append(downstream)
+        ready.sort()
+
+    if len(order) != len(dependencies):
+        cyclic = sorted(set(range(len(dependencies))) - set(order))
+        raise ValueError(f"Task dependency cycle between tasks {cyclic}")
+    return order
+
+
+def run_dag(
+    dependencies: List[List[int]],
+    run_task: Callable[[int, Dict[int, T]], T],
+    max_concurrency: int = 1
+) -> Dict[int, T]:
+    """
+    Run tasks as soon as their upstream tasks have finished.
+
+    Args:
+        dependencies: Upstream task indexes per task
+        run_task: Executes one task given its index and its upstream results
+        max_concurrency: Maximum number of tasks in flight at once
+
+    Returns:
+        Results keyed by task index (tasks downstream of a failure are absent)
+
+    Raises:
+        The first exception raised by any task, after all runnable tasks finished
+    """
+    order = topological_order(dependencies)
+    results: Dict[int, T] = {}
+    errors: List[Exception] = []
+    failed = set()
+
+    def blocked(index: int) -> bool:
+        return any(upstream in failed for upstream in dependencies[index])
+
+    def upstream_results(index: int) -> Dict[int, T]:
+        return {upstream: results[upstream] for upstream in dependencies[index]}
+
+    workers = max(1, min(max_concurrency, len(order)))
+    if workers == 1:
+        for index in order:
+            if blocked(index):
+                failed.add(index)
+                continue
+            try:
+                results[index] = run_task(index, upstream_results(index))
+            except Exception as e:
+                failed.add(index)
+                errors.append(e)
+    else:
+        logger.info("Running crew tasks by dependency graph", tasks=len(order), max_concurrency=workers)
+        pending = list(order)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crew-task") as pool:
+            running = {}
+            while pending or running:
+                # Start every task whose upstream work is done, in crew order
+                for index in list(pending):
+                    if len(running) >= workers:
+                        break
+                    if blocked(index):
+                        pending.remove(index)
+                        failed.add(index)
+                    elif all(upstream in results for upstream in dependencies[index]):
+                        pending.remove(index)
+                        running[pool.submit(run_task, index, upstream_results(index))] = index
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        failed.add(index)
+                        errors.append(e)
+
+    if errors:
+        raise errors[0]
+    return results
+
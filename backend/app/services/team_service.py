@@ -5,8 +5,10 @@ from decimal import Decimal
 from datetime import datetime
 from sqlalchemy.orm import Session, selectinload
 
-from ..models import Team, Role, TeamStatus, ExpertiseLevel
-from ..core.database import SessionLocal
+from ..models import Team, Role, TeamExecution, TeamStatus, ExpertiseLevel
+from ..core.database import SessionLocal, get_db
+from .crew_blueprints import get_blueprint_cache
+from .job_queue import get_job_queue
 # from .hybrid_crew_extensions import create_hybrid_crew_from_team  # Temporarily disabled
 import structlog
 
@@ -141,6 +143,7 @@ class TeamService:
             team.updated_at = datetime.utcnow()
             db.commit()
             db.refresh(team)
+            get_blueprint_cache().invalidate(team.id)
             
             logger.info(f"Team updated successfully: {team.name}", team_id=team.id)
             return team
@@ -162,6 +165,7 @@ class TeamService:
             team_name = team.name
             db.delete(team)
             db.commit()
+            get_blueprint_cache().invalidate(team_id)
             
             logger.info(f"Team deleted successfully: {team_name}", team_id=team_id)
             return True
@@ -255,6 +259,128 @@ class TeamService:
             with SessionLocal() as db:
                 return _execute_team_internal(db)
     
+    @staticmethod
+    def enqueue_execution(
+        team_id: int,
+        inputs: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None
+    ) -> Optional[TeamExecution]:
+        """
+        Queue a team execution for a background worker
+        
+        The execution record and its job are committed together, so a job
+        never exists without its execution (or the other way round).
+        
+        Returns:
+            The queued TeamExecution, or None if the team does not exist
+        """
+        def _enqueue_execution_internal(db: Session) -> Optional[TeamExecution]:
+            team = db.query(Team).filter(Team.id == team_id).first()
+            if not team:
+                return None
+            
+            execution = TeamExecution(
+                team_id=team.id,
+                space_id=team.space_id,
+                status=TeamStatus.QUEUED.value,
+                execution_metadata=inputs or {},
+                started_at=datetime.utcnow()
+            )
+            db.add(execution)
+            db.flush()
+            get_job_queue().enqueue(db, execution.id)
+            db.commit()
+            
+            logger.info(f"Team execution queued: {team.name}",
+                       team_id=team_id,
+                       execution_id=execution.id)
+            return execution
+        
+        if session:
+            return _enqueue_execution_internal(session)
+        else:
+            with SessionLocal() as db:
+                return _enqueue_execution_internal(db)
+    
+    @staticmethod
+    def run_execution(execution_id: int) -> Dict[str, Any]:
+        """
+        Run a queued execution on the calling (worker) thread
+        
+        Tasks completed by an earlier attempt are reused from their
+        checkpoints, so a job retried after a worker crash continues where
+        it stopped.
+        """
+        with get_db() as db:
+            execution = db.get(TeamExecution, execution_id)
+            if not execution:
+                raise ValueError(f"Team execution {execution_id} not found")
+            inputs = execution.execution_metadata or {}
+            team = TeamService.get_team_with_roles(execution.team_id, db)
+            db.expunge_all()
+        
+        # Imported lazily: the hybrid crew pulls in CrewAI and the LLM SDKs
+        from .hybrid_crew_extensions import create_hybrid_crew_from_team
+        
+        crew = create_hybrid_crew_from_team(team)
+        crew.team_execution_id = execution_id
+        
+        logger.info(f"Running team execution: {team.name}",
+                   team_id=team.id,
+                   execution_id=execution_id)
+        
+        return crew.execute_with_tracking(inputs)
+    
+    @staticmethod
+    def resume_execution(
+        team_id: int,
+        execution_id: int,
+        session: Optional[Session] = None
+    ) -> Optional[TeamExecution]:
+        """
+        Queue a failed team execution to resume from its task checkpoints
+        
+        Completed tasks are not executed again; the crew continues from the
+        first incomplete task with the execution's original inputs.
+        
+        Returns:
+            The queued TeamExecution, or None if the execution does not exist
+            
+        Raises:
+            ValueError: If the execution is not in a resumable state
+        """
+        def _resume_execution_internal(db: Session) -> Optional[TeamExecution]:
+            execution = db.query(TeamExecution).filter(
+                TeamExecution.id == execution_id,
+                TeamExecution.team_id == team_id
+            ).first()
+            if not execution:
+                return None
+            
+            # Claim the execution atomically so concurrent resumes can't both queue it
+            claimed = db.query(TeamExecution).filter(
+                TeamExecution.id == execution_id,
+                TeamExecution.status == TeamStatus.FAILED.value
+            ).update({"status": TeamStatus.QUEUED.value}, synchronize_session=False)
+            if not claimed:
+                db.rollback()
+                raise ValueError(f"Execution {execution_id} is {execution.status}, only failed executions can be resumed")
+            
+            get_job_queue().enqueue(db, execution_id)
+            db.commit()
+            db.refresh(execution)
+            
+            logger.info("Team execution queued for resume",
+                       team_id=team_id,
+                       execution_id=execution_id)
+            return execution
+        
+        if session:
+            return _resume_execution_internal(session)
+        else:
+            with SessionLocal() as db:
+                return _resume_execution_internal(db)
+    
     @staticmethod
     def get_team_status(team_id: int, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
         """Get current team execution status"""
@@ -0,0 +1,121 @@
+"""Background worker that drains the team execution queue.
+
+Run one or more worker processes next to the API:
+
+    python -m app.worker
+
+Each process runs JOB_WORKER_CONCURRENCY jobs at once. Workers scale
+independently of the API; the queue hands every job to exactly one of them.
+"""
+import logging
+import os
+import signal
+import socket
+import threading
+from typing import Optional
+
+from .core.config import get_settings
+from .core.database import init_database
+from .models import ExecutionJob
+from .services.job_queue import get_job_queue
+from .services.team_service import TeamService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class ExecutionWorker:
+    """Polls the job queue and runs claimed executions with heartbeats"""
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self.concurrency = max(1, concurrency or settings.job_worker_concurrency)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.queue = get_job_queue()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        """Run worker threads until stop() is called (SIGTERM / SIGINT)"""
+        logger.info(f"👷 Worker {self.worker_id} started with {self.concurrency} slot(s)")
+        threads = [
+            threading.Thread(target=self._poll, args=(f"{self.worker_id}-{slot}",), name=f"job-worker-{slot}")
+            for slot in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.info(f"👷 Worker {self.worker_id} stopped")
+
+    def stop(self, *_):
+        """Stop claiming new jobs; jobs already running are finished first"""
+        logger.info(f"👷 Worker {self.worker_id} shutting down after in-flight jobs")
+        self._stop_event.set()
+
+    def _poll(self, slot_id: str):
+        while not self._stop_event.is_set():
+            try:
+                job = self.queue.claim(slot_id)
+            except Exception as e:
+                logger.error(f"❌ Failed to poll job queue: {e}")
+                job = None
+
+            if job is None:
+                self._stop_event.wait(settings.job_poll_interval_seconds)
+                continue
+
+            self._run_job(job, slot_id)
+
+    def _run_job(self, job: ExecutionJob, slot_id: str):
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job.id, slot_id, done),
+            name=f"job-heartbeat-{job.id}",
+            daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            result = TeamService.run_execution(job.team_execution_id)
+            if not result.get("success"):
+                # The crew reports task failures instead of raising; retry them
+                raise RuntimeError(result.get("error") or "Team execution failed")
+            done.set()
+            self.queue.complete(job.id, slot_id)
+            logger.info(f"✅ Job {job.id} finished (execution {job.team_execution_id})")
+        except Exception as e:
+            done.set()
+            logger.error(f"❌ Job {job.id} failed: {e}")
+            try:
+                self.queue.fail(job, slot_id, str(e))
+            except Exception as queue_error:
+                # The lease expires and another worker picks the job up
+                logger.error(f"❌ Failed to record job {job.id} failure: {queue_error}")
+        finally:
+            heartbeat.join()
+
+    def _heartbeat(self, job_id: int, slot_id: str, done: threading.Event):
+        while not done.wait(settings.job_heartbeat_interval_seconds):
+            try:
+                if not self.queue.heartbeat(job_id, slot_id):
+                    logger.warning(f"⚠️ Lost lease on job {job_id}; another worker may rerun it")
+                    return
+            except Exception as e:
+                logger.warning(f"⚠️ Heartbeat for job {job_id} failed: {e}")
+
+
+def main():
+    if not init_database():
+        raise SystemExit("Database unavailable, worker cannot start")
+
+    worker = ExecutionWorker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Add execution_jobs table for the background execution queue
+
+Revision ID: 006_add_execution_jobs
+Revises: 005_populate_spaces
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_add_execution_jobs'
+down_revision = '005_populate_spaces'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create execution_jobs table
+    op.create_table('execution_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_execution_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('run_after', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['team_execution_id'], ['team_executions.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_execution_jobs_id'), 'execution_jobs', ['id'], unique=False)
+    
+    # Workers poll by status and due time
+    op.create_index(op.f('ix_execution_jobs_status_run_after'), 'execution_jobs', ['status', 'run_after'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_execution_jobs_status_run_after'), table_name='execution_jobs')
+    op.drop_index(op.f('ix_execution_jobs_id'), table_name='execution_jobs')
+    op.drop_table('execution_jobs')
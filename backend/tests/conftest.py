@@ -0,0 +1,67 @@
+"""Shared fixtures for the backend unit tests.
+
+Tests run offline: the fake LLM provider replaces real providers and the
+database is an in-memory SQLite copy of the schema.
+"""
+import os
+
+# Must be set before app modules read their settings
+os.environ.setdefault("FAKE_LLM_ENABLED", "true")
+os.environ.setdefault("FAKE_LLM_LATENCY_SECONDS", "0")
+os.environ.setdefault("FAKE_LLM_ERROR_RATE", "0")
+os.environ.setdefault("TOKEN_COUNTER_BACKEND", "heuristic")
+os.environ.setdefault("LLM_CACHE_BACKEND", "none")
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core import database
+from app.services import crew_blueprints
+from app.models import Base, ExpertiseLevel, Role, Team
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    """Fresh in-memory database, installed as the app's SessionLocal"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    # Blueprints are keyed on ids, which every fresh database reuses
+    monkeypatch.setattr(crew_blueprints, "_blueprint_cache", None)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def team(session_factory):
+    """Team with two active roles, the second depending on the first"""
+    with session_factory() as session:
+        team = Team(name="Research", monthly_budget=Decimal("10.00"), current_spend=Decimal("0.00"))
+        team.roles = [
+            Role(title="Researcher", expertise=ExpertiseLevel.SENIOR, llm_model="gpt-3.5-turbo", is_active=True),
+            Role(title="Writer", expertise=ExpertiseLevel.INTERMEDIATE, llm_model="gpt-3.5-turbo", is_active=True)
+        ]
+        session.add(team)
+        session.commit()
+        team_id = team.id
+
+    return team_id
+
+
+def load_team(session_factory, team_id: int) -> Team:
+    """Team with its roles loaded, detached from the session"""
+    from app.services.team_service import TeamService
+
+    with session_factory() as session:
+        team = TeamService.get_team_with_roles(team_id, session)
+        session.expunge_all()
+    return team
@@ -0,0 +1,46 @@
+"""Token-bounded task context."""
+import pytest
+
+from app.core.intelligent_router import IntelligentLLMRouter
+from app.services.context_manager import TaskContextManager
+
+LONG_TEXT = "\n".join(f"Finding {i}: revenue grew in region {i} after the pricing change" for i in range(200))
+
+
+@pytest.fixture
+def router():
+    return IntelligentLLMRouter()
+
+
+def test_short_text_is_kept(router):
+    manager = TaskContextManager(router, context_token_budget=500, inputs_token_budget=500)
+    assert manager._clip("Revenue grew", 500) == "Revenue grew"
+
+
+def test_clip_cuts_at_break_with_marker(router):
+    manager = TaskContextManager(router, context_token_budget=500, inputs_token_budget=500)
+
+    clipped = manager._clip(LONG_TEXT, 50)
+
+    assert router.count_tokens(clipped) <= 50
+    assert clipped.endswith(" …")
+    assert LONG_TEXT.startswith(clipped[:-2])
+
+
+@pytest.mark.parametrize("budget", [1, 2])
+def test_budget_below_marker_cost_terminates(router, budget):
+    manager = TaskContextManager(router, context_token_budget=500, inputs_token_budget=budget)
+
+    rendered = manager.render_inputs({"topic": "pricing strategy for the enterprise tier"})
+
+    assert router.count_tokens(rendered) <= budget
+    assert "topic: pricing strategy for the enterprise tier".startswith(rendered.removesuffix(" …"))
+
+
+def test_large_result_is_condensed_in_digest(router):
+    manager = TaskContextManager(router, context_token_budget=100, inputs_token_budget=100)
+
+    digest = manager.add_result("Task_1_Researcher", [], LONG_TEXT)
+
+    assert router.count_tokens(digest) <= 100
+    assert manager.context_for(["Task_1_Researcher"]) == digest
@@ -0,0 +1,69 @@
+"""Crew construction and execution bookkeeping against the database."""
+from decimal import Decimal
+
+import pytest
+
+from app.models import Team, TeamExecution, TeamStatus
+from app.services.crew_extensions import NuiFloAgent, NuiFloCrew, NuiFloTask, create_crew_from_team
+
+from .conftest import load_team
+
+
+@pytest.fixture
+def crew(session_factory, team):
+    return create_crew_from_team(load_team(session_factory, team))
+
+
+def test_factory_builds_crew_for_seeded_team(session_factory, team):
+    crew = create_crew_from_team(load_team(session_factory, team))
+
+    assert isinstance(crew, NuiFloCrew)
+    assert all(isinstance(agent, NuiFloAgent) for agent in crew.agents)
+    assert all(isinstance(task, NuiFloTask) for task in crew.tasks)
+    assert [agent.role_model.title for agent in crew.agents] == ["Researcher", "Writer"]
+    assert [task.task_name for task in crew.tasks] == ["Task_1_Researcher", "Task_2_Writer"]
+    assert crew.tasks[1].nuiflo_agent is crew.agents[1]
+    assert crew.team_model.name == "Research"
+
+
+def test_successful_run_syncs_detached_team(crew, session_factory, monkeypatch):
+    def fake_run(self, recorder, inputs=None):
+        self.agents[0].execution_metrics["tokens_used"] = 120
+        self.agents[0].execution_metrics["cost"] = Decimal("0.25")
+        return "final answer"
+
+    monkeypatch.setattr(NuiFloCrew, "_execute_crew_with_tracking", fake_run)
+
+    outcome = crew.execute_with_tracking({"topic": "pricing"})
+
+    # Reading the committed team after its session closed used to raise
+    # DetachedInstanceError and turn a finished run into a failure
+    assert outcome["success"], outcome["error"]
+    assert outcome["result"] == "final answer"
+    assert crew.team_model.current_spend == Decimal("0.25")
+    assert crew.team_model.status == TeamStatus.COMPLETED
+    assert crew.team_model.last_executed_at is not None
+
+    with session_factory() as session:
+        execution = session.get(TeamExecution, outcome["team_execution_id"])
+        assert execution.status == TeamStatus.COMPLETED.value
+        assert execution.tokens_used == 120
+        assert session.get(Team, crew.team_model.id).current_spend == Decimal("0.25")
+
+
+def test_failed_run_syncs_detached_team(crew, session_factory, monkeypatch):
+    def fake_run(self, recorder, inputs=None):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(NuiFloCrew, "_execute_crew_with_tracking", fake_run)
+
+    outcome = crew.execute_with_tracking()
+
+    assert not outcome["success"]
+    assert outcome["error"] == "provider down"
+    assert crew.team_model.status == TeamStatus.FAILED
+
+    with session_factory() as session:
+        execution = session.get(TeamExecution, outcome["team_execution_id"])
+        assert execution.status == TeamStatus.FAILED.value
+        assert execution.error_message == "provider down"
@@ -0,0 +1,49 @@
+"""Dry-run execution estimates from a real hybrid crew."""
+from app.models import Role, TaskExecution, TeamExecution, TeamStatus
+from app.services.execution_estimator import estimate_execution
+
+from .conftest import load_team
+
+
+def seed_history(session_factory, team_id, title, tokens, duration, samples=3):
+    with session_factory() as session:
+        role = session.query(Role).filter(Role.team_id == team_id, Role.title == title).one()
+        execution = TeamExecution(team_id=team_id, status=TeamStatus.COMPLETED.value)
+        session.add(execution)
+        session.flush()
+        for _ in range(samples):
+            session.add(TaskExecution(
+                team_execution_id=execution.id,
+                role_id=role.id,
+                task_name=f"history_{title}",
+                status=TeamStatus.COMPLETED.value,
+                tokens_used=tokens,
+                duration_seconds=duration
+            ))
+        session.commit()
+
+
+def test_estimate_routes_every_task_without_history(session_factory, team):
+    with session_factory() as session:
+        estimate = estimate_execution(load_team(session_factory, team), session, {"topic": "pricing"})
+
+    assert [task["task_name"] for task in estimate["tasks"]] == ["Task_1_Researcher", "Task_2_Writer"]
+    assert all(task["basis"] == "routing" for task in estimate["tasks"])
+    assert estimate["provider_mix"] == {"fake": 2}
+    assert estimate["tokens"]["expected"] > 0
+    assert estimate["budget"]["remaining"] == 10.0
+    assert estimate["budget"]["within_budget"]
+
+
+def test_estimate_uses_role_history(session_factory, team):
+    seed_history(session_factory, team, "Researcher", tokens=900, duration=12)
+
+    with session_factory() as session:
+        estimate = estimate_execution(load_team(session_factory, team), session)
+
+    researcher, writer = estimate["tasks"]
+    assert researcher["basis"] == "history"
+    assert researcher["history_samples"] == 3
+    assert researcher["tokens"]["expected"] == 900
+    assert researcher["latency_seconds"]["expected"] == 12.0
+    assert writer["basis"] == "routing"
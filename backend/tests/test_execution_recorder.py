@@ -0,0 +1,90 @@
+"""Write-behind batching of TaskExecution rows."""
+from contextlib import contextmanager
+
+import pytest
+
+from app.models import TaskExecution, TeamExecution, TeamStatus
+from app.services.execution_recorder import TaskExecutionRecorder
+
+
+@pytest.fixture
+def execution(session_factory, team):
+    with session_factory() as session:
+        execution = TeamExecution(team_id=team, status=TeamStatus.RUNNING.value)
+        session.add(execution)
+        session.commit()
+        role_id = execution.team.roles[0].id
+        return execution.id, role_id
+
+
+class FlakySessions:
+    """Session factory that fails until it is told to recover"""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.failing = True
+
+    @contextmanager
+    def __call__(self):
+        if self.failing:
+            raise ConnectionError("database unavailable")
+        with self.session_factory() as session:
+            yield session
+
+
+def rows(session_factory):
+    with session_factory() as session:
+        return {
+            row.task_name: (row.status, row.tokens_used)
+            for row in session.query(TaskExecution).all()
+        }
+
+
+def task_values(execution, name):
+    execution_id, role_id = execution
+    return dict(team_execution_id=execution_id, role_id=role_id, task_name=name,
+                status=TeamStatus.RUNNING.value)
+
+
+def test_rows_are_written_in_batches(session_factory, execution):
+    with TaskExecutionRecorder(batch_size=2, flush_interval_seconds=60) as recorder:
+        first = recorder.record(**task_values(execution, "first"))
+        assert first.id is None and rows(session_factory) == {}
+
+        recorder.record(**task_values(execution, "second"))
+        assert first.id is not None
+        assert set(rows(session_factory)) == {"first", "second"}
+
+        recorder.update(first, status=TeamStatus.COMPLETED.value, tokens_used=42)
+
+    assert rows(session_factory)["first"] == (TeamStatus.COMPLETED.value, 42)
+
+
+def test_update_before_write_folds_into_insert(session_factory, execution):
+    with TaskExecutionRecorder(batch_size=10, flush_interval_seconds=60) as recorder:
+        handle = recorder.record(**task_values(execution, "first"))
+        recorder.update(handle, status=TeamStatus.FAILED.value)
+
+    assert rows(session_factory) == {"first": (TeamStatus.FAILED.value, 0)}
+
+
+def test_threshold_flush_failure_does_not_raise(session_factory, execution):
+    sessions = FlakySessions(session_factory)
+    recorder = TaskExecutionRecorder(batch_size=1, flush_interval_seconds=60, session_factory=sessions)
+
+    # A task that finished must not fail because its row could not be written yet
+    recorder.record(**task_values(execution, "first"))
+    recorder.record(**task_values(execution, "second"))
+
+    sessions.failing = False
+    recorder.close()
+    assert set(rows(session_factory)) == {"first", "second"}
+
+
+def test_close_raises_when_rows_cannot_be_written(session_factory, execution):
+    sessions = FlakySessions(session_factory)
+    recorder = TaskExecutionRecorder(batch_size=1, flush_interval_seconds=60, session_factory=sessions)
+    recorder.record(**task_values(execution, "first"))
+
+    with pytest.raises(ConnectionError):
+        recorder.close()
@@ -0,0 +1,234 @@
+"""Hybrid crew construction, budget cutoff and resume against the database."""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.intelligent_router import ComplexityLevel, ExecutionResult, LLMProvider, RoutingDecision
+from app.models import ExpertiseLevel, Role, TaskExecution, Team, TeamExecution, TeamStatus
+from app.services.hybrid_crew_extensions import (
+    HybridNuiFloAgent,
+    HybridNuiFloCrew,
+    HybridNuiFloTask,
+    create_hybrid_crew_from_team
+)
+from app.services.team_service import TeamService
+
+from .conftest import load_team
+
+TASK_COST = Decimal("0.60")
+
+
+@pytest.fixture
+def team_id(session_factory):
+    """Sequential three-role team"""
+    with session_factory() as session:
+        team = Team(name="Pipeline", monthly_budget=Decimal("10.00"), current_spend=Decimal("0.00"))
+        team.roles = [
+            Role(title=title, expertise=ExpertiseLevel.SENIOR, is_active=True)
+            for title in ("Researcher", "Analyst", "Writer")
+        ]
+        session.add(team)
+        session.commit()
+        return team.id
+
+
+@pytest.fixture
+def grants(monkeypatch):
+    """Agents skip the provider; every task costs TASK_COST, metered down to its grant"""
+    grants = {}
+
+    def execute_routed(self, task_prompt, context=None, complexity=None, max_cost=None):
+        grants.setdefault(self.role, []).append(max_cost)
+        decision = RoutingDecision(
+            provider=LLMProvider.FAKE,
+            model="fake-llm",
+            estimated_cost=TASK_COST,
+            reasoning="test",
+            complexity=ComplexityLevel.SIMPLE,
+            confidence=1.0
+        )
+        result = ExecutionResult(
+            content=f"{self.role} findings",
+            provider=LLMProvider.FAKE,
+            actual_tokens=100,
+            actual_cost=min(TASK_COST, max_cost),
+            duration_seconds=0.01,
+            success=True,
+            truncated=max_cost < TASK_COST
+        )
+        self._track_execution(decision, result)
+        return decision, result
+
+    monkeypatch.setattr(HybridNuiFloAgent, "execute_routed", execute_routed)
+    return grants
+
+
+def make_crew(session_factory, team_id, max_team_budget=None, team_execution_id=None):
+    crew = create_hybrid_crew_from_team(load_team(session_factory, team_id))
+    if max_team_budget is not None:
+        crew.max_team_budget = max_team_budget
+    crew.team_execution_id = team_execution_id
+    return crew
+
+
+def set_spend(session_factory, team_id, spend):
+    with session_factory() as session:
+        session.get(Team, team_id).current_spend = spend
+        session.commit()
+
+
+def task_rows(session_factory, execution_id):
+    with session_factory() as session:
+        return [
+            (row.task_name, row.status, row.error_message)
+            for row in session.query(TaskExecution)
+            .filter(TaskExecution.team_execution_id == execution_id)
+            .order_by(TaskExecution.id)
+        ]
+
+
+def test_factory_builds_crew_for_seeded_team(session_factory, team):
+    crew = create_hybrid_crew_from_team(load_team(session_factory, team))
+
+    assert isinstance(crew, HybridNuiFloCrew)
+    assert all(isinstance(agent, HybridNuiFloAgent) for agent in crew.agents)
+    assert all(isinstance(task, HybridNuiFloTask) for task in crew.tasks)
+    assert [agent.role_model.title for agent in crew.agents] == ["Researcher", "Writer"]
+    assert [task.task_name for task in crew.tasks] == ["Task_1_Researcher", "Task_2_Writer"]
+    assert crew.tasks[1].depends_on == [0]
+    assert crew.max_team_budget == Decimal("10.00")
+
+
+def test_factory_gives_each_run_fresh_state(session_factory, team):
+    team_model = load_team(session_factory, team)
+    first = create_hybrid_crew_from_team(team_model)
+    first.agents[0].execution_metrics["total_cost"] += Decimal("1.00")
+    first.tasks[0].execution_start = datetime.utcnow()
+
+    second = create_hybrid_crew_from_team(team_model)
+
+    assert second.agents[0] is not first.agents[0]
+    assert second.agents[0].execution_metrics["total_cost"] == 0
+    assert second.tasks[0].execution_start is None
+    assert second.tasks[0].agent is second.agents[0]
+
+
+def test_queued_execution_runs_to_completion(session_factory, team):
+    with session_factory() as session:
+        execution = TeamExecution(team_id=team, status=TeamStatus.QUEUED.value,
+                                  execution_metadata={"topic": "pricing"})
+        session.add(execution)
+        session.commit()
+        execution_id = execution.id
+
+    report = TeamService.run_execution(execution_id)
+
+    assert report["success"], report.get("error")
+    assert report["team_execution_id"] == execution_id
+    with session_factory() as session:
+        execution = session.get(TeamExecution, execution_id)
+        assert execution.status == TeamStatus.COMPLETED.value
+        assert execution.result
+        assert len(execution.task_executions) == 2
+
+
+def test_exhausted_budget_fails_task_and_execution(session_factory, team_id, grants):
+    crew = make_crew(session_factory, team_id, max_team_budget=Decimal("1.00"))
+
+    report = crew.execute_with_tracking()
+
+    assert not report["success"]
+    assert "exhausted before Task_3_Writer" in report["error"]
+    # The second task is metered down to what is left, the third never starts
+    assert grants == {"Researcher": [Decimal("1.00")], "Analyst": [Decimal("0.40")]}
+
+    rows = task_rows(session_factory, crew.team_execution_id)
+    assert [(name, status) for name, status, _ in rows] == [
+        ("Task_1_Researcher", TeamStatus.COMPLETED.value),
+        ("Task_2_Analyst", TeamStatus.COMPLETED.value),
+        ("Task_3_Writer", TeamStatus.FAILED.value)
+    ]
+    assert "exhausted" in rows[2][2]
+
+    with session_factory() as session:
+        execution = session.get(TeamExecution, crew.team_execution_id)
+        assert execution.status == TeamStatus.FAILED.value
+        assert execution.cost == Decimal("1.00")
+        assert session.get(Team, team_id).current_spend == Decimal("1.00")
+
+
+def test_exhausted_budget_blocks_dependents(session_factory, team_id, grants):
+    crew = make_crew(session_factory, team_id, max_team_budget=Decimal("0.50"))
+    crew.tasks[1].depends_on = []  # Analyst no longer waits on the Researcher
+
+    report = crew.execute_with_tracking()
+
+    assert not report["success"]
+    # The Analyst's grant is gone after the Researcher; the Writer is blocked
+    assert grants == {"Researcher": [Decimal("0.50")]}
+    names = [name for name, _, _ in task_rows(session_factory, crew.team_execution_id)]
+    assert names == ["Task_1_Researcher", "Task_2_Analyst"]
+
+
+def test_monthly_budget_caps_execution_budget(session_factory, team_id, grants):
+    set_spend(session_factory, team_id, Decimal("9.50"))
+    crew = make_crew(session_factory, team_id)
+
+    report = crew.execute_with_tracking()
+
+    assert not report["success"]
+    assert crew.max_team_budget == Decimal("0.50")
+    assert grants["Researcher"] == [Decimal("0.50")]
+    with session_factory() as session:
+        assert session.get(Team, team_id).current_spend == Decimal("10.00")
+
+
+def test_resume_skips_completed_tasks(session_factory, team_id, grants):
+    first = make_crew(session_factory, team_id, max_team_budget=Decimal("1.00"))
+    first.execute_with_tracking()
+    grants.clear()
+
+    resumed = make_crew(session_factory, team_id, Decimal("2.00"), first.team_execution_id)
+    report = resumed.execute_with_tracking()
+
+    assert report["success"], report.get("error")
+    assert report["metrics"]["resumed_tasks"] == 2
+    # Checkpointed spend counts against the execution budget
+    assert grants == {"Writer": [Decimal("1.00")]}
+    assert report["metrics"]["total_cost"] == pytest.approx(1.60)
+
+    with session_factory() as session:
+        execution = session.get(TeamExecution, first.team_execution_id)
+        assert execution.status == TeamStatus.COMPLETED.value
+        assert execution.cost == Decimal("1.60")
+        # Only the new task is charged again
+        assert session.get(Team, team_id).current_spend == Decimal("1.60")
+
+
+def test_resume_matches_checkpoints_by_role(session_factory, team_id, grants):
+    first = make_crew(session_factory, team_id, max_team_budget=Decimal("1.00"))
+    first.execute_with_tracking()
+    grants.clear()
+
+    # Between the runs the Researcher is deactivated and an Editor added,
+    # so every task's position (and positional name) changes
+    with session_factory() as session:
+        team = session.get(Team, team_id)
+        researcher = next(role for role in team.roles if role.title == "Researcher")
+        researcher.is_active = False
+        team.roles.append(Role(title="Editor", expertise=ExpertiseLevel.SENIOR, is_active=True))
+        session.commit()
+
+    team_model = load_team(session_factory, team_id)
+    team_model.roles = [role for role in team_model.roles if role.is_active]
+    resumed = create_hybrid_crew_from_team(team_model)
+    resumed.team_execution_id = first.team_execution_id
+    report = resumed.execute_with_tracking()
+
+    assert report["success"], report.get("error")
+    # The Analyst's output is reused; the Researcher's is dropped with its role
+    assert report["metrics"]["resumed_tasks"] == 1
+    assert sorted(grants) == ["Editor", "Writer"]
+    assert "Analyst findings" in report["result"]
+    assert "Researcher findings" not in report["result"]
@@ -0,0 +1,147 @@
+"""Complexity analysis, metered budget cutoff and stream bookkeeping of the router."""
+import threading
+from decimal import Decimal
+
+import pytest
+
+from app.core import intelligent_router
+from app.core.intelligent_router import ComplexityAnalyzer, ComplexityLevel, IntelligentLLMRouter, LLMProvider
+from app.core.provider_health import CircuitState
+
+PROMPT = "Summarize the quarterly report"
+PRICE = Decimal("0.01")
+
+
+@pytest.fixture
+def router():
+    """Router on the fake provider, priced so that spend can be metered"""
+    router = IntelligentLLMRouter()
+    router.pricing[LLMProvider.FAKE] = PRICE
+    return router
+
+
+@pytest.fixture
+def decision(router):
+    return router._create_fake_option(ComplexityLevel.SIMPLE, 100)
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Analyzer whose LLM analysis blocks until released"""
+    monkeypatch.setattr(intelligent_router.settings, "complexity_analysis_deadline_seconds", 0.01)
+    monkeypatch.setattr(intelligent_router.settings, "complexity_analysis_max_pending", 2)
+    analyzer = ComplexityAnalyzer()
+    analyzer.release = threading.Event()
+    analyzer.calls = []
+
+    def slow_analysis(prompt, context=None):
+        analyzer.calls.append(prompt)
+        analyzer.release.wait(5)
+        return 0.7
+
+    monkeypatch.setattr(analyzer, "_llm_complexity_analysis", slow_analysis)
+    yield analyzer
+    analyzer.release.set()
+    analyzer._analysis_executor.shutdown(wait=True)
+
+
+def test_analysis_payload_disables_streaming():
+    # Ollama streams NDJSON by default, which response.json() cannot parse
+    payload = ComplexityAnalyzer._build_analysis_payload("Sort a list", "Python")
+    assert payload["stream"] is False
+    assert "Task: Sort a list" in payload["prompt"]
+
+
+def test_batch_analysis_payload_disables_streaming():
+    payload = ComplexityAnalyzer._build_batch_analysis_payload([("Sort a list", None), ("Prove it", None)])
+    assert payload["stream"] is False
+
+
+def test_slow_analysis_is_not_submitted_twice(analyzer):
+    assert analyzer._get_llm_score("Design a cache") is None
+    assert analyzer._get_llm_score("Design a cache") is None
+
+    analyzer.release.set()
+    analyzer._analysis_executor.shutdown(wait=True)
+    assert analyzer.calls == ["Design a cache"]
+
+    # The late answer is memoized for the next decision
+    assert analyzer._get_llm_score("Design a cache") == 0.7
+    assert analyzer._analyses_pending == 0
+
+
+def test_analysis_backlog_is_capped(analyzer):
+    for prompt in ("Design a cache", "Prove a theorem", "Analyze a market"):
+        assert analyzer._get_llm_score(prompt) is None
+
+    analyzer.release.set()
+    analyzer._analysis_executor.shutdown(wait=True)
+    assert sorted(analyzer.calls) == ["Design a cache", "Prove a theorem"]
+    assert analyzer._analyses_pending == 0
+    assert not analyzer._analyses_in_flight
+
+
+def test_unlimited_stream_is_not_truncated(router, decision):
+    chunks = list(router.stream_request(decision, PROMPT))
+
+    final = chunks[-1]
+    assert final.done and not final.truncated and final.error is None
+    assert final.cost == final.tokens * PRICE / 1000
+
+
+def test_stream_stops_at_max_cost(router, decision):
+    max_cost = Decimal("0.0005")
+    unlimited = list(router.stream_request(decision, PROMPT))[-1]
+
+    chunks = list(router.stream_request(decision, PROMPT, max_cost=max_cost))
+
+    final = chunks[-1]
+    assert final.done and final.truncated and final.error is None
+    assert final.cost < unlimited.cost
+    # Generation stops at the first chunk that crosses the limit
+    chunk_cost = router.fake_llm.stream_chunk_tokens * PRICE / 1000
+    assert max_cost <= final.cost <= max_cost + chunk_cost
+    assert final.cost == chunks[-2].cost
+
+
+def test_budget_below_prompt_cost_makes_no_call(router, decision):
+    chunks = list(router.stream_request(decision, PROMPT, max_cost=Decimal("0.000001")))
+
+    assert len(chunks) == 1
+    assert chunks[0].done and chunks[0].truncated
+    assert chunks[0].cost == 0
+    assert "does not cover the prompt" in chunks[0].error
+
+
+def test_execute_metered_returns_partial_result(router, decision):
+    max_cost = Decimal("0.0005")
+    result = router.execute_metered(decision, PROMPT, max_cost)
+
+    assert result.success and result.truncated
+    assert result.content
+    assert result.actual_cost >= max_cost
+    assert result.attempts[0]["truncated"]
+
+
+def test_execute_metered_without_limit_runs_in_full(router, decision):
+    result = router.execute_metered(decision, PROMPT, None)
+
+    assert result.success and not result.truncated
+    assert result.actual_tokens > router.fake_llm.output_tokens
+
+
+def test_abandoned_stream_releases_probe(router, decision):
+    tracker = router.health_tracker
+    for _ in range(tracker.failure_threshold):
+        tracker.record_failure("fake", 0.1)
+    tracker._health["fake"].opened_at -= tracker.reset_timeout_seconds
+
+    stream = router.stream_request(decision, PROMPT)
+    next(stream)
+    assert tracker._health["fake"].state == CircuitState.HALF_OPEN
+    assert tracker._health["fake"].probe_in_flight
+
+    # The caller stops reading: the probe slot must not stay claimed
+    stream.close()
+    assert not tracker._health["fake"].probe_in_flight
+    assert tracker.allow_request("fake")
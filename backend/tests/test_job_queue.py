@@ -0,0 +1,149 @@
+"""Lease, heartbeat and retry state machine of the execution job queue."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import ExecutionJob, JobStatus, TeamExecution, TeamStatus
+from app.services.job_queue import JobQueue
+
+
+@pytest.fixture
+def queue(session_factory):
+    return JobQueue(visibility_timeout_seconds=60, max_attempts=2, retry_delay_seconds=10)
+
+
+@pytest.fixture
+def execution_id(session_factory, team):
+    with session_factory() as session:
+        execution = TeamExecution(team_id=team, status=TeamStatus.QUEUED.value)
+        session.add(execution)
+        session.commit()
+        return execution.id
+
+
+def enqueue(queue: JobQueue, session_factory, execution_id: int) -> int:
+    with session_factory() as session:
+        job = queue.enqueue(session, execution_id)
+        session.commit()
+        return job.id
+
+
+def load_job(session_factory, job_id: int) -> ExecutionJob:
+    with session_factory() as session:
+        return session.get(ExecutionJob, job_id)
+
+
+def execution_status(session_factory, execution_id: int) -> str:
+    with session_factory() as session:
+        return session.get(TeamExecution, execution_id).status
+
+
+def expire_lease(session_factory, job_id: int, seconds: float = 120):
+    with session_factory() as session:
+        job = session.get(ExecutionJob, job_id)
+        job.heartbeat_at = datetime.utcnow() - timedelta(seconds=seconds)
+        session.commit()
+
+
+def make_due(session_factory, job_id: int):
+    with session_factory() as session:
+        job = session.get(ExecutionJob, job_id)
+        job.run_after = datetime.utcnow() - timedelta(seconds=1)
+        session.commit()
+
+
+def test_claim_leases_job_to_one_worker(queue, session_factory, execution_id):
+    job_id = enqueue(queue, session_factory, execution_id)
+
+    job = queue.claim("worker-a")
+    assert job.id == job_id
+    assert job.status == JobStatus.RUNNING.value
+    assert job.attempts == 1
+    assert job.locked_by == "worker-a"
+
+    assert queue.claim("worker-b") is None
+
+
+def test_empty_queue_claims_nothing(queue, session_factory):
+    assert queue.claim("worker-a") is None
+
+
+def test_heartbeat_and_complete_require_the_lease(queue, session_factory, execution_id):
+    job_id = enqueue(queue, session_factory, execution_id)
+    queue.claim("worker-a")
+
+    assert queue.heartbeat(job_id, "worker-a")
+    assert not queue.heartbeat(job_id, "worker-b")
+    assert not queue.complete(job_id, "worker-b")
+
+    assert queue.complete(job_id, "worker-a")
+    job = load_job(session_factory, job_id)
+    assert job.status == JobStatus.COMPLETED.value
+    assert job.locked_by is None
+    assert not queue.heartbeat(job_id, "worker-a")
+
+
+def test_failure_is_retried_with_backoff(queue, session_factory, execution_id):
+    job_id = enqueue(queue, session_factory, execution_id)
+    job = queue.claim("worker-a")
+
+    before = datetime.utcnow()
+    assert queue.fail(job, "worker-a", "boom")
+
+    retried = load_job(session_factory, job_id)
+    assert retried.status == JobStatus.QUEUED.value
+    assert retried.last_error == "boom"
+    assert retried.locked_by is None
+    assert retried.run_after >= before + timedelta(seconds=10)
+
+    # Not due until the backoff has passed
+    assert queue.claim("worker-a") is None
+    make_due(session_factory, job_id)
+    assert queue.claim("worker-a").attempts == 2
+
+
+def test_last_attempt_fails_job_and_execution(queue, session_factory, execution_id):
+    job_id = enqueue(queue, session_factory, execution_id)
+    queue.fail(queue.claim("worker-a"), "worker-a", "first")
+    make_due(session_factory, job_id)
+
+    assert queue.fail(queue.claim("worker-a"), "worker-a", "second")
+
+    job = load_job(session_factory, job_id)
+    assert job.status == JobStatus.FAILED.value
+    assert job.last_error == "second"
+    assert job.completed_at is not None
+    assert execution_status(session_factory, execution_id) == TeamStatus.FAILED.value
+
+
+def test_expired_lease_is_reclaimed(queue, session_factory, execution_id):
+    job_id = enqueue(queue, session_factory, execution_id)
+    queue.claim("worker-a")
+
+    # A live lease is not stolen
+    assert queue.claim("worker-b") is None
+
+    expire_lease(session_factory, job_id)
+    job = queue.claim("worker-b")
+    assert job.id == job_id
+    assert job.locked_by == "worker-b"
+    assert job.attempts == 2
+
+    # The crashed worker has lost the lease
+    assert not queue.heartbeat(job_id, "worker-a")
+    assert not queue.complete(job_id, "worker-a")
+
+
+def test_expired_lease_on_last_attempt_fails_job(queue, session_factory, execution_id):
+    job_id = enqueue(queue, session_factory, execution_id)
+    queue.claim("worker-a")
+    expire_lease(session_factory, job_id)
+    queue.claim("worker-b")
+    expire_lease(session_factory, job_id)
+
+    assert queue.claim("worker-c") is None
+
+    job = load_job(session_factory, job_id)
+    assert job.status == JobStatus.FAILED.value
+    assert "worker-b" in job.last_error
+    assert execution_status(session_factory, execution_id) == TeamStatus.FAILED.value
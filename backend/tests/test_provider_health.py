@@ -0,0 +1,127 @@
+"""Circuit breaker state machine of ProviderHealthTracker."""
+import pytest
+
+from app.core import provider_health
+from app.core.provider_health import CircuitState, ProviderHealthTracker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for cool-down timing"""
+    now = [1000.0]
+    monkeypatch.setattr(provider_health.time, "monotonic", lambda: now[0])
+    return now
+
+
+def open_circuit(tracker: ProviderHealthTracker, key: str = "openai"):
+    for _ in range(tracker.failure_threshold):
+        tracker.record_failure(key, 0.1)
+
+
+def state(tracker: ProviderHealthTracker, key: str = "openai") -> CircuitState:
+    return tracker._health[key].state
+
+
+def test_unknown_provider_is_allowed():
+    tracker = ProviderHealthTracker()
+    assert tracker.is_available("openai")
+    assert tracker.allow_request("openai")
+
+
+def test_consecutive_failures_open_circuit(clock):
+    tracker = ProviderHealthTracker(failure_threshold=3)
+    tracker.record_failure("openai", 0.1)
+    tracker.record_failure("openai", 0.1)
+    assert state(tracker) == CircuitState.CLOSED
+
+    tracker.record_failure("openai", 0.1)
+    assert state(tracker) == CircuitState.OPEN
+    assert not tracker.is_available("openai")
+    assert not tracker.allow_request("openai")
+
+
+def test_success_resets_consecutive_failures(clock):
+    tracker = ProviderHealthTracker(failure_threshold=3, min_requests=100)
+    for _ in range(5):
+        tracker.record_failure("openai", 0.1)
+        tracker.record_success("openai", 0.1)
+    assert state(tracker) == CircuitState.CLOSED
+
+
+def test_error_rate_opens_circuit_after_min_requests(clock):
+    tracker = ProviderHealthTracker(failure_threshold=100, error_rate_threshold=0.5, min_requests=4, ewma_alpha=0.5)
+    tracker.record_success("openai", 0.1)
+    tracker.record_failure("openai", 0.1)
+    tracker.record_failure("openai", 0.1)
+    assert state(tracker) == CircuitState.CLOSED
+
+    tracker.record_failure("openai", 0.1)
+    assert state(tracker) == CircuitState.OPEN
+
+
+def test_cool_down_allows_single_probe(clock):
+    tracker = ProviderHealthTracker(failure_threshold=1, reset_timeout_seconds=30)
+    open_circuit(tracker)
+
+    clock[0] += 29
+    assert not tracker.allow_request("openai")
+
+    clock[0] += 1
+    assert tracker.is_available("openai")
+    assert tracker.allow_request("openai")
+    assert state(tracker) == CircuitState.HALF_OPEN
+
+    # The probe slot is taken until the probe reports back
+    assert not tracker.is_available("openai")
+    assert not tracker.allow_request("openai")
+
+
+def test_successful_probe_closes_circuit(clock):
+    tracker = ProviderHealthTracker(failure_threshold=1, reset_timeout_seconds=30)
+    open_circuit(tracker)
+    clock[0] += 30
+    assert tracker.allow_request("openai")
+
+    tracker.record_success("openai", 0.1)
+    assert state(tracker) == CircuitState.CLOSED
+    assert tracker.allow_request("openai")
+    assert tracker.allow_request("openai")
+
+
+def test_failed_probe_reopens_circuit(clock):
+    tracker = ProviderHealthTracker(failure_threshold=5, reset_timeout_seconds=30)
+    open_circuit(tracker)
+    clock[0] += 30
+    assert tracker.allow_request("openai")
+
+    tracker.record_failure("openai", 0.1)
+    assert state(tracker) == CircuitState.OPEN
+    assert not tracker.allow_request("openai")
+
+    clock[0] += 30
+    assert tracker.allow_request("openai")
+
+
+def test_released_probe_can_be_claimed_again(clock):
+    tracker = ProviderHealthTracker(failure_threshold=1, reset_timeout_seconds=30)
+    open_circuit(tracker)
+    clock[0] += 30
+    assert tracker.allow_request("openai")
+    assert not tracker.allow_request("openai")
+
+    # An abandoned call must not wedge the circuit half-open
+    tracker.release_probe("openai")
+    assert state(tracker) == CircuitState.HALF_OPEN
+    assert tracker.allow_request("openai")
+
+
+def test_snapshot_reports_state(clock):
+    tracker = ProviderHealthTracker(failure_threshold=2)
+    tracker.record_success("openai", 0.5)
+    open_circuit(tracker, "anthropic")
+
+    snapshot = tracker.snapshot()
+    assert snapshot["openai"]["state"] == "closed"
+    assert snapshot["openai"]["total_requests"] == 1
+    assert snapshot["anthropic"]["state"] == "open"
+    assert snapshot["anthropic"]["total_failures"] == 2
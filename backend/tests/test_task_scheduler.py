@@ -0,0 +1,92 @@
+"""Dependency resolution and DAG execution of crew tasks."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.task_scheduler import (
+    normalize_dependencies,
+    resolve_role_dependencies,
+    run_dag,
+    topological_order
+)
+
+
+def role(role_id, title, **agent_config):
+    return SimpleNamespace(id=role_id, title=title, agent_config=agent_config or None)
+
+
+def test_roles_default_to_sequential():
+    roles = [role(1, "Researcher"), role(2, "Writer"), role(3, "Editor")]
+    assert resolve_role_dependencies(roles) == [[], [0], [1]]
+
+
+def test_roles_resolve_declared_and_independent():
+    roles = [
+        role(1, "Researcher"),
+        role(2, "Analyst", independent=True),
+        role(3, "Writer", depends_on=["Researcher", 2])
+    ]
+    assert resolve_role_dependencies(roles) == [[], [], [0, 1]]
+
+
+def test_single_depends_on_title_is_one_role():
+    # A bare string must not be read as a sequence of one-letter titles
+    roles = [role(1, "Researcher"), role(2, "Writer", depends_on="Researcher")]
+    assert resolve_role_dependencies(roles) == [[], [0]]
+
+
+@pytest.mark.parametrize("declared", [1, {"Researcher": True}])
+def test_malformed_depends_on_is_rejected(declared):
+    roles = [role(1, "Researcher"), role(2, "Writer", depends_on=declared)]
+    with pytest.raises(ValueError, match="depends_on"):
+        resolve_role_dependencies(roles)
+
+
+def test_unknown_dependency_is_rejected():
+    roles = [role(1, "Researcher"), role(2, "Writer", depends_on=["Designer"])]
+    with pytest.raises(ValueError, match="Designer"):
+        resolve_role_dependencies(roles)
+
+
+def test_dependency_cycle_is_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order([[1], [0]])
+
+
+def test_normalize_fills_undeclared_with_previous_task():
+    assert normalize_dependencies([None, None, [0], ()]) == [[], [0], [0], []]
+
+
+def test_normalize_rejects_string():
+    with pytest.raises(ValueError, match="depends_on"):
+        normalize_dependencies([None, "0"])
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_run_dag_passes_upstream_results(max_concurrency):
+    dependencies = [[], [], [0, 1]]
+
+    results = run_dag(
+        dependencies,
+        lambda index, upstream: sum(upstream.values()) + index + 1,
+        max_concurrency=max_concurrency
+    )
+
+    assert results == {0: 1, 1: 2, 2: 6}
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_run_dag_blocks_dependents_of_failed_task(max_concurrency):
+    dependencies = [[], [0], [1], []]
+    ran = []
+
+    def run_task(index, upstream):
+        ran.append(index)
+        if index == 0:
+            raise RuntimeError("budget exhausted")
+        return index
+
+    with pytest.raises(RuntimeError, match="budget exhausted"):
+        run_dag(dependencies, run_task, max_concurrency=max_concurrency)
+
+    assert sorted(ran) == [0, 3]